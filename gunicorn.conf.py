@@ -0,0 +1,65 @@
+"""
+gunicorn 설정
+
+    gunicorn -c gunicorn.conf.py src.관리자페이지:app
+
+앱은 거의 모든 시간을 Supabase HTTP 호출을 기다리며 보내므로(I/O 대기),
+워커 프로세스 여러 개 x 워커당 스레드 여러 개(gthread)로 느린 요청 하나가 다른 사용자를 막지 않게 합니다.
+
+환경변수
+- WEB_CONCURRENCY: 워커 프로세스 수 (기본: CPU*2+1, 최대 4)
+- GUNICORN_THREADS: 워커당 스레드 수 (기본 8, gthread)
+- GUNICORN_WORKER_CLASS: gthread(기본) 또는 gevent (gevent 패키지 필요)
+- GUNICORN_WORKER_CONNECTIONS: gevent 워커당 동시 연결 수 (기본 100)
+- GUNICORN_TIMEOUT / GUNICORN_GRACEFUL_TIMEOUT / GUNICORN_KEEPALIVE
+- GUNICORN_MAX_REQUESTS / GUNICORN_MAX_REQUESTS_JITTER: 워커 주기적 재시작 (0이면 끔)
+- GUNICORN_PRELOAD: true 면 마스터에서 앱을 미리 로드 (Supabase 클라이언트는 post_fork 에서 워커별로 다시 생성)
+- GUNICORN_LOG_LEVEL: gunicorn 자체 로그 레벨 (기본 info, 앱 로그는 LOG_LEVEL)
+
+SUPABASE_POOL_SIZE(기본 20)는 워커당 연결 수이므로 GUNICORN_THREADS 이상으로 유지하세요.
+"""
+
+import os
+import sys
+import multiprocessing
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(BASE_DIR, 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name, '')
+    return int(value) if value.strip() else default
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+workers = _env_int('WEB_CONCURRENCY', min(multiprocessing.cpu_count() * 2 + 1, 4))
+threads = _env_int('GUNICORN_THREADS', 8)
+worker_connections = _env_int('GUNICORN_WORKER_CONNECTIONS', 100)
+
+timeout = _env_int('GUNICORN_TIMEOUT', 120)
+graceful_timeout = _env_int('GUNICORN_GRACEFUL_TIMEOUT', 30)
+keepalive = _env_int('GUNICORN_KEEPALIVE', 5)
+
+# 메모리 증가/누수 대비 주기적 재시작 (동시에 재시작하지 않도록 jitter)
+max_requests = _env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = _env_int('GUNICORN_MAX_REQUESTS_JITTER', 100)
+
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'false').lower() in ('1', 'true', 'yes', 'on')
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+def post_fork(server, worker):
+    """워커 프로세스마다 자신의 Supabase 클라이언트(연결 풀)를 생성합니다.
+
+    preload 시 마스터에서 만든 클라이언트의 소켓을 워커끼리 공유하지 않도록 fork 직후 새로 만듭니다.
+    """
+    import supabase_utils
+    if supabase_utils.init_supabase():
+        server.log.info("워커 %s: Supabase 클라이언트 초기화 (%s, threads=%s)", worker.pid, worker_class, threads)
+    else:
+        server.log.warning("워커 %s: Supabase 클라이언트 초기화 실패 - 첫 요청 시 다시 시도합니다.", worker.pid)
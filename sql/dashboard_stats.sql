@@ -0,0 +1,150 @@
+-- 대시보드 통계 집계 함수
+-- 대시보드가 목록 페이지를 모두 받아 화면에서 세던 상태별/팀별/직원별 개수, 좋아요 합계, 일별 신규 등록 수를
+-- DB 에서 집계합니다. 앱은 dashboard_stats() 하나만 RPC 로 호출해 한 번의 요청으로 모든 통계를 받습니다.
+-- (supabase_utils.get_dashboard_stats 참고, 적용 전에는 전체 개수만 표시)
+--
+-- 모든 함수는 목록 API 와 같은 조회 범위를 받습니다.
+--   p_scope = 'all'  : 전체 (관리자)
+--   p_scope = 'team' : p_value 팀 (employee_team)
+--   p_scope = 'own'  : p_value 직원 (employee_id)
+
+-- 📊 1단계: 상태별 개수 (고객 / 매물)
+CREATE OR REPLACE FUNCTION dashboard_status_counts(p_scope text DEFAULT 'all', p_value text DEFAULT NULL)
+RETURNS TABLE (entity text, status text, count bigint)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT 'customers', COALESCE(NULLIF(c.status, ''), '미지정'), count(*)
+    FROM employee_customers c
+    WHERE p_scope = 'all'
+       OR (p_scope = 'team' AND c.employee_team = p_value)
+       OR (p_scope = 'own' AND c.employee_id::text = p_value)
+    GROUP BY 2
+    UNION ALL
+    SELECT 'properties', COALESCE(NULLIF(p.status, ''), '미지정'), count(*)
+    FROM maeiple_properties p
+    WHERE p_scope = 'all'
+       OR (p_scope = 'team' AND p.employee_team = p_value)
+       OR (p_scope = 'own' AND p.employee_id::text = p_value)
+    GROUP BY 2
+$$;
+
+-- 👥 2단계: 팀별 개수
+CREATE OR REPLACE FUNCTION dashboard_team_counts(p_scope text DEFAULT 'all', p_value text DEFAULT NULL)
+RETURNS TABLE (team text, customers bigint, properties bigint)
+LANGUAGE sql
+STABLE
+AS $$
+    WITH c AS (
+        SELECT employee_team AS team, count(*) AS n
+        FROM employee_customers
+        WHERE p_scope = 'all'
+           OR (p_scope = 'team' AND employee_team = p_value)
+           OR (p_scope = 'own' AND employee_id::text = p_value)
+        GROUP BY 1
+    ), p AS (
+        SELECT employee_team AS team, count(*) AS n
+        FROM maeiple_properties
+        WHERE p_scope = 'all'
+           OR (p_scope = 'team' AND employee_team = p_value)
+           OR (p_scope = 'own' AND employee_id::text = p_value)
+        GROUP BY 1
+    )
+    SELECT COALESCE(c.team, p.team), COALESCE(c.n, 0), COALESCE(p.n, 0)
+    FROM c FULL JOIN p ON c.team IS NOT DISTINCT FROM p.team
+    ORDER BY 1
+$$;
+
+-- 🧑‍💼 3단계: 직원별 개수
+CREATE OR REPLACE FUNCTION dashboard_employee_counts(p_scope text DEFAULT 'all', p_value text DEFAULT NULL)
+RETURNS TABLE (employee_id text, team text, customers bigint, properties bigint)
+LANGUAGE sql
+STABLE
+AS $$
+    WITH c AS (
+        SELECT employee_id::text AS employee_id, max(employee_team) AS team, count(*) AS n
+        FROM employee_customers
+        WHERE p_scope = 'all'
+           OR (p_scope = 'team' AND employee_team = p_value)
+           OR (p_scope = 'own' AND employee_id::text = p_value)
+        GROUP BY 1
+    ), p AS (
+        SELECT employee_id::text AS employee_id, max(employee_team) AS team, count(*) AS n
+        FROM maeiple_properties
+        WHERE p_scope = 'all'
+           OR (p_scope = 'team' AND employee_team = p_value)
+           OR (p_scope = 'own' AND employee_id::text = p_value)
+        GROUP BY 1
+    )
+    SELECT COALESCE(c.employee_id, p.employee_id), COALESCE(c.team, p.team), COALESCE(c.n, 0), COALESCE(p.n, 0)
+    FROM c FULL JOIN p ON c.employee_id IS NOT DISTINCT FROM p.employee_id
+    ORDER BY 1
+$$;
+
+-- ❤️ 4단계: 매물 좋아요/싫어요 합계
+CREATE OR REPLACE FUNCTION dashboard_likes_totals(p_scope text DEFAULT 'all', p_value text DEFAULT NULL)
+RETURNS TABLE (likes bigint, dislikes bigint, liked_properties bigint)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT COALESCE(sum(likes), 0)::bigint,
+           COALESCE(sum(dislikes), 0)::bigint,
+           count(*) FILTER (WHERE likes > 0)
+    FROM maeiple_properties
+    WHERE p_scope = 'all'
+       OR (p_scope = 'team' AND employee_team = p_value)
+       OR (p_scope = 'own' AND employee_id::text = p_value)
+$$;
+
+-- 📅 5단계: 최근 p_days 일 동안의 일별 신규 등록 수 (등록이 없는 날은 0)
+CREATE OR REPLACE FUNCTION dashboard_new_per_day(p_scope text DEFAULT 'all', p_value text DEFAULT NULL, p_days integer DEFAULT 30)
+RETURNS TABLE (day date, customers bigint, properties bigint)
+LANGUAGE sql
+STABLE
+AS $$
+    WITH days AS (
+        SELECT generate_series(current_date - (p_days - 1), current_date, interval '1 day')::date AS day
+    ), c AS (
+        SELECT created_date::date AS day, count(*) AS n
+        FROM employee_customers
+        WHERE created_date >= current_date - (p_days - 1)
+          AND (p_scope = 'all'
+               OR (p_scope = 'team' AND employee_team = p_value)
+               OR (p_scope = 'own' AND employee_id::text = p_value))
+        GROUP BY 1
+    ), p AS (
+        SELECT created_at::date AS day, count(*) AS n
+        FROM maeiple_properties
+        WHERE created_at >= current_date - (p_days - 1)
+          AND (p_scope = 'all'
+               OR (p_scope = 'team' AND employee_team = p_value)
+               OR (p_scope = 'own' AND employee_id::text = p_value))
+        GROUP BY 1
+    )
+    SELECT days.day, COALESCE(c.n, 0), COALESCE(p.n, 0)
+    FROM days
+    LEFT JOIN c ON c.day = days.day
+    LEFT JOIN p ON p.day = days.day
+    ORDER BY days.day
+$$;
+
+-- 📦 6단계: 위 통계를 한 번에 반환 (앱에서 호출하는 RPC)
+CREATE OR REPLACE FUNCTION dashboard_stats(p_scope text DEFAULT 'all', p_value text DEFAULT NULL, p_days integer DEFAULT 30)
+RETURNS json
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT json_build_object(
+        'by_status', (SELECT COALESCE(json_agg(s), '[]'::json) FROM dashboard_status_counts(p_scope, p_value) s),
+        'by_team', (SELECT COALESCE(json_agg(t), '[]'::json) FROM dashboard_team_counts(p_scope, p_value) t),
+        'by_employee', (SELECT COALESCE(json_agg(e), '[]'::json) FROM dashboard_employee_counts(p_scope, p_value) e),
+        'likes', (SELECT row_to_json(l) FROM dashboard_likes_totals(p_scope, p_value) l),
+        'new_per_day', (SELECT COALESCE(json_agg(d), '[]'::json) FROM dashboard_new_per_day(p_scope, p_value, p_days) d)
+    )
+$$;
+
+-- 🔄 PostgREST 가 새 함수를 바로 인식하도록 스키마 캐시 갱신
+NOTIFY pgrst, 'reload schema';
+
+-- ✅ 확인 쿼리
+SELECT dashboard_stats('all');
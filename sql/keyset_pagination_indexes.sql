@@ -0,0 +1,38 @@
+-- 커서(cursor=) 페이지네이션용 (정렬키, id) 복합 인덱스
+-- /api/maeiple, /api/team-leader/maeiple, /api/employee/maeiple, /api/customers 가
+-- "정렬키 < 마지막값 OR (정렬키 = 마지막값 AND id < 마지막id)" 조건으로 다음 페이지를 읽으므로
+-- 필터 컬럼 + 정렬키 + id 순서의 인덱스가 있어야 깊은 페이지도 일정한 비용으로 조회됩니다.
+-- OR 조건만으로는 인덱스 시작 위치를 정할 수 없어 "정렬키 <= 마지막값"(오름차순은 ">= 마지막값 OR NULL")을 함께 보냅니다.
+
+-- 🏠 매물 (maeiple_properties): 정렬 가능한 컬럼별
+CREATE INDEX IF NOT EXISTS idx_maeiple_properties_check_date_id ON maeiple_properties (check_date, id);
+CREATE INDEX IF NOT EXISTS idx_maeiple_properties_jeonse_price_id ON maeiple_properties (jeonse_price, id);
+CREATE INDEX IF NOT EXISTS idx_maeiple_properties_monthly_rent_id ON maeiple_properties (monthly_rent, id);
+CREATE INDEX IF NOT EXISTS idx_maeiple_properties_sale_price_id ON maeiple_properties (sale_price, id);
+CREATE INDEX IF NOT EXISTS idx_maeiple_properties_building_number_id ON maeiple_properties (building_number, id);
+CREATE INDEX IF NOT EXISTS idx_maeiple_properties_room_number_id ON maeiple_properties (room_number, id);
+CREATE INDEX IF NOT EXISTS idx_maeiple_properties_status_id ON maeiple_properties (status, id);
+
+-- 팀장/직원 화면은 팀 또는 직원으로 먼저 거른 뒤 정렬 (기본 정렬: check_date)
+CREATE INDEX IF NOT EXISTS idx_maeiple_properties_team_check_date_id ON maeiple_properties (employee_team, check_date, id);
+CREATE INDEX IF NOT EXISTS idx_maeiple_properties_employee_check_date_id ON maeiple_properties (employee_id, check_date, id);
+
+-- 👥 고객 (employee_customers): created_date 내림차순
+CREATE INDEX IF NOT EXISTS idx_employee_customers_created_date_id ON employee_customers (created_date, id);
+CREATE INDEX IF NOT EXISTS idx_employee_customers_team_created_date_id ON employee_customers (employee_team, created_date, id);
+CREATE INDEX IF NOT EXISTS idx_employee_customers_employee_created_date_id ON employee_customers (employee_id, created_date, id);
+
+-- ✅ 확인 쿼리
+SELECT indexname, tablename
+FROM pg_indexes
+WHERE indexname LIKE 'idx_%_id'
+  AND tablename IN ('maeiple_properties', 'employee_customers')
+ORDER BY tablename, indexname;
+
+-- 🔍 깊은 페이지 실행계획 확인 (Index Scan ... Index Cond: check_date <= ... 이고 Sort 노드가 없어야 함)
+EXPLAIN
+SELECT id FROM maeiple_properties
+WHERE check_date <= '2024-06-01'
+  AND (check_date < '2024-06-01' OR (check_date = '2024-06-01' AND id < 5000))
+ORDER BY check_date DESC, id DESC
+LIMIT 21;
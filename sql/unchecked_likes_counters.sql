@@ -0,0 +1,160 @@
+-- employee_customers.unchecked_likes_residence / unchecked_likes_business 카운터를
+-- residence_links / office_links 의 좋아요·확인 이벤트에 맞춰 DB 트리거로 증감합니다.
+-- 적용 후에는 목록 API가 링크 행을 세지 않고 저장된 컬럼만 읽습니다.
+-- 누적 오차는 `python src/update_unchecked_likes_fixed.py --reconcile` 로 일괄 보정하세요.
+
+-- 🔧 1단계: 필요한 컬럼/인덱스 보장
+ALTER TABLE office_links ADD COLUMN IF NOT EXISTS is_checked boolean DEFAULT false;
+
+ALTER TABLE employee_customers ALTER COLUMN unchecked_likes_residence SET DEFAULT 0;
+ALTER TABLE employee_customers ALTER COLUMN unchecked_likes_business SET DEFAULT 0;
+
+CREATE INDEX IF NOT EXISTS idx_employee_customers_management_site_id
+    ON employee_customers (management_site_id);
+
+-- 미확인 좋아요(liked = true AND is_checked = false)만 담는 부분 인덱스
+CREATE INDEX IF NOT EXISTS idx_residence_links_unchecked_likes
+    ON residence_links (management_site_id)
+    WHERE liked = true AND is_checked = false;
+
+CREATE INDEX IF NOT EXISTS idx_office_links_unchecked_likes
+    ON office_links (management_site_id)
+    WHERE liked = true AND is_checked = false;
+
+-- 🔄 2단계: 카운터 증감 트리거 함수 (TG_ARGV[0] = 갱신할 카운터 컬럼명)
+CREATE OR REPLACE FUNCTION sync_unchecked_likes_counter()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    counter_column text := TG_ARGV[0];
+    old_site_id text := NULL;
+    new_site_id text := NULL;
+BEGIN
+    -- 변경 전 행이 미확인 좋아요였는지
+    IF TG_OP IN ('UPDATE', 'DELETE')
+       AND OLD.management_site_id IS NOT NULL
+       AND OLD.liked IS TRUE AND OLD.is_checked IS FALSE THEN
+        old_site_id := OLD.management_site_id;
+    END IF;
+
+    -- 변경 후 행이 미확인 좋아요인지
+    IF TG_OP IN ('INSERT', 'UPDATE')
+       AND NEW.management_site_id IS NOT NULL
+       AND NEW.liked IS TRUE AND NEW.is_checked IS FALSE THEN
+        new_site_id := NEW.management_site_id;
+    END IF;
+
+    -- 상태 변화가 없으면 아무것도 하지 않음
+    IF old_site_id IS NOT DISTINCT FROM new_site_id THEN
+        RETURN NULL;
+    END IF;
+
+    IF old_site_id IS NOT NULL THEN
+        EXECUTE format(
+            'UPDATE employee_customers SET %1$I = GREATEST(COALESCE(%1$I, 0) - 1, 0) WHERE management_site_id = $1',
+            counter_column
+        ) USING old_site_id;
+    END IF;
+
+    IF new_site_id IS NOT NULL THEN
+        EXECUTE format(
+            'UPDATE employee_customers SET %1$I = COALESCE(%1$I, 0) + 1 WHERE management_site_id = $1',
+            counter_column
+        ) USING new_site_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+-- 🔗 3단계: 링크 테이블에 트리거 연결
+DROP TRIGGER IF EXISTS trg_residence_links_unchecked_likes ON residence_links;
+CREATE TRIGGER trg_residence_links_unchecked_likes
+    AFTER INSERT OR UPDATE OF liked, is_checked, management_site_id OR DELETE
+    ON residence_links
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_unchecked_likes_counter('unchecked_likes_residence');
+
+DROP TRIGGER IF EXISTS trg_office_links_unchecked_likes ON office_links;
+CREATE TRIGGER trg_office_links_unchecked_likes
+    AFTER INSERT OR UPDATE OF liked, is_checked, management_site_id OR DELETE
+    ON office_links
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_unchecked_likes_counter('unchecked_likes_business');
+
+-- 📊 4단계: 현재 값으로 카운터 초기화 (트리거 설치 직후 1회)
+UPDATE employee_customers ec
+SET
+    unchecked_likes_residence = (
+        SELECT COUNT(*) FROM residence_links rl
+        WHERE rl.management_site_id = ec.management_site_id
+          AND rl.liked = true AND rl.is_checked = false
+    ),
+    unchecked_likes_business = (
+        SELECT COUNT(*) FROM office_links ol
+        WHERE ol.management_site_id = ec.management_site_id
+          AND ol.liked = true AND ol.is_checked = false
+    )
+WHERE ec.management_site_id IS NOT NULL;
+
+-- 🩺 5단계: 카운터 일괄 보정 함수 (update_unchecked_likes_fixed.py --reconcile 에서 RPC 로 호출)
+-- 저장값 조회, 재집계, 보정을 한 SQL 문에서 처리합니다. (따로 조회하면 그 사이에 실행된 트리거 증감을 오래된 값으로 덮어씀)
+-- 실행하는 동안 링크 테이블 쓰기를 잠시 막아 트리거가 끼어들지 않게 합니다.
+-- p_dry_run = true 이면 보정하지 않고 오차가 있는 고객만 반환합니다.
+CREATE OR REPLACE FUNCTION reconcile_unchecked_likes(p_dry_run boolean DEFAULT false)
+RETURNS TABLE (
+    customer_id bigint,
+    customer_name text,
+    old_residence integer,
+    new_residence integer,
+    old_business integer,
+    new_business integer,
+    repaired boolean
+)
+LANGUAGE sql
+AS $$
+    LOCK TABLE residence_links, office_links IN SHARE MODE;
+
+    WITH actual AS (
+        SELECT
+            c.id,
+            c.customer_name,
+            COALESCE(c.unchecked_likes_residence, 0) AS old_residence,
+            (SELECT COUNT(*) FROM residence_links rl
+             WHERE rl.management_site_id = c.management_site_id
+               AND rl.liked IS TRUE AND rl.is_checked IS FALSE) AS new_residence,
+            COALESCE(c.unchecked_likes_business, 0) AS old_business,
+            (SELECT COUNT(*) FROM office_links ol
+             WHERE ol.management_site_id = c.management_site_id
+               AND ol.liked IS TRUE AND ol.is_checked IS FALSE) AS new_business
+        FROM employee_customers c
+        WHERE c.management_site_id IS NOT NULL
+    ), drifted AS (
+        SELECT * FROM actual
+        WHERE old_residence <> new_residence OR old_business <> new_business
+    ), fixed AS (
+        UPDATE employee_customers ec
+        SET unchecked_likes_residence = d.new_residence,
+            unchecked_likes_business = d.new_business
+        FROM drifted d
+        WHERE ec.id = d.id AND NOT p_dry_run
+        RETURNING ec.id
+    )
+    SELECT d.id::bigint, d.customer_name::text,
+           d.old_residence::integer, d.new_residence::integer,
+           d.old_business::integer, d.new_business::integer,
+           f.id IS NOT NULL
+    FROM drifted d
+    LEFT JOIN fixed f ON f.id = d.id
+    ORDER BY d.id;
+$$;
+
+-- 🔄 PostgREST 가 새 함수를 바로 인식하도록 스키마 캐시 갱신
+NOTIFY pgrst, 'reload schema';
+
+-- ✅ 6단계: 확인 쿼리
+SELECT id, customer_name, management_site_id, unchecked_likes_residence, unchecked_likes_business
+FROM employee_customers
+WHERE unchecked_likes_residence > 0 OR unchecked_likes_business > 0
+LIMIT 10;
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+정적 자산(JS/CSS) 관리
+
+- 실행 시: 템플릿에서 asset_url('js/admin_panel.js') 로 내용 해시가 붙은 URL을 만들고,
+  해시가 붙은 정적 파일에는 장기 캐시 헤더를 붙입니다.
+- 빌드 시: python src/assets.py build 로 static/dist/ 에 압축(minify) + 해시 파일명 사본, 미리 압축한 .gz/.br 사본과
+  manifest.json 을 생성합니다.
+- 추출: python src/assets.py extract templates/xxx.html 로 템플릿의 인라인 <script>/<style> 을 static/ 파일로 옮깁니다.
+"""
+
+import os
+import re
+import json
+import shutil
+import hashlib
+import argparse
+import logging
+import threading
+
+import compression
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_DIR = os.path.join(BASE_DIR, 'static')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+MANIFEST_PATH = os.path.join(DIST_DIR, 'manifest.json')
+ASSET_DIRS = ('js', 'css')
+
+# 해시가 붙은 파일은 내용이 바뀌면 URL도 바뀌므로 1년 캐시
+ASSET_MAX_AGE = 365 * 24 * 60 * 60
+
+_manifest = {}
+_hash_cache = {}
+_hash_lock = threading.Lock()
+
+def load_manifest() -> dict:
+    """빌드 결과(manifest.json)를 읽습니다. 없으면 원본 파일 + ?v=해시 방식으로 동작합니다."""
+    global _manifest
+    try:
+        with open(MANIFEST_PATH, encoding='utf-8') as f:
+            _manifest = json.load(f)
+    except FileNotFoundError:
+        _manifest = {}
+    except Exception as e:
+        logger.warning("자산 manifest 로드 실패: %s", e)
+        _manifest = {}
+    return _manifest
+
+def _file_hash(path: str) -> str:
+    """static/ 아래 파일의 내용 해시 (수정 시각이 바뀔 때만 다시 계산)"""
+    full_path = os.path.join(STATIC_DIR, path)
+    mtime = os.path.getmtime(full_path)
+    with _hash_lock:
+        cached = _hash_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+    with open(full_path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:10]
+    with _hash_lock:
+        _hash_cache[path] = (mtime, digest)
+    return digest
+
+def asset_url(path: str) -> str:
+    """템플릿용: 캐시 무효화용 해시가 포함된 정적 파일 URL을 반환합니다."""
+    from flask import url_for
+
+    built = _manifest.get(path)
+    if built:
+        return url_for('static', filename=f'dist/{built}')
+    try:
+        return url_for('static', filename=path, v=_file_hash(path))
+    except OSError:
+        return url_for('static', filename=path)
+
+def init_app(app):
+    """Flask 앱에 asset_url 템플릿 함수와 정적 파일 캐시 헤더를 등록합니다."""
+    load_manifest()
+    app.jinja_env.globals['asset_url'] = asset_url
+
+    @app.after_request
+    def add_asset_cache_headers(response):
+        from flask import request
+
+        if request.endpoint != 'static' or response.status_code not in (200, 304):
+            return response
+        filename = (request.view_args or {}).get('filename', '')
+        if filename.startswith('dist/') or request.args.get('v'):
+            response.cache_control.no_cache = None
+            response.cache_control.public = True
+            response.cache_control.max_age = ASSET_MAX_AGE
+            response.cache_control.immutable = True
+        return response
+
+    return app
+
+# ==================== 빌드 ====================
+
+def _minify_css(source: str) -> str:
+    try:
+        import rcssmin
+        return rcssmin.cssmin(source)
+    except ImportError:
+        pass
+    # rcssmin이 없으면 주석/공백만 정리 (안전한 범위)
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r'\s*([{};])\s*', r'\1', source)
+    return source.strip()
+
+def _minify_js(source: str) -> str:
+    try:
+        import rjsmin
+        return rjsmin.jsmin(source)
+    except ImportError:
+        # 안전한 JS 압축기가 없으면 원본 그대로 사용 (gzip 전송으로 충분히 줄어듦)
+        return source
+
+def build():
+    """static/js, static/css 를 압축하고 해시 파일명으로 static/dist/ 에 복사한 뒤 manifest.json 을 생성합니다."""
+    if os.path.isdir(DIST_DIR):
+        shutil.rmtree(DIST_DIR)
+    manifest = {}
+
+    for asset_dir in ASSET_DIRS:
+        source_dir = os.path.join(STATIC_DIR, asset_dir)
+        if not os.path.isdir(source_dir):
+            continue
+        for name in sorted(os.listdir(source_dir)):
+            stem, ext = os.path.splitext(name)
+            if ext not in ('.js', '.css'):
+                continue
+            with open(os.path.join(source_dir, name), encoding='utf-8') as f:
+                source = f.read()
+            output = _minify_js(source) if ext == '.js' else _minify_css(source)
+            digest = hashlib.sha256(output.encode('utf-8')).hexdigest()[:10]
+            built_name = f'{asset_dir}/{stem}.{digest}{ext}'
+
+            os.makedirs(os.path.join(DIST_DIR, asset_dir), exist_ok=True)
+            built_path = os.path.join(DIST_DIR, built_name)
+            with open(built_path, 'w', encoding='utf-8') as f:
+                f.write(output)
+            # 응답 압축 미들웨어가 그대로 내려보낼 수 있도록 미리 압축한 사본(.br/.gz)도 생성
+            for encoding in compression.available_encodings():
+                with open(built_path + compression.PRECOMPRESSED_EXTENSIONS[encoding], 'wb') as f:
+                    f.write(compression.compress(output.encode('utf-8'), encoding, static=True))
+            manifest[f'{asset_dir}/{name}'] = built_name
+            print(f"✅ {asset_dir}/{name} → dist/{built_name} ({len(source) // 1024}KB → {len(output) // 1024}KB)")
+
+    os.makedirs(DIST_DIR, exist_ok=True)
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    print(f"📦 manifest 생성: {len(manifest)}개 파일")
+
+# ==================== 인라인 자산 추출 ====================
+
+_INLINE_BLOCK = re.compile(r'(?P<indent>[ \t]*)<(?P<tag>script|style)(?P<attrs>[^>]*)>(?P<body>.*?)</(?P=tag)>', re.S)
+_JINJA_SYNTAX = re.compile(r'\{\{|\{%|\{#')
+
+def extract(template_path: str, name: str = None):
+    """템플릿의 인라인 <style>/<script> 블록을 static/css, static/js 파일로 옮기고 asset_url 태그로 바꿉니다.
+
+    Jinja 문법이 들어 있는 블록(서버 값 주입용)이나 src가 있는 스크립트는 그대로 둡니다.
+    """
+    name = name or os.path.splitext(os.path.basename(template_path))[0]
+    with open(template_path, encoding='utf-8') as f:
+        html = f.read()
+
+    counters = {'script': 0, 'style': 0}
+
+    def replace(match):
+        tag = match.group('tag')
+        attrs = match.group('attrs')
+        body = match.group('body')
+        if 'src=' in attrs or _JINJA_SYNTAX.search(body) or len(body.strip()) < 1024:
+            return match.group(0)
+
+        counters[tag] += 1
+        suffix = '' if counters[tag] == 1 else f'-{counters[tag]}'
+        asset_dir, ext = ('js', '.js') if tag == 'script' else ('css', '.css')
+        asset_path = f'{asset_dir}/{name}{suffix}{ext}'
+
+        os.makedirs(os.path.join(STATIC_DIR, asset_dir), exist_ok=True)
+        with open(os.path.join(STATIC_DIR, asset_path), 'w', encoding='utf-8') as f:
+            f.write(body.lstrip('\n').rstrip() + '\n')
+        print(f"✅ {template_path}: <{tag}> {len(body) // 1024}KB → static/{asset_path}")
+
+        indent = match.group('indent')
+        if tag == 'script':
+            return f'{indent}<script src="{{{{ asset_url(\'{asset_path}\') }}}}"></script>'
+        return f'{indent}<link rel="stylesheet" href="{{{{ asset_url(\'{asset_path}\') }}}}">'
+
+    html = _INLINE_BLOCK.sub(replace, html)
+    with open(template_path, 'w', encoding='utf-8') as f:
+        f.write(html)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='정적 자산 추출/빌드')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('build', help='static/js, static/css 를 압축 + 해시 파일명으로 static/dist/ 에 빌드')
+    extract_parser = subparsers.add_parser('extract', help='템플릿의 인라인 <script>/<style> 을 static/ 으로 추출')
+    extract_parser.add_argument('templates', nargs='+', help='추출할 템플릿 파일 경로')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        build()
+    else:
+        for template_path in args.templates:
+            extract(template_path)
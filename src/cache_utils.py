@@ -0,0 +1,102 @@
+import os
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+class TTLCache:
+    """프로세스 내 LRU + TTL 캐시 (스레드 안전)"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float = None):
+        with self._lock:
+            self._data[key] = (value, time.time() + (self.ttl if ttl is None else ttl))
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+class RedisCache:
+    """Redis 공유 캐시 (값은 JSON으로 저장). 오류 시 캐시 미스로 처리합니다."""
+
+    def __init__(self, client, prefix: str, ttl: float = 60):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self.client.get(self._key(key))
+            return json.loads(raw) if raw is not None else None
+        except Exception as e:
+            logger.warning("Redis 캐시 조회 실패: %s", e)
+            return None
+
+    def set(self, key: str, value: Any, ttl: float = None):
+        try:
+            self.client.set(self._key(key), json.dumps(value, ensure_ascii=False, default=str), ex=max(int(self.ttl if ttl is None else ttl), 1))
+        except Exception as e:
+            logger.warning("Redis 캐시 저장 실패: %s", e)
+
+    def delete(self, key: str):
+        try:
+            self.client.delete(self._key(key))
+        except Exception as e:
+            logger.warning("Redis 캐시 삭제 실패: %s", e)
+
+    def clear(self):
+        try:
+            keys = list(self.client.scan_iter(match=f"{self.prefix}:*"))
+            if keys:
+                self.client.delete(*keys)
+        except Exception as e:
+            logger.warning("Redis 캐시 초기화 실패: %s", e)
+
+def create_cache(name: str, maxsize: int = 1024, ttl: float = 60, local_ttl: Optional[float] = None):
+    """CACHE_REDIS_URL이 있으면 Redis 공유 캐시, 없으면(또는 redis 패키지가 없으면) 메모리 캐시를 생성합니다.
+
+    Redis를 쓰면 워커 프로세스 간 캐시와 무효화가 공유됩니다.
+    local_ttl: 메모리 캐시일 때 사용할 TTL (지정하지 않으면 ttl). 메모리 캐시의 무효화는 해당 워커에만
+    적용되므로, 다른 워커가 이전 값을 돌려줄 수 있는 시간을 줄이려면 짧게 지정합니다.
+    """
+    memory_ttl = ttl if local_ttl is None else local_ttl
+    redis_url = os.environ.get('CACHE_REDIS_URL', '')
+    if redis_url:
+        try:
+            import redis
+            client = redis.Redis.from_url(redis_url, socket_timeout=1)
+            return RedisCache(client, prefix=f"jipnote:{name}", ttl=ttl)
+        except ImportError:
+            logger.warning("CACHE_REDIS_URL이 설정되었지만 redis 패키지가 없어 메모리 캐시를 사용합니다.")
+    return TTLCache(maxsize=maxsize, ttl=memory_ttl)
@@ -0,0 +1,138 @@
+"""
+응답 압축 (gzip / brotli)
+
+- HTML/JSON/CSS/JS 응답을 클라이언트의 Accept-Encoding 에 맞춰 압축합니다.
+  brotli 패키지가 설치되어 있으면 br 을 우선 사용하고, 없으면 gzip 을 사용합니다.
+- COMPRESS_MIN_SIZE 보다 작은 응답, 이미 인코딩된 응답, 스트리밍/부분(206) 응답은 건너뜁니다.
+- 정적 파일은 빌드 시 만들어 둔 .br / .gz 사본(python src/assets.py build)이 있으면 그대로 내려보냅니다.
+"""
+
+import os
+import gzip
+import logging
+
+from werkzeug.security import safe_join
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESS_ENABLED = os.environ.get('COMPRESS_ENABLED', 'true').lower() not in ('0', 'false', 'no', 'off')
+COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', '500'))
+COMPRESS_GZIP_LEVEL = int(os.environ.get('COMPRESS_GZIP_LEVEL', '6'))
+COMPRESS_BROTLI_QUALITY = int(os.environ.get('COMPRESS_BROTLI_QUALITY', '5'))
+COMPRESS_MIMETYPES = {
+    'text/html',
+    'text/css',
+    'text/plain',
+    'text/javascript',
+    'application/javascript',
+    'application/json',
+    'image/svg+xml',
+}
+
+# 인코딩 이름 → 미리 압축된 정적 파일 확장자
+PRECOMPRESSED_EXTENSIONS = {'br': '.br', 'gzip': '.gz'}
+
+def available_encodings() -> list:
+    """서버가 지원하는 인코딩 (선호 순서)"""
+    return ['br', 'gzip'] if brotli is not None else ['gzip']
+
+def compress(data: bytes, encoding: str, static: bool = False) -> bytes:
+    """데이터를 지정한 인코딩으로 압축합니다. 빌드 시(static=True)에는 최대 압축률을 사용합니다."""
+    if encoding == 'br':
+        return brotli.compress(data, quality=11 if static else COMPRESS_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=9 if static else COMPRESS_GZIP_LEVEL, mtime=0)
+
+def choose_encoding(accept_encodings) -> str:
+    """Accept-Encoding 헤더(품질값 포함)에서 사용할 인코딩을 고릅니다. 없으면 None"""
+    best, best_quality = None, 0
+    for encoding in available_encodings():
+        quality = accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+def _is_compressible(response) -> bool:
+    if response.status_code < 200 or response.status_code in (204, 206, 304):
+        return False
+    if 'Content-Encoding' in response.headers or (response.is_streamed and not response.direct_passthrough):
+        return False
+    return response.mimetype in COMPRESS_MIMETYPES
+
+def _weaken_etag(response):
+    # 인코딩마다 바이트가 다르므로 강한 ETag 는 약한 ETag 로 바꿔 조건부 요청(304)이 계속 맞도록 함
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+
+def _serve_precompressed(app, response, filename: str, encoding: str) -> bool:
+    """static/<filename>.br|.gz 가 있으면 응답 본문을 그 파일로 바꿉니다."""
+    full_path = safe_join(app.static_folder, filename)
+    if full_path is None:
+        return False
+    variant_path = full_path + PRECOMPRESSED_EXTENSIONS[encoding]
+    try:
+        # 원본보다 오래된 사본은 무시 (빌드 후 원본이 수정된 경우)
+        if os.path.getmtime(variant_path) < os.path.getmtime(full_path):
+            return False
+        with open(variant_path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return False
+
+    if hasattr(response.response, 'close'):
+        response.response.close()
+    response.direct_passthrough = False
+    response.set_data(data)
+    return True
+
+def init_app(app):
+    """Flask 앱에 응답 압축을 등록합니다.
+
+    after_request 는 등록의 역순으로 실행되므로, 다른 after_request 보다 먼저 등록해야
+    최종 응답(캐시 헤더/ETag 가 붙은 뒤)을 압축합니다.
+    """
+    if not COMPRESS_ENABLED:
+        return app
+
+    @app.after_request
+    def compress_response(response):
+        from flask import request
+
+        if not _is_compressible(response):
+            return response
+        response.vary.add('Accept-Encoding')
+
+        encoding = choose_encoding(request.accept_encodings)
+        if encoding is None:
+            return response
+
+        if request.endpoint == 'static':
+            filename = (request.view_args or {}).get('filename', '')
+            if _serve_precompressed(app, response, filename, encoding):
+                response.headers['Content-Encoding'] = encoding
+                _weaken_etag(response)
+                return response
+
+        response.direct_passthrough = False
+        data = response.get_data()
+        if len(data) < COMPRESS_MIN_SIZE:
+            return response
+        try:
+            compressed = compress(data, encoding)
+        except Exception as e:
+            logger.warning("응답 압축 실패 (%s): %s", encoding, e)
+            return response
+        if len(compressed) >= len(data):
+            return response
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        _weaken_etag(response)
+        return response
+
+    return app
@@ -0,0 +1,42 @@
+"""
+조건부 GET (ETag / If-None-Match)
+
+/api/ 아래 GET 요청의 JSON 응답에 본문 해시로 만든 약한 ETag 를 붙이고,
+클라이언트가 같은 ETag 로 If-None-Match 를 보내면 본문 없이 304 를 반환합니다.
+응답은 세션(로그인 사용자)마다 다르므로 private 으로, 매번 재검증하도록 no-cache 로 표시합니다.
+"""
+
+import os
+
+CONDITIONAL_ENABLED = os.environ.get('CONDITIONAL_GET_ENABLED', 'true').lower() not in ('0', 'false', 'no', 'off')
+CONDITIONAL_PATH_PREFIX = '/api/'
+
+def _is_cacheable(request, response) -> bool:
+    if request.method not in ('GET', 'HEAD') or not request.path.startswith(CONDITIONAL_PATH_PREFIX):
+        return False
+    if response.status_code != 200 or response.is_streamed:
+        return False
+    return response.mimetype == 'application/json'
+
+def init_app(app):
+    """Flask 앱에 API 응답 ETag / 304 처리를 등록합니다.
+
+    응답 압축(compression.init_app)보다 나중에 등록해야 압축 전 본문으로 ETag 를 계산합니다.
+    """
+    if not CONDITIONAL_ENABLED:
+        return app
+
+    @app.after_request
+    def add_conditional_etag(response):
+        from flask import request
+
+        if not _is_cacheable(request, response):
+            return response
+
+        if not response.get_etag()[0]:
+            response.add_etag(weak=True)
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+    return app
@@ -0,0 +1,133 @@
+"""
+로깅 설정
+
+- LOG_LEVEL (기본 INFO) 이상만 기록합니다. logger.debug("... %s", value) 처럼 인자를 넘기면
+  해당 레벨이 꺼져 있을 때 문자열을 만들지 않습니다.
+- LOG_DEBUG_SAMPLE_RATE (0~1, 기본 1.0) 로 DEBUG 로그 일부만 남길 수 있습니다.
+- 로그는 큐에 넣고 별도 스레드가 stdout 에 기록하므로 요청 스레드가 출력 I/O 를 기다리지 않습니다.
+- LOG_FORMAT=json 이면 한 줄 JSON(요청 id/메서드/경로 포함)으로 기록합니다.
+"""
+
+import os
+import sys
+import json
+import uuid
+import queue
+import atexit
+import random
+import logging
+import threading
+import logging.handlers
+
+TEXT_FORMAT = '%(asctime)s %(levelname)s [%(name)s] %(request_tag)s%(message)s'
+
+class RequestContextFilter(logging.Filter):
+    """Flask 요청 안에서 기록된 로그에 요청 id / 메서드 / 경로를 붙입니다. (요청 스레드에서 실행)"""
+
+    def filter(self, record):
+        record.request_id = record.method = record.path = None
+        record.request_tag = ''
+        try:
+            from flask import g, request, has_request_context
+            if has_request_context():
+                if 'request_id' not in g:
+                    g.request_id = request.headers.get('X-Request-ID') or uuid.uuid4().hex[:12]
+                record.request_id = g.request_id
+                record.method = request.method
+                record.path = request.path
+                record.request_tag = f"[{g.request_id}] "
+        except ImportError:
+            pass
+        return True
+
+class DebugSamplingFilter(logging.Filter):
+    """DEBUG 로그를 sample_rate 비율만 통과시킵니다. INFO 이상은 항상 통과합니다."""
+
+    def __init__(self, sample_rate: float):
+        super().__init__()
+        self.sample_rate = sample_rate
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or self.sample_rate >= 1.0:
+            return True
+        return random.random() < self.sample_rate
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 로그"""
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key in ('request_id', 'method', 'path'):
+            value = getattr(record, key, None)
+            if value:
+                entry[key] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class _ForkSafeQueueHandler(logging.handlers.QueueHandler):
+    """fork 이후(gunicorn 워커)에도 기록 스레드를 프로세스마다 다시 시작하는 QueueHandler"""
+
+    def __init__(self, log_queue, target_handler):
+        super().__init__(log_queue)
+        self.target_handler = target_handler
+        self._listener = None
+        self._pid = None
+        self._listener_lock = threading.Lock()
+
+    def _ensure_listener(self):
+        if self._pid == os.getpid():
+            return
+        with self._listener_lock:
+            if self._pid == os.getpid():
+                return
+            self._listener = logging.handlers.QueueListener(self.queue, self.target_handler, respect_handler_level=True)
+            self._listener.start()
+            self._pid = os.getpid()
+
+    def enqueue(self, record):
+        self._ensure_listener()
+        super().enqueue(record)
+
+    def stop(self):
+        if self._listener is not None and self._pid == os.getpid():
+            self._listener.stop()
+            self._pid = None
+
+_configured = False
+
+def configure_logging():
+    """루트 로거를 큐 기반 핸들러로 설정합니다. 여러 번 호출해도 한 번만 적용됩니다.
+
+    환경변수는 호출 시점에 읽으므로 load_dotenv() 이후에 호출해야 합니다.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    log_level = os.environ.get('LOG_LEVEL', 'INFO').upper()
+    log_format = os.environ.get('LOG_FORMAT', 'text').lower()
+    debug_sample_rate = float(os.environ.get('LOG_DEBUG_SAMPLE_RATE', '1.0'))
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if log_format == 'json':
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    queue_handler = _ForkSafeQueueHandler(queue.SimpleQueue(), stream_handler)
+    queue_handler.addFilter(DebugSamplingFilter(debug_sample_rate))
+    queue_handler.addFilter(RequestContextFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(getattr(logging, log_level, logging.INFO))
+    atexit.register(queue_handler.stop)
@@ -0,0 +1,199 @@
+"""
+요청/DB 호출 계측
+
+- supabase_utils 의 HTTP 클라이언트가 PostgREST 호출마다 record_db_call() 을 호출합니다.
+  (supabase_utils 함수와 라우트의 supabase.table(...).execute() 모두 같은 클라이언트를 사용)
+- 요청마다 DB 호출 수 / 총 DB 시간 / 가장 느린 호출을 모아 Server-Timing 헤더로 내려줍니다.
+- /metrics 에서 Prometheus 텍스트 형식으로 누적 지표를 제공합니다. (워커 프로세스별 값)
+  Authorization: Bearer <METRICS_TOKEN> 이 필요하며, METRICS_TOKEN 이 없으면 /metrics 는 404 를 반환합니다.
+  (엔드포인트/테이블 이름과 트래픽 양이 노출되므로 기본은 비공개, 로컬 확인용으로만 METRICS_PUBLIC=true)
+"""
+
+import os
+import hmac
+import time
+import logging
+import threading
+import contextvars
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() not in ('0', 'false', 'no', 'off')
+METRICS_PUBLIC = os.environ.get('METRICS_PUBLIC', 'false').lower() in ('1', 'true', 'yes', 'on')
+METRICS_PREFIX = 'jipnote'
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CALL_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+class RequestStats:
+    """요청 하나 동안의 DB 호출 통계"""
+
+    __slots__ = ('started_at', 'db_calls', 'db_time', 'slowest_time', 'slowest_label')
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.db_calls = 0
+        self.db_time = 0.0
+        self.slowest_time = 0.0
+        self.slowest_label = None
+
+    def add(self, label: str, duration: float):
+        self.db_calls += 1
+        self.db_time += duration
+        if duration >= self.slowest_time:
+            self.slowest_time = duration
+            self.slowest_label = label
+
+_current_stats = contextvars.ContextVar('request_stats', default=None)
+
+def current_stats() -> Optional[RequestStats]:
+    """현재 요청의 DB 호출 통계 (요청 밖이면 None)"""
+    return _current_stats.get()
+
+# ==================== Prometheus 지표 ====================
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted(labels.items()))
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', ' ')
+
+def _format_labels(key: tuple, extra: dict = None) -> str:
+    items = list(key) + list((extra or {}).items())
+    if not items:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in items) + '}'
+
+class Counter:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> list:
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_format_labels(key)} {value}')
+        return lines
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: tuple):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self._values = {}  # key -> [버킷별 개수..., 합계, 개수]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[i] += 1
+            entry[-2] += value
+            entry[-1] += 1
+
+    def render(self) -> list:
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            for key, entry in sorted(self._values.items()):
+                for i, bound in enumerate(self.buckets):
+                    lines.append(f'{self.name}_bucket{_format_labels(key, {"le": bound})} {entry[i]}')
+                lines.append(f'{self.name}_bucket{_format_labels(key, {"le": "+Inf"})} {entry[-1]}')
+                lines.append(f'{self.name}_sum{_format_labels(key)} {entry[-2]}')
+                lines.append(f'{self.name}_count{_format_labels(key)} {entry[-1]}')
+        return lines
+
+http_requests_total = Counter(f'{METRICS_PREFIX}_http_requests_total', 'HTTP 요청 수')
+http_request_duration = Histogram(f'{METRICS_PREFIX}_http_request_duration_seconds', 'HTTP 요청 처리 시간', DURATION_BUCKETS)
+db_calls_per_request = Histogram(f'{METRICS_PREFIX}_db_calls_per_request', '요청당 PostgREST 호출 수', CALL_COUNT_BUCKETS)
+db_time_per_request = Histogram(f'{METRICS_PREFIX}_db_time_per_request_seconds', '요청당 PostgREST 호출 시간 합계', DURATION_BUCKETS)
+db_calls_total = Counter(f'{METRICS_PREFIX}_db_calls_total', 'PostgREST 호출 수')
+db_call_duration = Histogram(f'{METRICS_PREFIX}_db_call_duration_seconds', 'PostgREST 호출 시간', DURATION_BUCKETS)
+
+REGISTRY = [http_requests_total, http_request_duration, db_calls_per_request, db_time_per_request, db_calls_total, db_call_duration]
+
+def render_prometheus() -> str:
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
+
+def record_db_call(method: str, table: str, status, duration: float):
+    """PostgREST 호출 1건을 기록합니다. (supabase_utils 의 HTTP 클라이언트에서 호출)"""
+    if not METRICS_ENABLED:
+        return
+    db_calls_total.inc(method=method, table=table, status=str(status))
+    db_call_duration.observe(duration, method=method, table=table)
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.add(f'{method} {table}', duration)
+
+# ==================== Flask 연동 ====================
+
+def _server_timing(stats: RequestStats, total: float) -> str:
+    parts = [
+        f'db;dur={stats.db_time * 1000:.1f};desc="{stats.db_calls} calls"',
+        f'total;dur={total * 1000:.1f}',
+    ]
+    if stats.slowest_label:
+        parts.insert(1, f'db-slowest;dur={stats.slowest_time * 1000:.1f};desc="{stats.slowest_label}"')
+    return ', '.join(parts)
+
+def init_app(app):
+    """요청별 계측(Server-Timing 헤더)과 /metrics 엔드포인트를 등록합니다."""
+    if not METRICS_ENABLED:
+        return app
+
+    from flask import request, g, Response
+
+    @app.before_request
+    def start_request_stats():
+        g._request_stats_token = _current_stats.set(RequestStats())
+
+    @app.after_request
+    def finish_request_stats(response):
+        stats = _current_stats.get()
+        if stats is None:
+            return response
+        total = time.perf_counter() - stats.started_at
+        endpoint = request.endpoint or 'unknown'
+
+        http_requests_total.inc(endpoint=endpoint, method=request.method, status=str(response.status_code))
+        http_request_duration.observe(total, endpoint=endpoint)
+        if endpoint != 'static':
+            db_calls_per_request.observe(stats.db_calls, endpoint=endpoint)
+            db_time_per_request.observe(stats.db_time, endpoint=endpoint)
+            response.headers['Server-Timing'] = _server_timing(stats, total)
+            if stats.db_calls:
+                logger.debug("DB 호출 %s회 / %.1fms (가장 느린 호출: %s %.1fms)",
+                             stats.db_calls, stats.db_time * 1000, stats.slowest_label, stats.slowest_time * 1000)
+        return response
+
+    @app.teardown_request
+    def reset_request_stats(exc=None):
+        token = g.pop('_request_stats_token', None)
+        if token is not None:
+            _current_stats.reset(token)
+
+    @app.route('/metrics')
+    def prometheus_metrics():
+        token = os.environ.get('METRICS_TOKEN', '')
+        if not token and not METRICS_PUBLIC:
+            return Response('not found\n', status=404, mimetype='text/plain')
+        if token and not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+            return Response('unauthorized\n', status=401, mimetype='text/plain')
+        return Response(render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+    return app
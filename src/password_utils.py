@@ -0,0 +1,62 @@
+"""
+직원 비밀번호 해시/검증
+
+- 새 비밀번호는 솔트가 포함된 해시(werkzeug, 기본 scrypt)로 저장합니다.
+- 예전에 평문으로 저장된 비밀번호도 검증되며, 로그인에 성공하면 needs_rehash() 로 판별해 해시로 바꿔 저장합니다.
+- 비밀번호가 비어 있는 직원은 기존과 같이 기본 비밀번호(1234)로 검증합니다.
+
+환경변수
+- PASSWORD_HASH_METHOD: werkzeug generate_password_hash 의 method (기본 scrypt, 예: pbkdf2:sha256:600000)
+"""
+
+import os
+import hmac
+import logging
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+logger = logging.getLogger(__name__)
+
+PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt')
+DEFAULT_PASSWORD = '1234'
+
+# werkzeug 해시 형식: "<method>$<salt>$<hash>"
+HASH_PREFIXES = ('scrypt:', 'pbkdf2:')
+
+def is_hashed(stored: str) -> bool:
+    """저장된 값이 해시인지(평문이 아닌지) 확인합니다."""
+    return bool(stored) and stored.startswith(HASH_PREFIXES) and stored.count('$') >= 2
+
+def hash_password(password: str) -> str:
+    """비밀번호를 솔트가 포함된 해시로 변환합니다. (이미 해시면 그대로 반환)"""
+    if is_hashed(password):
+        return password
+    return generate_password_hash(password, method=PASSWORD_HASH_METHOD)
+
+def verify_password(password: str, stored: str) -> bool:
+    """입력한 비밀번호가 저장된 값(해시 또는 예전 평문)과 일치하는지 확인합니다."""
+    if not password:
+        return False
+    if not stored:
+        stored = DEFAULT_PASSWORD
+    if is_hashed(stored):
+        try:
+            return check_password_hash(stored, password)
+        except ValueError as e:
+            logger.error("비밀번호 해시 형식 오류: %s", e)
+            return False
+    return hmac.compare_digest(password.encode('utf-8'), stored.encode('utf-8'))
+
+def needs_rehash(stored: str) -> bool:
+    """평문(또는 비어 있는) 비밀번호라 해시로 바꿔 저장해야 하는지 확인합니다."""
+    return not is_hashed(stored)
+
+_dummy_hash = None
+
+def verify_dummy(password: str) -> bool:
+    """없는 직원 이름으로 로그인할 때도 해시 검증 시간만큼 소요되도록 합니다. (직원 이름 존재 여부 노출 방지)"""
+    global _dummy_hash
+    if _dummy_hash is None:
+        _dummy_hash = generate_password_hash(DEFAULT_PASSWORD, method=PASSWORD_HASH_METHOD)
+    check_password_hash(_dummy_hash, password or '')
+    return False
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+직접 Postgres 연결 풀 (선택)
+
+DATABASE_URL 이 설정되어 있고 psycopg(3) / psycopg_pool 패키지가 설치된 경우에만 사용합니다.
+무거운 목록 조회와 집계를 PostgREST(HTTP + JSON 변환)를 거치지 않고 DB 에 직접 실행합니다.
+설정이 없거나 패키지가 없으면 is_enabled() 가 False 이고, 호출하는 쪽은 기존 Supabase 클라이언트를 사용합니다.
+
+    pip install "psycopg[binary,pool]"
+
+- 쓰기(INSERT/UPDATE/DELETE)는 계속 Supabase 클라이언트로 보냅니다. (개수 캐시 무효화/RLS 를 그대로 적용)
+- 워커 프로세스마다 풀을 따로 엽니다. (gunicorn fork 이후 첫 호출 시 생성)
+- Supabase connection pooler(트랜잭션 모드) 주소에서도 동작하도록 prepared statement 를 사용하지 않습니다.
+
+환경변수
+- DATABASE_URL: Postgres 접속 문자열
+- PG_POOL_MIN_SIZE / PG_POOL_MAX_SIZE: 프로세스별 연결 수 (기본 1 / 10)
+- PG_POOL_TIMEOUT: 풀에서 연결을 기다리는 최대 시간(초, 기본 5)
+- PG_STATEMENT_TIMEOUT_MS: 쿼리 제한 시간(ms, 기본 15000)
+"""
+
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Sequence
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+PG_POOL_MIN_SIZE = int(os.environ.get('PG_POOL_MIN_SIZE', 1))
+PG_POOL_MAX_SIZE = int(os.environ.get('PG_POOL_MAX_SIZE', 10))
+PG_POOL_TIMEOUT = float(os.environ.get('PG_POOL_TIMEOUT', 5))
+PG_STATEMENT_TIMEOUT_MS = int(os.environ.get('PG_STATEMENT_TIMEOUT_MS', 15000))
+
+# 연결에 실패한 뒤 다시 시도하기까지의 시간(초)
+PG_RETRY_INTERVAL = 60
+
+# 프로세스별 연결 풀 (None 이면 아직 열지 않았거나 사용 불가)
+_pool = None
+_pool_pid = None
+_unavailable = False
+_retry_at = 0.0
+_lock = threading.Lock()
+
+def _open_pool():
+    """DATABASE_URL 로 연결 풀을 엽니다. 설정/패키지가 없으면 None 을 반환합니다."""
+    global _unavailable
+    database_url = os.environ.get('DATABASE_URL', '')
+    if not database_url:
+        # 설정이 없으면 이후 호출은 잠금 없이 바로 None 을 반환
+        _unavailable = True
+        return None
+    try:
+        from psycopg.rows import dict_row
+        from psycopg_pool import ConnectionPool
+    except ImportError:
+        logger.warning("DATABASE_URL이 설정되었지만 psycopg/psycopg_pool 패키지가 없어 Supabase 클라이언트만 사용합니다.")
+        _unavailable = True
+        return None
+
+    pool = ConnectionPool(
+        database_url,
+        min_size=PG_POOL_MIN_SIZE,
+        max_size=max(PG_POOL_MAX_SIZE, PG_POOL_MIN_SIZE),
+        timeout=PG_POOL_TIMEOUT,
+        kwargs={
+            'autocommit': True,
+            'row_factory': dict_row,
+            'prepare_threshold': None,
+            'options': f'-c statement_timeout={PG_STATEMENT_TIMEOUT_MS}',
+        },
+        name='direct-postgres',
+        open=True
+    )
+    try:
+        pool.wait(timeout=PG_POOL_TIMEOUT)
+    except Exception:
+        pool.close()
+        raise
+    logger.info("✅ Postgres 직접 연결 풀 초기화 (pid=%s, max=%s)", os.getpid(), PG_POOL_MAX_SIZE)
+    return pool
+
+def get_pool():
+    """현재 프로세스의 연결 풀을 반환합니다. (사용할 수 없으면 None)
+
+    연결에 실패하면 PG_RETRY_INTERVAL 동안은 None 을 반환해 호출하는 쪽이 Supabase 클라이언트를 사용합니다.
+    """
+    global _pool, _pool_pid, _retry_at
+    if _unavailable:
+        return None
+    if _pool_pid == os.getpid() and (_pool is not None or time.time() < _retry_at):
+        return _pool
+    with _lock:
+        if _unavailable:
+            return None
+        if _pool_pid != os.getpid() or (_pool is None and time.time() >= _retry_at):
+            # fork 된 워커는 부모의 연결을 공유하지 않도록 새 풀을 엽니다. (부모의 풀은 닫지 않음)
+            try:
+                _pool = _open_pool()
+            except Exception as e:
+                logger.error("Postgres 직접 연결 풀 초기화 실패 (%s초 후 재시도): %s", PG_RETRY_INTERVAL, e)
+                _pool = None
+                _retry_at = time.time() + PG_RETRY_INTERVAL
+            _pool_pid = os.getpid()
+    return _pool
+
+def is_enabled() -> bool:
+    """직접 연결을 사용할 수 있는지 확인합니다."""
+    return get_pool() is not None
+
+@contextmanager
+def connection():
+    """풀에서 연결을 빌려옵니다.
+
+    직접 연결을 사용할 수 없거나 연결이 끊긴 경우 ConnectionError 를 발생시키므로,
+    호출하는 쪽은 이 예외만 잡아 Supabase 클라이언트로 다시 조회하면 됩니다.
+    """
+    from psycopg import OperationalError
+    from psycopg_pool import PoolTimeout
+
+    pool = get_pool()
+    if pool is None:
+        raise ConnectionError("Postgres 직접 연결이 설정되지 않았습니다.")
+    try:
+        with pool.connection() as conn:
+            yield conn
+    except (OperationalError, PoolTimeout) as e:
+        raise ConnectionError(f"Postgres 직접 연결 실패: {e}") from e
+
+def _execute(query, params: Optional[Sequence[Any]], label: str, fetch: str):
+    started_at = time.perf_counter()
+    status = 'error'
+    try:
+        with connection() as conn, conn.cursor() as cursor:
+            cursor.execute(query, params)
+            result = cursor.fetchall() if fetch == 'all' else cursor.fetchone()
+        status = 'ok'
+        return result
+    finally:
+        metrics.record_db_call('SQL', label, status, time.perf_counter() - started_at)
+
+def fetch_all(query, params: Optional[Sequence[Any]] = None, label: str = 'sql') -> List[Dict[str, Any]]:
+    """쿼리를 실행하고 모든 행을 dict 목록으로 반환합니다. (label: 계측용 테이블/용도 이름)"""
+    return _execute(query, params, label, 'all')
+
+def fetch_one(query, params: Optional[Sequence[Any]] = None, label: str = 'sql') -> Optional[Dict[str, Any]]:
+    """쿼리를 실행하고 첫 행을 dict 로 반환합니다. (결과가 없으면 None)"""
+    return _execute(query, params, label, 'one')
@@ -0,0 +1,377 @@
+"""
+서버 측 세션 저장소
+
+쿠키에는 서명된 세션 ID만 저장하고, 세션 내용은 저장소에 둡니다.
+저장소는 직원 ID → 세션 ID 목록 색인을 함께 관리하므로 revoke_employee() 한 번으로
+해당 직원의 모든 세션(다른 브라우저/기기 포함)을 즉시 끊을 수 있습니다.
+
+    session_store.init_app(app)              # app.session_interface 교체
+    session_store.rotate_session()           # 로그인 직후 세션 ID 재발급 (세션 고정 방지)
+    session_store.revoke_employee(emp_id)    # 비활성화/삭제된 직원 강제 로그아웃
+
+환경변수
+- SESSION_BACKEND: memory | sqlite | redis (기본: SESSION_REDIS_URL 이 있으면 redis, 없으면 sqlite)
+  memory 는 프로세스마다 따로 저장되므로 워커가 하나일 때만 사용하세요.
+- SESSION_SQLITE_PATH: SQLite 파일 경로 (기본: 프로젝트/instance/sessions.sqlite3, 같은 서버의 워커끼리 공유)
+- SESSION_REDIS_URL: Redis(호환) 주소 (redis 패키지 필요, 여러 서버 간 공유)
+- SESSION_TTL: 마지막 사용 후 세션 유지 시간(초, 기본 7일)
+"""
+
+import os
+import time
+import uuid
+import logging
+import sqlite3
+import threading
+from typing import Optional, Tuple
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SecureCookieSession, SessionInterface
+from itsdangerous import BadSignature, Signer
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SESSION_TTL = int(os.environ.get('SESSION_TTL', 7 * 24 * 3600))
+# 남은 유지 시간이 이보다 짧아지면 요청 시 만료 시간을 연장 (매 요청마다 쓰지 않도록)
+SESSION_REFRESH_RATIO = 0.5
+# 만료된 세션 정리 주기(초)
+SESSION_PURGE_INTERVAL = 600
+
+class MemorySessionBackend:
+    """프로세스 내 세션 저장소 (단일 프로세스/테스트용)"""
+
+    def __init__(self):
+        self._sessions = {}  # sid -> (data, expires_at, employee_id)
+        self._by_employee = {}  # employee_id -> {sid, ...}
+        self._lock = threading.Lock()
+
+    def load(self, sid: str) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            entry = self._sessions.get(sid)
+            if entry is None:
+                return None
+            data, expires_at, employee_id = entry
+            if expires_at <= time.time():
+                self._remove(sid)
+                return None
+            return data, expires_at
+
+    def save(self, sid: str, data: str, expires_at: float, employee_id: Optional[str], create: bool = True) -> bool:
+        with self._lock:
+            previous = self._sessions.get(sid)
+            if previous is None and not create:
+                return False
+            if previous and previous[2] != employee_id:
+                self._by_employee.get(previous[2], set()).discard(sid)
+            self._sessions[sid] = (data, expires_at, employee_id)
+            if employee_id:
+                self._by_employee.setdefault(employee_id, set()).add(sid)
+            return True
+
+    def delete(self, sid: str):
+        with self._lock:
+            self._remove(sid)
+
+    def revoke_employee(self, employee_id: str) -> int:
+        with self._lock:
+            sids = self._by_employee.pop(employee_id, set())
+            for sid in sids:
+                self._sessions.pop(sid, None)
+            return len(sids)
+
+    def purge_expired(self):
+        now = time.time()
+        with self._lock:
+            for sid in [sid for sid, entry in self._sessions.items() if entry[1] <= now]:
+                self._remove(sid)
+
+    def _remove(self, sid: str):
+        entry = self._sessions.pop(sid, None)
+        if entry and entry[2]:
+            sids = self._by_employee.get(entry[2])
+            if sids is not None:
+                sids.discard(sid)
+                if not sids:
+                    del self._by_employee[entry[2]]
+
+class SQLiteSessionBackend:
+    """SQLite 파일 세션 저장소 (같은 서버의 gunicorn 워커끼리 공유)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS sessions ('
+                ' sid TEXT PRIMARY KEY,'
+                ' data TEXT NOT NULL,'
+                ' employee_id TEXT,'
+                ' expires_at REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_sessions_employee_id ON sessions (employee_id)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions (expires_at)')
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드(와 fork 된 프로세스)마다 별도 연결을 사용합니다."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def load(self, sid: str) -> Optional[Tuple[str, float]]:
+        row = self._connect().execute(
+            'SELECT data, expires_at FROM sessions WHERE sid = ? AND expires_at > ?', (sid, time.time())
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def save(self, sid: str, data: str, expires_at: float, employee_id: Optional[str], create: bool = True) -> bool:
+        if not create:
+            return self._connect().execute(
+                'UPDATE sessions SET data = ?, employee_id = ?, expires_at = ? WHERE sid = ?',
+                (data, employee_id, expires_at, sid)
+            ).rowcount > 0
+        self._connect().execute(
+            'INSERT INTO sessions (sid, data, employee_id, expires_at) VALUES (?, ?, ?, ?)'
+            ' ON CONFLICT(sid) DO UPDATE SET data = excluded.data, employee_id = excluded.employee_id,'
+            ' expires_at = excluded.expires_at',
+            (sid, data, employee_id, expires_at)
+        )
+        return True
+
+    def delete(self, sid: str):
+        self._connect().execute('DELETE FROM sessions WHERE sid = ?', (sid,))
+
+    def revoke_employee(self, employee_id: str) -> int:
+        return self._connect().execute('DELETE FROM sessions WHERE employee_id = ?', (employee_id,)).rowcount
+
+    def purge_expired(self):
+        self._connect().execute('DELETE FROM sessions WHERE expires_at <= ?', (time.time(),))
+
+class RedisSessionBackend:
+    """Redis(호환) 세션 저장소. 직원별 세션 ID 는 Set 으로 색인합니다."""
+
+    def __init__(self, client, prefix: str = 'jipnote:session'):
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, sid: str) -> str:
+        return f"{self.prefix}:{sid}"
+
+    def _employee_key(self, employee_id: str) -> str:
+        return f"{self.prefix}:employee:{employee_id}"
+
+    def load(self, sid: str) -> Optional[Tuple[str, float]]:
+        pipe = self.client.pipeline()
+        pipe.get(self._key(sid))
+        pipe.ttl(self._key(sid))
+        raw, ttl = pipe.execute()
+        if raw is None:
+            return None
+        data = raw.decode('utf-8') if isinstance(raw, bytes) else raw
+        return data, time.time() + max(ttl, 0)
+
+    def save(self, sid: str, data: str, expires_at: float, employee_id: Optional[str], create: bool = True) -> bool:
+        ttl = max(int(expires_at - time.time()), 1)
+        # create=False 이면 키가 있을 때만 덮어씀 (XX)
+        if not self.client.set(self._key(sid), data, ex=ttl, xx=not create):
+            return False
+        if employee_id:
+            pipe = self.client.pipeline()
+            pipe.sadd(self._employee_key(employee_id), sid)
+            pipe.expire(self._employee_key(employee_id), ttl)
+            pipe.execute()
+        return True
+
+    def delete(self, sid: str):
+        self.client.delete(self._key(sid))
+
+    def revoke_employee(self, employee_id: str) -> int:
+        sids = [sid.decode('utf-8') if isinstance(sid, bytes) else sid
+                for sid in self.client.smembers(self._employee_key(employee_id))]
+        keys = [self._key(sid) for sid in sids]
+        removed = self.client.delete(*keys) if keys else 0
+        self.client.delete(self._employee_key(employee_id))
+        return removed
+
+    def purge_expired(self):
+        # 세션 키는 Redis 가 만료시키고, 색인 Set 은 마지막 세션과 같이 만료됨
+        pass
+
+def create_backend():
+    """환경변수에 맞는 세션 저장소를 생성합니다. redis 패키지가 없으면 SQLite 로 대체합니다."""
+    redis_url = os.environ.get('SESSION_REDIS_URL', '')
+    backend = os.environ.get('SESSION_BACKEND', 'redis' if redis_url else 'sqlite').strip().lower()
+
+    if backend == 'redis':
+        if not redis_url:
+            logger.warning("SESSION_BACKEND=redis 이지만 SESSION_REDIS_URL이 없어 SQLite 세션 저장소를 사용합니다.")
+        else:
+            try:
+                import redis
+                return RedisSessionBackend(redis.Redis.from_url(redis_url, socket_timeout=1))
+            except ImportError:
+                logger.warning("SESSION_REDIS_URL이 설정되었지만 redis 패키지가 없어 SQLite 세션 저장소를 사용합니다.")
+        backend = 'sqlite'
+
+    if backend == 'memory':
+        return MemorySessionBackend()
+
+    if backend != 'sqlite':
+        logger.warning("알 수 없는 SESSION_BACKEND=%s, SQLite 세션 저장소를 사용합니다.", backend)
+    path = os.environ.get('SESSION_SQLITE_PATH', os.path.join(BASE_DIR, 'instance', 'sessions.sqlite3'))
+    return SQLiteSessionBackend(path)
+
+class ServerSideSession(SecureCookieSession):
+    """서버에 저장되는 세션 (sid: 세션 ID, expires_at: 저장소의 만료 시각, stored: 저장소에서 읽은 세션인지)"""
+
+    def __init__(self, initial=None, sid: str = None, expires_at: float = 0.0, stored: bool = False):
+        super().__init__(initial)
+        self.sid = sid
+        self.expires_at = expires_at
+        self.stored = stored
+        self.rotated_from = None
+
+class ServerSideSessionInterface(SessionInterface):
+    """쿠키에는 서명된 세션 ID만 두고 내용은 저장소에 보관하는 Flask 세션 인터페이스"""
+
+    session_class = ServerSideSession
+    serializer = TaggedJSONSerializer()
+    salt = 'jipnote-server-session'
+
+    def __init__(self, backend, ttl: int = SESSION_TTL):
+        self.backend = backend
+        self.ttl = ttl
+        self._last_purge = 0.0
+
+    def _signer(self, app) -> Optional[Signer]:
+        if not app.secret_key:
+            return None
+        return Signer(app.secret_key, salt=self.salt)
+
+    @staticmethod
+    def _new_sid() -> str:
+        return uuid.uuid4().hex + uuid.uuid4().hex
+
+    def open_session(self, app, request):
+        signer = self._signer(app)
+        if signer is None:
+            return None
+
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if cookie:
+            try:
+                sid = signer.unsign(cookie).decode('utf-8')
+                stored = self.backend.load(sid)
+                if stored is not None:
+                    data, expires_at = stored
+                    return self.session_class(self.serializer.loads(data), sid=sid, expires_at=expires_at, stored=True)
+            except BadSignature:
+                logger.debug("세션 쿠키 서명 불일치 - 새 세션 시작")
+            except Exception as e:
+                logger.error("세션 조회 실패: %s", e)
+        return self.session_class(sid=self._new_sid())
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if session.accessed:
+            response.vary.add('Cookie')
+
+        try:
+            if session.rotated_from:
+                self.backend.delete(session.rotated_from)
+                session.rotated_from = None
+
+            # 로그아웃 등으로 비워진 세션은 저장소와 쿠키에서 모두 제거
+            if not session:
+                if session.modified:
+                    self.backend.delete(session.sid)
+                    response.delete_cookie(name, domain=domain, path=path,
+                                           secure=self.get_cookie_secure(app),
+                                           samesite=self.get_cookie_samesite(app))
+                return
+
+            now = time.time()
+            refresh = session.expires_at - now < self.ttl * SESSION_REFRESH_RATIO
+            if not (session.modified or refresh):
+                return
+
+            session.expires_at = now + self.ttl
+            employee_id = session.get('employee_id')
+            # 저장소에서 읽은 세션은 남아 있을 때만 갱신 (요청 처리 중 revoke_employee() 로 삭제되었으면 되살리지 않음)
+            saved = self.backend.save(session.sid, self.serializer.dumps(dict(session)), session.expires_at,
+                                      str(employee_id) if employee_id is not None else None,
+                                      create=not session.stored)
+            if not saved:
+                logger.info("삭제된 세션은 다시 저장하지 않습니다. (직원 ID %s)", employee_id)
+                response.delete_cookie(name, domain=domain, path=path,
+                                       secure=self.get_cookie_secure(app),
+                                       samesite=self.get_cookie_samesite(app))
+                return
+            self._maybe_purge(now)
+        except Exception as e:
+            logger.error("세션 저장 실패: %s", e)
+            return
+
+        response.set_cookie(
+            name,
+            self._signer(app).sign(session.sid.encode('utf-8')).decode('utf-8'),
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app)
+        )
+
+    def _maybe_purge(self, now: float):
+        if now - self._last_purge < SESSION_PURGE_INTERVAL:
+            return
+        self._last_purge = now
+        try:
+            self.backend.purge_expired()
+        except Exception as e:
+            logger.warning("만료 세션 정리 실패: %s", e)
+
+_interface = None
+
+def init_app(app, backend=None):
+    """앱의 세션을 서버 측 저장소로 바꿉니다."""
+    global _interface
+    _interface = ServerSideSessionInterface(backend or create_backend())
+    app.session_interface = _interface
+    logger.info("세션 저장소: %s", type(_interface.backend).__name__)
+    return app
+
+def rotate_session():
+    """현재 세션의 ID를 새로 발급합니다. (로그인 직후 호출, 이전 ID는 응답 시 저장소에서 삭제)"""
+    from flask import session
+    if isinstance(session._get_current_object(), ServerSideSession):
+        if session.rotated_from is None:
+            session.rotated_from = session.sid
+        session.sid = ServerSideSessionInterface._new_sid()
+        session.stored = False
+        session.modified = True
+
+def revoke_employee(employee_id) -> int:
+    """직원의 모든 세션을 삭제해 즉시 로그아웃시킵니다. 삭제한 세션 수를 반환합니다."""
+    if _interface is None or employee_id is None:
+        return 0
+    try:
+        removed = _interface.backend.revoke_employee(str(employee_id))
+        logger.info("직원 ID %s 세션 %s개 삭제", employee_id, removed)
+        return removed
+    except Exception as e:
+        logger.error("직원 세션 삭제 실패 (직원 ID %s): %s", employee_id, e)
+        return 0
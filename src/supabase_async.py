@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+비동기 PostgREST 접근 계층
+
+서로 독립적인 여러 쿼리를 동시에 실행해, 쿼리 N개의 응답 시간이 지연의 합이 아니라 최댓값이 되도록 합니다.
+Flask 뷰는 동기 함수이므로 프로세스마다 백그라운드 이벤트 루프 스레드 하나를 두고,
+뷰 스레드는 gather()/run() 으로 코루틴을 넘긴 뒤 결과를 기다립니다.
+
+    customers, properties = supabase_async.gather(
+        supabase_async.table('employee_customers').select('id', count='exact').limit(1),
+        supabase_async.table('maeiple_properties').select('id', count='exact').limit(1),
+    )
+
+- 인증 헤더/주소는 supabase_utils 의 동기 클라이언트와 같은 값을 사용합니다.
+- 호출은 동기 클라이언트와 같이 요청별 계측(metrics)과 개수 캐시 무효화에 반영됩니다.
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+import contextvars
+from typing import Any, Awaitable, List
+
+import httpx
+from postgrest import AsyncPostgrestClient
+from postgrest.utils import AsyncClient
+
+import metrics
+import supabase_utils
+
+logger = logging.getLogger(__name__)
+
+class InstrumentedAsyncClient(AsyncClient):
+    """PostgREST 호출마다 소요 시간을 기록하고, 쓰기 성공 시 개수 캐시를 무효화하는 비동기 HTTP 클라이언트"""
+
+    async def send(self, request, **kwargs):
+        started_at = time.perf_counter()
+        status = 'error'
+        try:
+            response = await super().send(request, **kwargs)
+            status = response.status_code
+            supabase_utils._invalidate_count_cache_on_write(response)
+            return response
+        finally:
+            metrics.record_db_call(request.method, supabase_utils._table_from_path(request.url.path), status, time.perf_counter() - started_at)
+
+def _build_async_transport() -> httpx.AsyncHTTPTransport:
+    """동기 클라이언트와 같은 연결 풀 설정의 비동기 전송 계층 (연결 실패만 재시도)"""
+    return httpx.AsyncHTTPTransport(
+        limits=supabase_utils._pool_limits(),
+        http2=supabase_utils._http2_enabled(),
+        retries=supabase_utils.SUPABASE_MAX_RETRIES
+    )
+
+# 프로세스별 이벤트 루프 스레드와 비동기 클라이언트
+_loop = None
+_loop_pid = None
+_client = None
+_lock = threading.Lock()
+
+def _start_loop() -> asyncio.AbstractEventLoop:
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    threading.Thread(target=run, name='supabase-async-loop', daemon=True).start()
+    ready.wait()
+    return loop
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    """현재 프로세스의 이벤트 루프를 반환합니다. fork 이후 처음 호출되면 워커 전용 루프를 새로 시작합니다."""
+    global _loop, _loop_pid, _client
+    if _loop is not None and _loop_pid == os.getpid():
+        return _loop
+    with _lock:
+        if _loop is None or _loop_pid != os.getpid():
+            _loop = _start_loop()
+            _loop_pid = os.getpid()
+            _client = None
+    return _loop
+
+def get_async_postgrest() -> AsyncPostgrestClient:
+    """비동기 PostgREST 클라이언트 (동기 클라이언트의 주소/인증 헤더 사용)"""
+    global _client
+    _ensure_loop()
+    if _client is not None:
+        return _client
+    with _lock:
+        if _client is None:
+            supabase = supabase_utils.get_supabase()
+            if not supabase:
+                raise ConnectionError("Supabase 클라이언트가 초기화되지 않았습니다.")
+            sync_session = supabase.postgrest.session
+            client = AsyncPostgrestClient(str(sync_session.base_url))
+            client.session = InstrumentedAsyncClient(
+                base_url=sync_session.base_url,
+                headers=sync_session.headers,
+                timeout=sync_session.timeout,
+                transport=_build_async_transport()
+            )
+            _client = client
+    return _client
+
+def table(name: str):
+    """비동기 쿼리 빌더 (execute() 는 코루틴)"""
+    return get_async_postgrest().from_(name)
+
+def run(coro: Awaitable) -> Any:
+    """코루틴을 백그라운드 이벤트 루프에서 실행하고 결과를 기다립니다.
+
+    호출한 스레드의 contextvars(요청별 계측 등)를 그대로 이어받아 실행합니다.
+    """
+    loop = _ensure_loop()
+    context = contextvars.copy_context()
+    future = asyncio.run_coroutine_threadsafe(_in_context(coro, context), loop)
+    return future.result()
+
+async def _in_context(coro: Awaitable, context: contextvars.Context):
+    return await asyncio.get_running_loop().create_task(_await(coro), context=context)
+
+async def _await(awaitable: Awaitable):
+    return await awaitable
+
+def _as_awaitable(query) -> Awaitable:
+    return query.execute() if hasattr(query, 'execute') else query
+
+def gather(*queries, return_exceptions: bool = False) -> List[Any]:
+    """여러 쿼리(비동기 빌더 또는 코루틴)를 동시에 실행하고 순서대로 결과를 반환합니다.
+
+    return_exceptions=False 이면 첫 예외를 그대로 발생시킵니다.
+    """
+    if not queries:
+        return []
+
+    async def gather_all():
+        return await asyncio.gather(*(_as_awaitable(q) for q in queries), return_exceptions=return_exceptions)
+
+    return run(gather_all())
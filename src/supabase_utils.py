@@ -4,10 +4,24 @@ Supabase 데이터베이스 유틸리티
 """
 
 import os
+import json
+import time
+import base64
 import logging
+import threading
 from typing import Dict, List, Optional, Any
+import httpx
+from postgrest import SyncPostgrestClient
+from postgrest.exceptions import APIError
+from postgrest.utils import SyncClient
 from supabase import create_client, Client
+from supabase.lib.client_options import ClientOptions
 from dotenv import load_dotenv
+from cache_utils import create_cache
+from write_behind import WriteBehindQueue
+import password_utils
+import metrics
+import pg_pool
 
 # 환경변수 로드
 load_dotenv()
@@ -16,12 +30,124 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Supabase 클라이언트
+def _env_bool(name: str, default: bool = False) -> bool:
+    value = os.environ.get(name)
+    if value is None or value == '':
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+# HTTP 전송 설정 (PostgREST 호출용 연결 풀)
+SUPABASE_POOL_SIZE = int(os.environ.get('SUPABASE_POOL_SIZE', 20))
+SUPABASE_POOL_KEEPALIVE = int(os.environ.get('SUPABASE_POOL_KEEPALIVE', 10))
+SUPABASE_KEEPALIVE_EXPIRY = float(os.environ.get('SUPABASE_KEEPALIVE_EXPIRY', 60))
+SUPABASE_TIMEOUT = float(os.environ.get('SUPABASE_TIMEOUT', 15))
+SUPABASE_CONNECT_TIMEOUT = float(os.environ.get('SUPABASE_CONNECT_TIMEOUT', 5))
+SUPABASE_HTTP2 = _env_bool('SUPABASE_HTTP2', False)
+SUPABASE_MAX_RETRIES = int(os.environ.get('SUPABASE_MAX_RETRIES', 2))
+SUPABASE_RETRY_BACKOFF = float(os.environ.get('SUPABASE_RETRY_BACKOFF', 0.2))
+
+# 재시도 대상 (5xx 중 일시적 오류, 멱등 메서드)
+RETRY_STATUS_CODES = {502, 503, 504}
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'PATCH', 'DELETE'}
+
+class RetryTransport(httpx.HTTPTransport):
+    """일시적 5xx 응답과 연결 끊김을 지수 백오프로 재시도하는 HTTP 전송 계층"""
+
+    def __init__(self, max_retries: int = SUPABASE_MAX_RETRIES, backoff: float = SUPABASE_RETRY_BACKOFF, **kwargs):
+        super().__init__(**kwargs)
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        idempotent = request.method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            try:
+                response = super().handle_request(request)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                # 요청이 전송되기 전에 실패했으므로 메서드와 무관하게 재시도 가능
+                if attempt >= self.max_retries:
+                    raise
+            except (httpx.RemoteProtocolError, httpx.ReadError):
+                # 연결이 재사용 도중 끊긴 경우 (keep-alive 만료 등)
+                if not idempotent or attempt >= self.max_retries:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or not idempotent or attempt >= self.max_retries:
+                    return response
+                response.close()
+
+            attempt += 1
+            delay = self.backoff * (2 ** (attempt - 1))
+            logger.warning("Supabase 요청 재시도 %s/%s (%s %s) - %.2f초 후", attempt, self.max_retries, request.method, request.url.path, delay)
+            time.sleep(delay)
+
+def _pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=SUPABASE_POOL_SIZE,
+        max_keepalive_connections=SUPABASE_POOL_KEEPALIVE,
+        keepalive_expiry=SUPABASE_KEEPALIVE_EXPIRY
+    )
+
+def _http2_enabled() -> bool:
+    if not SUPABASE_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        logger.warning("SUPABASE_HTTP2가 설정되었지만 h2 패키지가 없어 HTTP/1.1을 사용합니다. (pip install 'httpx[http2]')")
+        return False
+
+def _build_transport() -> httpx.HTTPTransport:
+    """연결 풀/keep-alive/HTTP2 설정이 적용된 전송 계층을 생성합니다."""
+    return RetryTransport(limits=_pool_limits(), http2=_http2_enabled())
+
+def _table_from_path(path: str) -> str:
+    """/rest/v1/<table> 또는 /rest/v1/rpc/<함수> 경로에서 테이블(함수) 이름을 꺼냅니다."""
+    path = path.rstrip('/')
+    if '/rpc/' in path:
+        return 'rpc/' + path.rsplit('/', 1)[-1]
+    return path.rsplit('/', 1)[-1]
+
+class InstrumentedSyncClient(SyncClient):
+    """PostgREST 호출마다 소요 시간을 metrics 에 기록하는 HTTP 클라이언트 (재시도/응답 본문 수신 포함)"""
+
+    def send(self, request, **kwargs):
+        started_at = time.perf_counter()
+        status = 'error'
+        try:
+            response = super().send(request, **kwargs)
+            status = response.status_code
+            return response
+        finally:
+            metrics.record_db_call(request.method, _table_from_path(request.url.path), status, time.perf_counter() - started_at)
+
+class PooledSupabaseClient(Client):
+    """PostgREST 호출에 공유 연결 풀 전송 계층을 사용하는 Supabase 클라이언트"""
+
+    def _init_postgrest_client(self, rest_url, headers, schema, timeout=SUPABASE_TIMEOUT):
+        postgrest = SyncPostgrestClient(rest_url, headers=headers, schema=schema, timeout=timeout)
+        default_session = postgrest.session
+        postgrest.session = InstrumentedSyncClient(
+            base_url=default_session.base_url,
+            headers=default_session.headers,
+            timeout=default_session.timeout,
+            transport=_build_transport(),
+            event_hooks={'response': [_invalidate_count_cache_on_write]}
+        )
+        default_session.close()
+        return postgrest
+
+# Supabase 클라이언트 (워커 프로세스별 1개, 스레드 간 공유)
 _supabase_client = None
+_supabase_pid = None
+_supabase_lock = threading.Lock()
+_supabase_init_lock = threading.Lock()
 
 def init_supabase():
-    """Supabase 클라이언트를 초기화합니다."""
-    global _supabase_client
+    """Supabase 클라이언트를 초기화합니다. (gunicorn post_fork 에서 워커별로 호출)"""
+    global _supabase_client, _supabase_pid
     
     try:
         SUPABASE_URL = os.environ.get('SUPABASE_URL')
@@ -30,19 +156,478 @@ def init_supabase():
         if not SUPABASE_URL or not SUPABASE_KEY:
             raise ValueError("환경변수 SUPABASE_URL 또는 SUPABASE_KEY가 설정되지 않았습니다.")
         
-        _supabase_client = create_client(SUPABASE_URL, SUPABASE_KEY)
-        logger.info("✅ Supabase 클라이언트 초기화 성공")
+        options = ClientOptions(
+            postgrest_client_timeout=httpx.Timeout(SUPABASE_TIMEOUT, connect=SUPABASE_CONNECT_TIMEOUT)
+        )
+        client = PooledSupabaseClient(SUPABASE_URL, SUPABASE_KEY, options)
+        
+        with _supabase_lock:
+            previous = _supabase_client if _supabase_pid == os.getpid() else None
+            _supabase_client = client
+            _supabase_pid = os.getpid()
+        
+        # 같은 프로세스에서 재초기화한 경우 이전 연결 풀 정리
+        if previous is not None and previous._postgrest is not None:
+            previous._postgrest.aclose()
+        
+        logger.info("✅ Supabase 클라이언트 초기화 성공 (pid=%s, pool=%s, http2=%s)", _supabase_pid, SUPABASE_POOL_SIZE, SUPABASE_HTTP2)
         return True
     except Exception as e:
-        logger.error(f"❌ Supabase 클라이언트 초기화 실패: {e}")
+        logger.error("❌ Supabase 클라이언트 초기화 실패: %s", e)
         return False
 
+def _reset_after_fork():
+    """fork 직후 자식 프로세스에서 잠금과 부모의 클라이언트 참조를 초기화합니다.
+
+    fork 시점에 다른 스레드가 잡고 있던 잠금이 자식에서 영원히 잠긴 채 남지 않도록 새로 만들고,
+    부모의 연결 풀 소켓은 사용하지 않도록 클라이언트를 버립니다. (다음 get_supabase() 에서 새로 생성)
+    """
+    global _supabase_client, _supabase_pid, _supabase_lock, _supabase_init_lock, _count_cache
+    _supabase_lock = threading.Lock()
+    _supabase_init_lock = threading.Lock()
+    _count_cache = _create_count_cache()
+    _supabase_client = None
+    _supabase_pid = None
+
 def get_supabase() -> Optional[Client]:
-    """Supabase 클라이언트를 반환합니다."""
-    if _supabase_client is None:
-        init_supabase()
+    """Supabase 클라이언트를 반환합니다. fork 이후 처음 호출되면 워커 전용 클라이언트를 새로 만듭니다."""
+    if _supabase_client is None or _supabase_pid != os.getpid():
+        # 여러 스레드가 동시에 진입해도 클라이언트는 한 번만 생성
+        with _supabase_init_lock:
+            if _supabase_client is None or _supabase_pid != os.getpid():
+                init_supabase()
     return _supabase_client
 
+# 목록 전체 개수 계산 방식
+# exact: 매 요청 정확히 계산 / planned: 실행계획 추정치 / estimated: 작은 결과는 정확히, 큰 결과는 추정
+# cached: 필터 조합별로 정확한 값을 캐시하고, 해당 테이블 쓰기 또는 TTL 만료 시에만 다시 계산
+#   CACHE_REDIS_URL 이 있으면 캐시와 무효화가 모든 워커에 공유됩니다. 없으면 워커별 메모리 캐시이고
+#   무효화는 쓰기를 처리한 워커에만 적용되므로, 다른 워커는 최대 SUPABASE_COUNT_CACHE_LOCAL_TTL 초 동안
+#   이전 개수(total_count/total_pages)를 돌려줄 수 있습니다.
+COUNT_STRATEGIES = ('exact', 'planned', 'estimated', 'cached')
+COUNT_STRATEGY = os.environ.get('SUPABASE_COUNT_STRATEGY', 'exact').strip().lower()
+if COUNT_STRATEGY not in COUNT_STRATEGIES:
+    logger.warning("알 수 없는 SUPABASE_COUNT_STRATEGY '%s' - exact 사용", COUNT_STRATEGY)
+    COUNT_STRATEGY = 'exact'
+COUNT_CACHE_TTL = float(os.environ.get('SUPABASE_COUNT_CACHE_TTL', 300))
+COUNT_CACHE_LOCAL_TTL = float(os.environ.get('SUPABASE_COUNT_CACHE_LOCAL_TTL', 10))
+
+# '<테이블>:<세대>:<필터 조합>' -> 개수, 'gen:<테이블>' -> 세대
+# 쓰기 시 테이블 세대만 바꾸면 그 테이블의 이전 키는 더 이상 조회되지 않고 TTL 로 만료됩니다.
+def _create_count_cache():
+    return create_cache('list_counts', 4096, COUNT_CACHE_TTL, local_ttl=COUNT_CACHE_LOCAL_TTL)
+
+_count_cache = _create_count_cache()
+
+# gunicorn(preload) 등으로 fork 된 워커는 잠금/클라이언트를 새로 시작
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+# 개수 캐시 키에서 제외할 파라미터 (페이지/정렬은 전체 개수에 영향 없음)
+_COUNT_KEY_IGNORED_PARAMS = ('select', 'order', 'limit', 'offset')
+
+def _count_cache_key(table: str, filters) -> str:
+    """테이블의 현재 세대와 필터 조합으로 개수 캐시 키를 만듭니다."""
+    generation = _count_cache.get(f"gen:{table}") or 0
+    return f"{table}:{generation}:{json.dumps(sorted(filters), ensure_ascii=False)}"
+
+def _query_count_cache_key(query) -> str:
+    """PostgREST 쿼리의 테이블과 필터 파라미터로 개수 캐시 키를 만듭니다."""
+    filters = [
+        [key, value] for key, value in query.params.multi_items()
+        if key not in _COUNT_KEY_IGNORED_PARAMS
+    ]
+    return _count_cache_key(query.path.strip('/'), filters)
+
+def invalidate_count_cache(table: str = None):
+    """테이블(생략 시 전체)의 캐시된 전체 개수를 무효화합니다."""
+    if table is None:
+        _count_cache.clear()
+        return
+    # 세대는 개수 키보다 오래 남아야 하므로 TTL 을 두 배로 둠
+    _count_cache.set(f"gen:{table}", time.time_ns(), ttl=COUNT_CACHE_TTL * 2)
+
+def _invalidate_count_cache_on_write(response: httpx.Response):
+    """PostgREST 쓰기 요청(INSERT/UPDATE/DELETE)이 성공하면 해당 테이블의 개수 캐시를 무효화합니다."""
+    if COUNT_STRATEGY != 'cached':
+        return
+    request = response.request
+    if request.method not in ('POST', 'PATCH', 'PUT', 'DELETE') or response.status_code >= 400:
+        return
+    table = _table_from_path(request.url.path)
+    if table.startswith('rpc/'):
+        return
+    invalidate_count_cache(table)
+
+# 페이지네이션 공통 헬퍼
+def paginate_query(query, page: int, per_page: int, count_strategy: str = None) -> Dict[str, Any]:
+    """select 쿼리에 페이지를 적용해 행과 전체 개수를 한 번의 요청으로 조회합니다.
+
+    전체 개수는 count_strategy(기본: SUPABASE_COUNT_STRATEGY)에 따라 같은 요청의 Prefer 헤더로 받습니다.
+    cached 전략에서 캐시가 유효하면 개수 계산 없이 행만 조회합니다.
+    Range 헤더 대신 limit/offset 파라미터를 사용합니다. (postgrest-py 0.13의 range()는 끝 인덱스를 하나 덜 요청함)
+    반환값: {'data': [...], 'total_count': n, 'total_pages': m, 'page': page, 'per_page': per_page}
+    """
+    page = max(int(page or 1), 1)
+    per_page = max(int(per_page or 1), 1)
+    offset = (page - 1) * per_page
+    strategy = count_strategy or COUNT_STRATEGY
+
+    cache_key = None
+    cached_count = None
+    if strategy == 'cached':
+        cache_key = _query_count_cache_key(query)
+        cached_count = _count_cache.get(cache_key)
+
+    # 개수를 새로 계산해야 하는 경우에만 Prefer: count 헤더 지정
+    if cached_count is None:
+        query.headers['Prefer'] = f"count={'exact' if strategy == 'cached' else strategy}"
+    elif 'Prefer' in query.headers:
+        del query.headers['Prefer']
+
+    query = query.limit(per_page)
+    if offset:
+        query = query.offset(offset)
+
+    try:
+        response = query.execute()
+        rows = response.data or []
+        total_count = response.count
+    except APIError as e:
+        # 전체 개수보다 큰 offset을 요청한 경우 (416 Range Not Satisfiable)
+        if e.code != 'PGRST103':
+            raise
+        query.params = query.params.set('offset', 0).set('limit', 1)
+        response = query.execute()
+        rows = []
+        total_count = response.count
+
+    if cached_count is not None:
+        total_count = cached_count
+    elif total_count is None:
+        total_count = 0
+    elif cache_key is not None:
+        _count_cache.set(cache_key, total_count)
+
+    return {
+        'data': rows,
+        'total_count': total_count,
+        'total_pages': (total_count + per_page - 1) // per_page,
+        'page': page,
+        'per_page': per_page
+    }
+
+# 커서(키셋) 페이지네이션 - (정렬키, id) 기준으로 다음 페이지를 조회 (offset 없이 일정한 비용)
+def encode_cursor(row: Dict[str, Any], sort_by: str) -> str:
+    """행의 (정렬키, id)를 URL에 넣을 수 있는 커서 문자열로 변환합니다."""
+    payload = json.dumps([row.get(sort_by), row.get('id')], ensure_ascii=False, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: Optional[str]) -> Optional[tuple]:
+    """커서 문자열을 (정렬키, id)로 변환합니다. 빈 커서는 첫 페이지(None)입니다."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except Exception:
+        raise ValueError('잘못된 cursor 값입니다.')
+    if row_id is None:
+        raise ValueError('잘못된 cursor 값입니다.')
+    return sort_value, row_id
+
+def apply_or_filter(query, condition: str):
+    """select 쿼리에 or=(조건1,조건2,...) 필터를 추가합니다.
+
+    postgrest-py 0.13 (supabase 2.0.x) 의 select 빌더에는 or_() 가 없어 쿼리 파라미터를 직접 추가합니다.
+    """
+    if hasattr(query, 'or_'):
+        return query.or_(condition)
+    query.params = query.params.add('or', f'({condition})')
+    return query
+
+def _filter_value(value: Any) -> str:
+    """or 필터 문자열에 들어갈 값을 PostgREST 형식으로 변환합니다."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return str(value)
+    text = str(value)
+    if any(ch in text for ch in ',()"\\ '):
+        text = '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+    return text
+
+def order_with_tiebreaker(query, sort_by: str, descending: bool):
+    """(sort_by, id) 순으로 정렬합니다. 정렬키가 같은 행도 id 로 순서가 고정되어 페이지 사이에 중복/누락이 없습니다.
+
+    postgrest-py 0.13 의 order() 는 호출마다 order 파라미터를 따로 추가하므로 한 파라미터로 합쳐서 지정합니다.
+    """
+    direction = 'desc' if descending else 'asc'
+    columns = ['id'] if sort_by == 'id' else [sort_by, 'id']
+    query.params = query.params.set('order', ','.join(f'{column}.{direction}' for column in columns))
+    return query
+
+def keyset_paginate_query(query, sort_by: str, descending: bool, cursor: Optional[str], per_page: int) -> Dict[str, Any]:
+    """정렬되지 않은 select 쿼리에 (sort_by, id) 키셋 조건과 정렬을 적용해 한 페이지를 조회합니다.
+
+    PostgREST 기본 정렬(내림차순은 NULL 먼저, 오름차순은 NULL 나중)에 맞춰 NULL 정렬키도 이어서 조회합니다.
+    반환값: {'data': [...], 'next_cursor': str 또는 None, 'has_more': bool, 'per_page': per_page}
+    잘못된 커서는 ValueError를 발생시킵니다.
+    """
+    per_page = max(int(per_page or 1), 1)
+    position = decode_cursor(cursor)
+
+    if position is not None:
+        sort_value, row_id = position
+        id_op = 'lt' if descending else 'gt'
+        if sort_value is None:
+            if descending:
+                # NULL 구간의 나머지 + NULL이 아닌 모든 행
+                condition = f"and({sort_by}.is.null,id.{id_op}.{row_id}),{sort_by}.not.is.null"
+            else:
+                # 오름차순에서 NULL은 마지막 구간
+                condition = f"and({sort_by}.is.null,id.{id_op}.{row_id})"
+        else:
+            value = _filter_value(sort_value)
+            condition = f"{sort_by}.{id_op}.{value},and({sort_by}.eq.{value},id.{id_op}.{row_id})"
+            # or 조건만으로는 (정렬키, id) 인덱스의 시작 위치를 정할 수 없어, 같은 범위를 단순 비교로 한 번 더 지정
+            # (PostgREST 는 여러 or 파라미터를 AND 로 결합)
+            if descending:
+                query = query.lte(sort_by, sort_value)
+            else:
+                condition += f",{sort_by}.is.null"
+                query = apply_or_filter(query, f"{sort_by}.gte.{value},{sort_by}.is.null")
+        query = apply_or_filter(query, condition)
+
+    query = order_with_tiebreaker(query, sort_by, descending)
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    response = query.limit(per_page + 1).execute()
+    rows = response.data or []
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    return {
+        'data': rows,
+        'next_cursor': encode_cursor(rows[-1], sort_by) if has_more and rows else None,
+        'has_more': has_more,
+        'per_page': per_page
+    }
+
+# 화면별 조회 컬럼 (select('*') 대신)
+# list: 목록/그리드에 표시하는 컬럼 (메모/전화번호는 그리드에 미리보기와 인라인 수정으로 표시되므로 포함)
+# detail: 상세/수정 화면용 전체 컬럼 ('*')
+# DB 에 있는 컬럼만 적습니다. (없는 컬럼이 있으면 PostgREST 가 42703 오류를 반환)
+TABLE_PROJECTIONS = {
+    'employees': {
+        # 비밀번호(해시)는 목록/관리 화면에 내려보내지 않음
+        'list': ('id', 'name', 'email', 'position', 'role', 'team', 'status', 'created_at', 'last_login'),
+    },
+    'maeiple_properties': {
+        'list': ('id', 'check_date', 'building_number', 'room_number', 'status',
+                 'jeonse_price', 'monthly_deposit', 'monthly_rent', 'sale_price', 'is_occupied',
+                 'phone', 'memo', 'likes', 'dislikes',
+                 'employee_id', 'employee_name', 'employee_team', 'created_at'),
+    },
+    'employee_customers': {
+        'list': ('id', 'inquiry_date', 'move_in_date', 'customer_name', 'customer_phone',
+                 'budget', 'rooms', 'location', 'loan_needed', 'parking_needed', 'pets', 'memo', 'status',
+                 'management_site_id', 'employee_id', 'employee_name', 'employee_team', 'created_date',
+                 'unchecked_likes_residence', 'unchecked_likes_business'),
+    },
+    'residence_links': {
+        'list': ('id', 'title', 'url', 'platform', 'added_by', 'date_added', 'memo', 'guarantee_insurance',
+                 'liked', 'disliked', 'is_checked', 'rating', 'management_site_id'),
+        'guarantee': ('id', 'url', 'platform', 'added_by', 'date_added', 'memo'),
+    },
+    'office_links': {
+        'list': ('id', 'title', 'url', 'platform', 'added_by', 'date_added', 'memo', 'guarantee_insurance',
+                 'liked', 'disliked', 'is_checked', 'management_site_id'),
+    },
+}
+
+def projection(table: str, shape: str = 'list', include: tuple = ()) -> str:
+    """테이블/화면별 select 컬럼 문자열을 반환합니다. (정의가 없거나 detail 이면 '*')
+
+    include: 정렬/커서에 필요해 목록 컬럼에 없더라도 함께 조회할 컬럼
+    """
+    columns = TABLE_PROJECTIONS.get(table, {}).get(shape)
+    if not columns:
+        return '*'
+    return ','.join(columns + tuple(name for name in include if name and name not in columns))
+
+# 목록 조회 엔진 - 조회 범위 + 필터 + 정렬 + 페이지(또는 커서)를 한 번의 요청으로 조회
+# 고객/매물 목록 API 는 모두 list_rows() 를 사용하므로 조회 컬럼, 개수 계산, 커서 처리가 한 곳에서 적용됩니다.
+LISTING_SCOPES = {
+    'all': None,                 # 전체 (관리자)
+    'team': 'employee_team',     # 팀 전체 (팀장)
+    'own': 'employee_id',        # 본인 (직원)
+}
+
+# 테이블별 정렬 허용 컬럼과 기본 정렬
+LISTING_SPECS = {
+    'employee_customers': {
+        'sort_columns': ('created_date', 'inquiry_date', 'move_in_date', 'id', 'customer_name', 'status'),
+        'default_sort': ('created_date', 'desc'),
+    },
+    'maeiple_properties': {
+        'sort_columns': ('id', 'check_date', 'building_number', 'room_number', 'status',
+                         'jeonse_price', 'monthly_rent', 'sale_price', 'created_at', 'updated_at'),
+        'default_sort': ('check_date', 'desc'),
+    },
+}
+
+def resolve_sort(table: str, sort_by: str = None, sort_order: str = None, default: tuple = None) -> tuple:
+    """정렬 요청을 (정렬 컬럼, 내림차순 여부)로 정리합니다. 허용되지 않은 컬럼이면 기본 정렬을 사용합니다."""
+    spec = LISTING_SPECS[table]
+    default_by, default_order = default or spec['default_sort']
+    if sort_by not in spec['sort_columns']:
+        return default_by, default_order == 'desc'
+    if sort_order not in ('asc', 'desc'):
+        sort_order = default_order
+    return sort_by, sort_order == 'desc'
+
+def list_rows(table: str, scope: str = 'all', scope_value: str = None, filters: Dict[str, Any] = None,
+              sort_by: str = None, sort_order: str = None, default_sort: tuple = None,
+              page: int = 1, per_page: int = 20, cursor: str = None, shape: str = 'list') -> Optional[Dict[str, Any]]:
+    """범위/필터/정렬/페이지를 적용한 목록을 조회합니다.
+
+    - scope: all(전체) / team(scope_value 팀 전체) / own(scope_value 직원 본인)
+    - filters: {컬럼: 값} 일치 조건 (None/빈 문자열은 무시, 리스트/튜플은 in 조건)
+    - 정렬은 resolve_sort() 로 정리하고, 같은 정렬키는 id 로 순서를 고정합니다.
+    - cursor 가 None 이 아니면(빈 문자열 = 첫 페이지) 커서 페이지네이션, 아니면 page 페이지네이션
+    반환값: paginate_query() 또는 keyset_paginate_query() 결과 (Supabase 미연결 시 None)
+    범위 값이 없거나 커서가 잘못되면 ValueError 를 발생시키고, DB 오류는 그대로 전달합니다.
+    """
+    supabase = get_supabase()
+    if not supabase:
+        return None
+
+    if scope not in LISTING_SCOPES:
+        raise ValueError(f'알 수 없는 조회 범위입니다: {scope}')
+    if scope != 'all' and not scope_value:
+        raise ValueError('팀 정보를 찾을 수 없습니다.' if scope == 'team' else '직원 정보를 찾을 수 없습니다.')
+    sort_by, descending = resolve_sort(table, sort_by, sort_order, default_sort)
+
+    def build_query(columns: str):
+        query = supabase.table(table).select(columns)
+        if scope != 'all':
+            query = query.eq(LISTING_SCOPES[scope], scope_value)
+        for column, value in (filters or {}).items():
+            if value is None or value == '':
+                continue
+            if isinstance(value, (list, tuple, set)):
+                query = query.in_(column, list(value))
+            else:
+                query = query.eq(column, value)
+        return query
+
+    columns = projection(table, shape, include=(sort_by,))
+    if cursor is not None:
+        return keyset_paginate_query(build_query(columns), sort_by, descending, cursor, per_page)
+
+    # DATABASE_URL 직접 연결이 있으면 PostgREST 를 거치지 않고 같은 조건으로 조회 (개수 캐시는 공유)
+    if pg_pool.is_enabled():
+        conditions = [(column, value) for column, value in build_query('id').params.multi_items()
+                      if column not in _COUNT_KEY_IGNORED_PARAMS]
+        try:
+            return _pg_paginate(table, columns, conditions, sort_by, descending, page, per_page)
+        except ConnectionError as e:
+            logger.warning("Postgres 직접 연결 실패 - PostgREST 로 조회합니다: %s", e)
+    return paginate_query(order_with_tiebreaker(build_query(columns), sort_by, descending), page, per_page)
+
+def _pg_condition(column: str, expression: str, sql) -> tuple:
+    """PostgREST 필터 파라미터(eq.값 / in.(a,b))를 (SQL 조건, 파라미터 목록)으로 변환합니다.
+
+    list_rows() 가 만드는 eq / in 조건만 지원합니다. 값은 타입 없이 전달되어 컬럼 타입으로 변환됩니다.
+    """
+    operator, _, value = expression.partition('.')
+    if operator == 'eq':
+        return sql.SQL('{} = %s').format(sql.Identifier(column)), [value]
+    if operator == 'in':
+        items = [item.strip('"') for item in value[1:-1].split(',')] if value[1:-1] else []
+        if not items:
+            return sql.SQL('false'), []
+        placeholders = sql.SQL(', ').join(sql.Placeholder() for _ in items)
+        return sql.SQL('{} IN ({})').format(sql.Identifier(column), placeholders), items
+    raise ValueError(f'직접 연결에서 지원하지 않는 필터입니다: {column}={expression}')
+
+def _pg_paginate(table: str, columns: str, conditions: List[tuple], sort_by: str, descending: bool,
+                 page: int, per_page: int) -> Dict[str, Any]:
+    """paginate_query() 와 같은 결과를 Postgres 직접 연결로 조회합니다.
+
+    conditions 는 PostgREST 필터 파라미터 [(컬럼, 'eq.값'), ...] 이며, 행과 전체 개수를 한 문장으로 조회합니다.
+    전체 개수는 항상 count(*) 로 정확히 계산하며(planned/estimated 전략도 exact 와 같음), cached 전략의 캐시만 공유합니다.
+    행은 json_agg 로 받아 PostgREST 응답과 같은 JSON 값(날짜는 ISO 문자열)이 됩니다.
+    """
+    from psycopg import sql
+
+    page = max(int(page or 1), 1)
+    per_page = max(int(per_page or 1), 1)
+    offset = (page - 1) * per_page
+
+    where_parts, params = [], []
+    for column, expression in conditions:
+        condition, values = _pg_condition(column, expression, sql)
+        where_parts.append(condition)
+        params.extend(values)
+    where = sql.SQL(' WHERE ') + sql.SQL(' AND ').join(where_parts) if where_parts else sql.SQL('')
+
+    select_list = sql.SQL('*') if columns == '*' else sql.SQL(', ').join(sql.Identifier(name) for name in columns.split(','))
+    direction = sql.SQL('DESC' if descending else 'ASC')
+    order = sql.SQL(', ').join(sql.SQL('{} {}').format(sql.Identifier(name), direction)
+                               for name in (['id'] if sort_by == 'id' else [sort_by, 'id']))
+
+    # 개수 캐시 (PostgREST 경로와 같은 키 사용 → 쓰기 시 함께 무효화)
+    cache_key = None
+    cached_count = None
+    if COUNT_STRATEGY == 'cached':
+        cache_key = _count_cache_key(table, [list(condition) for condition in conditions])
+        cached_count = _count_cache.get(cache_key)
+
+    if cached_count is None:
+        count_expression = sql.SQL('(SELECT count(*) FROM {}{})').format(sql.Identifier(table), where)
+        count_params = list(params)
+    else:
+        count_expression = sql.SQL('NULL::bigint')
+        count_params = []
+
+    query = sql.SQL(
+        "SELECT {count} AS total_count, "
+        "COALESCE((SELECT json_agg(page_rows) FROM "
+        "(SELECT {columns} FROM {table}{where} ORDER BY {order} LIMIT %s OFFSET %s) AS page_rows), '[]'::json) AS rows"
+    ).format(count=count_expression, columns=select_list, table=sql.Identifier(table), where=where, order=order)
+
+    row = pg_pool.fetch_one(query, count_params + params + [per_page, offset], label=table)
+
+    total_count = cached_count if cached_count is not None else (row['total_count'] or 0)
+    if cached_count is None and cache_key is not None:
+        _count_cache.set(cache_key, total_count)
+
+    return {
+        'data': row['rows'] or [],
+        'total_count': total_count,
+        'total_pages': (total_count + per_page - 1) // per_page,
+        'page': page,
+        'per_page': per_page
+    }
+
+def listing_payload(result: Optional[Dict[str, Any]], items_key: str, page: int, per_page: int, **extra) -> Dict[str, Any]:
+    """list_rows() 결과를 목록 API 응답 형식으로 변환합니다.
+
+    커서 조회면 next_cursor/has_more, 페이지 조회면 total_count/page/total_pages 를 담고,
+    결과가 없으면(Supabase 미연결) 빈 페이지를 반환합니다. extra 는 응답에 그대로 추가됩니다.
+    """
+    payload = dict(extra)
+    if result is None:
+        payload.update({items_key: [], 'total_count': 0, 'page': page, 'per_page': per_page, 'total_pages': 0})
+    elif 'next_cursor' in result:
+        payload.update({items_key: result['data'], 'per_page': result['per_page'],
+                        'next_cursor': result['next_cursor'], 'has_more': result['has_more']})
+    else:
+        payload.update({items_key: result['data'], 'total_count': result['total_count'], 'page': result['page'],
+                        'per_page': result['per_page'], 'total_pages': result['total_pages']})
+    return payload
+
 # 직원 관련 함수들
 def get_employee_by_name(name: str) -> Optional[Dict[str, Any]]:
     """이름으로 직원을 조회합니다."""
@@ -56,7 +641,7 @@ def get_employee_by_name(name: str) -> Optional[Dict[str, Any]]:
             return response.data[0]
         return None
     except Exception as e:
-        logger.error(f"직원 조회 실패: {e}")
+        logger.error("직원 조회 실패: %s", e)
         return None
 
 def update_employee_last_login(name: str) -> bool:
@@ -72,9 +657,60 @@ def update_employee_last_login(name: str) -> bool:
         supabase.table('employees').update({'last_login': current_time}).eq('name', name).execute()
         return True
     except Exception as e:
-        logger.error(f"마지막 로그인 업데이트 실패: {e}")
+        logger.error("마지막 로그인 업데이트 실패: %s", e)
         return False
 
+# 로그인에 필요한 컬럼만 조회 (select('*') 대신)
+EMPLOYEE_LOGIN_FIELDS = 'id,name,team,role,status,password'
+LOGIN_WRITE_DELAY = float(os.environ.get('LOGIN_WRITE_DELAY', 0.5))
+
+def get_employee_for_login(name: str) -> Optional[Dict[str, Any]]:
+    """로그인 검증용 직원 정보를 조회합니다. (필요한 컬럼만, 한 번의 조회)
+
+    DB 오류는 호출한 쪽에서 처리하도록 예외를 그대로 올립니다.
+    """
+    supabase = get_supabase()
+    if not supabase:
+        raise ConnectionError('데이터베이스 연결이 설정되지 않았습니다.')
+
+    response = supabase.table('employees').select(EMPLOYEE_LOGIN_FIELDS).eq('name', name).limit(1).execute()
+    if response.data:
+        return response.data[0]
+    return None
+
+def record_employee_login(employee_id: int, migrate_password: bool = False, stored_password: Optional[str] = None) -> bool:
+    """로그인 성공 후처리: 마지막 로그인 시간을 기록하고, 평문 비밀번호는 해시로 바꿔 저장합니다.
+
+    비밀번호 변환은 저장된 값이 로그인 때와 같을 때만 적용해, 그 사이 재설정된 비밀번호를 덮어쓰지 않습니다.
+    """
+    try:
+        supabase = get_supabase()
+        if not supabase:
+            return False
+
+        from datetime import datetime
+        supabase.table('employees').update({'last_login': datetime.utcnow().isoformat()}).eq('id', employee_id).execute()
+
+        if migrate_password:
+            query = supabase.table('employees')\
+                .update({'password': password_utils.hash_password(stored_password or password_utils.DEFAULT_PASSWORD)})\
+                .eq('id', employee_id)
+            query = query.is_('password', 'null') if stored_password is None else query.eq('password', stored_password)
+            query.execute()
+            logger.info("직원 ID %s 비밀번호를 해시로 변환", employee_id)
+        return True
+    except Exception as e:
+        logger.error("로그인 기록 실패 (직원 ID %s): %s", employee_id, e)
+        return False
+
+_login_queue = WriteBehindQueue('employee-login', lambda key: record_employee_login(*key), LOGIN_WRITE_DELAY)
+
+def queue_employee_login(employee: Dict[str, Any]):
+    """로그인 후처리(마지막 로그인 시간, 비밀번호 해시 변환)를 백그라운드 대기열에 넣고 바로 반환합니다."""
+    stored_password = employee.get('password')
+    migrate = password_utils.needs_rehash(stored_password)
+    _login_queue.enqueue((employee['id'], migrate, stored_password if migrate else None))
+
 def get_all_employees() -> List[Dict[str, Any]]:
     """모든 직원을 조회합니다."""
     try:
@@ -82,10 +718,10 @@ def get_all_employees() -> List[Dict[str, Any]]:
         if not supabase:
             return []
             
-        response = supabase.table('employees').select('*').order('name').execute()
+        response = supabase.table('employees').select(projection('employees')).order('name').execute()
         return response.data
     except Exception as e:
-        logger.error(f"직원 목록 조회 실패: {e}")
+        logger.error("직원 목록 조회 실패: %s", e)
         return []
 
 # 고객 관련 함수들
@@ -99,7 +735,7 @@ def get_all_customers() -> List[Dict[str, Any]]:
         response = supabase.table('employee_customers').select('*').order('created_date', desc=True).execute()
         return response.data
     except Exception as e:
-        logger.error(f"고객 목록 조회 실패: {e}")
+        logger.error("고객 목록 조회 실패: %s", e)
         return []
 
 def create_customer(customer_data: Dict[str, Any]) -> bool:
@@ -112,34 +748,31 @@ def create_customer(customer_data: Dict[str, Any]) -> bool:
         supabase.table('employee_customers').insert(customer_data).execute()
         return True
     except Exception as e:
-        logger.error(f"고객 생성 실패: {e}")
+        logger.error("고객 생성 실패: %s", e)
         return False
 
-def get_employees_with_pagination(page: int, per_page: int) -> Optional[Dict[str, Any]]:
-    """페이지네이션을 적용하여 직원 목록을 조회합니다."""
+def get_employees_with_pagination(page: int, per_page: int, team: str = None, roles: tuple = None) -> Optional[Dict[str, Any]]:
+    """페이지네이션을 적용하여 직원 목록을 조회합니다. (team/roles 지정 시 DB 에서 필터링)"""
     try:
         supabase = get_supabase()
         if not supabase:
             return None
             
-        # 전체 개수 조회
-        count_response = supabase.table('employees').select('id', count='exact').execute()
-        total_count = count_response.count if count_response.count is not None else 0
+        # 데이터와 전체 개수를 한 번에 조회
+        query = supabase.table('employees').select(projection('employees'))
+        if team is not None:
+            query = query.eq('team', team)
+        if roles:
+            query = query.in_('role', list(roles))
+        result = paginate_query(order_with_tiebreaker(query, 'created_at', True), page, per_page)
         
-        # 페이지네이션 적용한 데이터 조회
-        offset = (page - 1) * per_page
-        response = supabase.table('employees').select('*').order('created_at', desc=True).range(offset, offset + per_page - 1).execute()
-        
-        if response.data is not None:
-            total_pages = (total_count + per_page - 1) // per_page
-            return {
-                'employees': response.data,
-                'total_count': total_count,
-                'total_pages': total_pages
-            }
-        return None
+        return {
+            'employees': result['data'],
+            'total_count': result['total_count'],
+            'total_pages': result['total_pages']
+        }
     except Exception as e:
-        logger.error(f"직원 목록 페이지네이션 조회 실패: {e}")
+        logger.error("직원 목록 페이지네이션 조회 실패: %s", e)
         return None
 
 def add_employee(name: str, email: str, team: str, position: str, role: str, status: str = 'active', password: str = '1234') -> Optional[Dict[str, Any]]:
@@ -152,7 +785,7 @@ def add_employee(name: str, email: str, team: str, position: str, role: str, sta
         # 중복 이름 체크
         existing = supabase.table('employees').select('id').eq('name', name).execute()
         if existing.data:
-            logger.warning(f"이미 존재하는 직원 이름: {name}")
+            logger.warning("이미 존재하는 직원 이름: %s", name)
             return None
             
         # 새 직원 데이터 (created_at은 Supabase에서 자동 설정)
@@ -163,18 +796,19 @@ def add_employee(name: str, email: str, team: str, position: str, role: str, sta
             'position': position,
             'role': role,
             'status': status,
-            'password': password
+            'password': password_utils.hash_password(password)
         }
         
         # 직원 추가
         response = supabase.table('employees').insert(employee_data).execute()
         
         if response.data:
-            logger.info(f"직원 추가 성공: {name}")
-            return response.data[0]
+            logger.info("직원 추가 성공: %s", name)
+            # 응답/로그에 비밀번호 해시가 나가지 않도록 제외
+            return {key: value for key, value in response.data[0].items() if key != 'password'}
         return None
     except Exception as e:
-        logger.error(f"직원 추가 실패: {e}")
+        logger.error("직원 추가 실패: %s", e)
         return None
 
 def update_customer(customer_id: int, customer_data: Dict[str, Any]) -> bool:
@@ -187,7 +821,7 @@ def update_customer(customer_id: int, customer_data: Dict[str, Any]) -> bool:
         supabase.table('employee_customers').update(customer_data).eq('id', customer_id).execute()
         return True
     except Exception as e:
-        logger.error(f"고객 업데이트 실패: {e}")
+        logger.error("고객 업데이트 실패: %s", e)
         return False
 
 def delete_customer(customer_id: int) -> bool:
@@ -200,7 +834,7 @@ def delete_customer(customer_id: int) -> bool:
         supabase.table('employee_customers').delete().eq('id', customer_id).execute()
         return True
     except Exception as e:
-        logger.error(f"고객 삭제 실패: {e}")
+        logger.error("고객 삭제 실패: %s", e)
         return False
 
 # 매물 관련 함수들
@@ -214,110 +848,43 @@ def get_maeiple_properties() -> List[Dict[str, Any]]:
         response = supabase.table('maeiple_properties').select('*').order('check_date', desc=True).execute()
         return response.data
     except Exception as e:
-        logger.error(f"매물 목록 조회 실패: {e}")
+        logger.error("매물 목록 조회 실패: %s", e)
         return []
 
-def get_maeiple_properties_with_pagination(page: int, per_page: int, employee_id: str = None, sort_by: str = 'check_date', sort_order: str = 'desc') -> Optional[Dict[str, Any]]:
-    """페이지네이션을 적용하여 매물 목록을 조회합니다."""
-    try:
-        supabase = get_supabase()
-        if not supabase:
-            return None
-            
-        # 정렬 방향 설정
-        order_direction = 'desc' if sort_order == 'desc' else 'asc'
-        
-        # 기본 쿼리 구성
-        query = supabase.table('maeiple_properties').select('*')
-        
-        # 직원 ID가 지정된 경우 필터링
-        if employee_id:
-            query = query.eq('employee_id', employee_id)
-        
-        # 정렬 적용
-        if sort_by == 'check_date':
-            query = query.order('check_date', desc=(order_direction == 'desc'))
-        elif sort_by == 'building_number':
-            query = query.order('building_number', desc=(order_direction == 'desc'))
-        elif sort_by == 'room_number':
-            query = query.order('room_number', desc=(order_direction == 'desc'))
-        elif sort_by == 'status':
-            query = query.order('status', desc=(order_direction == 'desc'))
-        elif sort_by == 'jeonse_price':
-            query = query.order('jeonse_price', desc=(order_direction == 'desc'))
-        elif sort_by == 'monthly_rent':
-            query = query.order('monthly_rent', desc=(order_direction == 'desc'))
-        elif sort_by == 'sale_price':
-            query = query.order('sale_price', desc=(order_direction == 'desc'))
-        else:
-            # 기본 정렬
-            query = query.order('check_date', desc=True)
-        
-        # 전체 개수 조회
-        count_query = supabase.table('maeiple_properties').select('id', count='exact')
-        if employee_id:
-            count_query = count_query.eq('employee_id', employee_id)
-        count_response = count_query.execute()
-        total_count = count_response.count if count_response.count is not None else 0
-        
-        # 페이지네이션 적용
-        offset = (page - 1) * per_page
-        response = query.range(offset, offset + per_page - 1).execute()
-        
-        if response.data is not None:
-            total_pages = (total_count + per_page - 1) // per_page
-            return {
-                'properties': response.data,
-                'total_count': total_count,
-                'total_pages': total_pages
-            }
-        return None
-    except Exception as e:
-        logger.error(f"매물 목록 페이지네이션 조회 실패: {e}")
-        return None
-
 def get_maeiple_property(property_id: int) -> Optional[Dict[str, Any]]:
-    """특정 매물을 조회합니다."""
+    """특정 매물을 조회합니다. (상세 화면용 전체 컬럼)"""
     try:
         supabase = get_supabase()
         if not supabase:
             return None
             
-        response = supabase.table('maeiple_properties').select('*').eq('id', property_id).execute()
+        response = supabase.table('maeiple_properties').select(projection('maeiple_properties', 'detail')).eq('id', property_id).execute()
         if response.data:
             return response.data[0]
         return None
     except Exception as e:
-        logger.error(f"매물 조회 실패: {e}")
+        logger.error("매물 조회 실패: %s", e)
         return None
 
 def create_maeiple_property(property_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """새 매물을 생성하고 생성된 레코드를 반환합니다."""
     try:
-        logger.info(f"매물 생성 시도: {property_data}")
-        
         supabase = get_supabase()
         if not supabase:
             logger.error("Supabase 클라이언트를 가져올 수 없습니다")
             return None
             
-        logger.info("Supabase 테이블에 데이터 삽입 시도...")
         response = supabase.table('maeiple_properties').insert(property_data).execute()
         
-        logger.info(f"Supabase 응답: {response}")
-        
         if response.data and len(response.data) > 0:
-            logger.info(f"매물 생성 성공: {response.data[0]}")
+            logger.info("매물 생성 성공: ID %s", response.data[0].get('id'))
             return response.data[0]
         else:
-            logger.error(f"매물 생성 실패: 응답 데이터가 비어있음. 전체 응답: {response}")
+            logger.error("매물 생성 실패: 응답 데이터가 비어있음")
             return None
             
     except Exception as e:
-        logger.error(f"매물 생성 실패: {e}")
-        logger.error(f"매물 데이터: {property_data}")
-        import traceback
-        logger.error(f"스택 트레이스: {traceback.format_exc()}")
+        logger.exception("매물 생성 실패: %s", e)
         return None
 
 def update_maeiple_property(property_id: int, property_data: Dict[str, Any]) -> bool:
@@ -330,7 +897,7 @@ def update_maeiple_property(property_id: int, property_data: Dict[str, Any]) ->
         supabase.table('maeiple_properties').update(property_data).eq('id', property_id).execute()
         return True
     except Exception as e:
-        logger.error(f"매물 업데이트 실패: {e}")
+        logger.error("매물 업데이트 실패: %s", e)
         return False
 
 def delete_maeiple_property(property_id: int) -> bool:
@@ -343,9 +910,69 @@ def delete_maeiple_property(property_id: int) -> bool:
         supabase.table('maeiple_properties').delete().eq('id', property_id).execute()
         return True
     except Exception as e:
-        logger.error(f"매물 삭제 실패: {e}")
+        logger.error("매물 삭제 실패: %s", e)
         return False
 
+# 매물 일괄 처리 - in_() 필터에 한 번에 넣을 id 개수 (URL 길이 제한 대비)
+MAEIPLE_BULK_CHUNK_SIZE = 200
+
+def _normalize_property_ids(property_ids: List[Any]) -> tuple:
+    """매물 ID 목록을 정수로 변환하고 중복을 제거합니다. 반환값: (유효한 ID 목록, {잘못된 ID: 오류})"""
+    valid_ids = []
+    failed = {}
+    for raw_id in property_ids:
+        try:
+            property_id = int(raw_id)
+        except (TypeError, ValueError):
+            failed[str(raw_id)] = '잘못된 매물 ID'
+            continue
+        if property_id not in valid_ids:
+            valid_ids.append(property_id)
+    return valid_ids, failed
+
+def _bulk_apply_maeiple(property_ids: List[Any], apply, team_name: str = None) -> Dict[str, Any]:
+    """매물 ID를 청크로 나눠 apply(쿼리 빌더 -> 실행할 쿼리)를 in_ 필터로 적용하고 ID별 결과를 반환합니다.
+
+    team_name이 주어지면 해당 팀 매물에만 적용합니다. (팀장 권한 확인을 필터로 처리)
+    반환값: {'succeeded': [id, ...], 'failed': {id: 오류, ...}}
+    """
+    valid_ids, failed = _normalize_property_ids(property_ids)
+    succeeded = []
+
+    supabase = get_supabase()
+    if not supabase:
+        for property_id in valid_ids:
+            failed[property_id] = 'DB 연결 실패'
+        return {'succeeded': succeeded, 'failed': failed}
+
+    for start in range(0, len(valid_ids), MAEIPLE_BULK_CHUNK_SIZE):
+        chunk = valid_ids[start:start + MAEIPLE_BULK_CHUNK_SIZE]
+        try:
+            query = apply(supabase.table('maeiple_properties')).in_('id', chunk)
+            if team_name:
+                query = query.eq('employee_team', team_name)
+            response = query.execute()
+            done_ids = {row.get('id') for row in (response.data or [])}
+            for property_id in chunk:
+                if property_id in done_ids:
+                    succeeded.append(property_id)
+                else:
+                    failed[property_id] = '매물을 찾을 수 없거나 권한이 없습니다.'
+        except Exception as e:
+            logger.error("매물 일괄 처리 실패 (%s개): %s", len(chunk), e)
+            for property_id in chunk:
+                failed[property_id] = str(e)
+
+    return {'succeeded': succeeded, 'failed': failed}
+
+def bulk_update_maeiple_properties(property_ids: List[Any], update_data: Dict[str, Any], team_name: str = None) -> Dict[str, Any]:
+    """여러 매물을 한 번에 수정합니다. (청크당 1회 요청)"""
+    return _bulk_apply_maeiple(property_ids, lambda table: table.update(update_data), team_name)
+
+def bulk_delete_maeiple_properties(property_ids: List[Any], team_name: str = None) -> Dict[str, Any]:
+    """여러 매물을 한 번에 삭제합니다. (청크당 1회 요청)"""
+    return _bulk_apply_maeiple(property_ids, lambda table: table.delete(), team_name)
+
 def update_maeiple_likes(property_id: int, likes: int, dislikes: int) -> bool:
     """매물의 좋아요/싫어요를 업데이트합니다."""
     try:
@@ -359,7 +986,7 @@ def update_maeiple_likes(property_id: int, likes: int, dislikes: int) -> bool:
         }).eq('id', property_id).execute()
         return True
     except Exception as e:
-        logger.error(f"좋아요 업데이트 실패: {e}")
+        logger.error("좋아요 업데이트 실패: %s", e)
         return False
 
 # 링크 관련 함수들
@@ -373,7 +1000,7 @@ def get_residence_links() -> List[Dict[str, Any]]:
         response = supabase.table('residence_links').select('*').order('id').execute()
         return response.data
     except Exception as e:
-        logger.error(f"주거용 링크 조회 실패: {e}")
+        logger.error("주거용 링크 조회 실패: %s", e)
         return []
 
 def get_office_links() -> List[Dict[str, Any]]:
@@ -386,88 +1013,250 @@ def get_office_links() -> List[Dict[str, Any]]:
         response = supabase.table('office_links').select('*').order('id').execute()
         return response.data
     except Exception as e:
-        logger.error(f"업무용 링크 조회 실패: {e}")
+        logger.error("업무용 링크 조회 실패: %s", e)
         return []
 
-# 작업 관련 함수들 (maeiple_tasks 테이블 제거로 인해 삭제됨)
+# 미확인 좋아요 집계 (링크 종류 -> 테이블)
+UNCHECKED_LIKES_TABLES = {
+    'residence': 'residence_links',
+    'business': 'office_links'
+}
+
+# 미확인 좋아요 카운터 (링크 종류 -> employee_customers 컬럼, sql/unchecked_likes_counters.sql 트리거가 유지)
+UNCHECKED_LIKES_COLUMNS = {
+    'residence': 'unchecked_likes_residence',
+    'business': 'unchecked_likes_business'
+}
+
+# in_() 필터에 한 번에 넣을 management_site_id 개수 (URL 길이 제한 대비)
+UNCHECKED_LIKES_CHUNK_SIZE = 200
+
+# 한 번에 조회할 수 있는 management_site_id 최대 개수 (목록 API 의 가장 큰 per_page 와 같음)
+UNCHECKED_LIKES_BATCH_LIMIT = 1000
+
+async def _fetch_unchecked_likes_counters(site_ids: List[str]) -> List[Dict[str, Any]]:
+    """site_ids 고객들의 저장된 미확인 좋아요 카운터를 조회합니다."""
+    import supabase_async
+
+    columns = ','.join(('management_site_id',) + tuple(UNCHECKED_LIKES_COLUMNS.values()))
+    response = await supabase_async.table('employee_customers').select(columns)\
+        .in_('management_site_id', site_ids)\
+        .execute()
+    return response.data or []
+
+def get_unchecked_likes_counts(management_site_ids: List[str]) -> Dict[str, Dict[str, int]]:
+    """여러 고객의 미확인 좋아요 수를 employee_customers 에 저장된 카운터에서 읽습니다.
+
+    링크 행을 세지 않으므로 비용은 좋아요 수가 아니라 고객 수에 비례합니다.
+    고객 묶음(UNCHECKED_LIKES_CHUNK_SIZE)별 쿼리를 동시에 실행합니다.
+    반환값: {management_site_id: {'residence': 개수, 'business': 개수}}
+    """
+    import supabase_async
+
+    site_ids = list(dict.fromkeys(sid for sid in management_site_ids if sid))
+    counts = {sid: {link_type: 0 for link_type in UNCHECKED_LIKES_COLUMNS} for sid in site_ids}
+    if not site_ids:
+        return counts
 
-# 대시보드 통계
-def get_dashboard_stats() -> Dict[str, Any]:
-    """대시보드 통계를 조회합니다."""
     try:
-        supabase = get_supabase()
-        if not supabase:
-            return {}
-        
-        # 고객 수
-        customers_response = supabase.table('employee_customers').select('id', count='exact').execute()
-        customer_count = customers_response.count if hasattr(customers_response, 'count') else 0
-        
-        # 매물 수
-        properties_response = supabase.table('maeiple_properties').select('id', count='exact').execute()
-        property_count = properties_response.count if hasattr(properties_response, 'count') else 0
-        
-        return {
-            'customers': customer_count,
-            'properties': property_count
-        }
+        if not get_supabase():
+            return counts
+
+        results = supabase_async.gather(
+            *(_fetch_unchecked_likes_counters(site_ids[start:start + UNCHECKED_LIKES_CHUNK_SIZE])
+              for start in range(0, len(site_ids), UNCHECKED_LIKES_CHUNK_SIZE)),
+            return_exceptions=True
+        )
+
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("미확인 좋아요 카운터 조회 실패: %s", result)
+                continue
+            for row in result:
+                sid = row.get('management_site_id')
+                if sid in counts:
+                    counts[sid] = {link_type: row.get(column) or 0 for link_type, column in UNCHECKED_LIKES_COLUMNS.items()}
+
+        return counts
     except Exception as e:
-        logger.error(f"대시보드 통계 조회 실패: {e}")
-        return {}
+        logger.error("미확인 좋아요 집계 실패: %s", e)
+        return counts
+
+# 고객 사이트용 고객 요약 캐시 (management_site_id -> 요약)
+# - CACHE_REDIS_URL 설정 시: 워커끼리 공유되는 Redis 캐시 (CUSTOMER_CACHE_TTL, 수정/삭제 즉시 모든 워커에 반영)
+# - 미설정 시: 워커별 메모리 캐시 (CUSTOMER_CACHE_LOCAL_TTL)
+#   수정/삭제는 요청을 처리한 워커의 캐시만 지우므로, 다른 워커는 최대 CUSTOMER_CACHE_LOCAL_TTL 초 동안
+#   이전 요약(이름/입주일)을 보여줄 수 있습니다. 고객 사이트 표시용 정보라 이 정도 지연은 허용합니다.
+CUSTOMER_SUMMARY_FIELDS = ('id', 'customer_name', 'move_in_date', 'management_site_id', 'employee_id')
+CUSTOMER_CACHE_TTL = float(os.environ.get('CUSTOMER_CACHE_TTL', 300))
+CUSTOMER_CACHE_LOCAL_TTL = float(os.environ.get('CUSTOMER_CACHE_LOCAL_TTL', 30))
+CUSTOMER_CACHE_SIZE = int(os.environ.get('CUSTOMER_CACHE_SIZE', 2048))
+_customer_summary_cache = create_cache('customer_summary', CUSTOMER_CACHE_SIZE, CUSTOMER_CACHE_TTL,
+                                       local_ttl=CUSTOMER_CACHE_LOCAL_TTL)
 
-def get_customers_with_pagination(page: int, per_page: int, employee_id: str = None, all_employees: bool = False) -> Optional[Dict[str, Any]]:
-    """페이지네이션을 적용하여 고객 목록을 조회합니다."""
+def get_customer_summary(management_site_id: str) -> Optional[Dict[str, Any]]:
+    """management_site_id로 고객 요약 정보를 조회합니다. (캐시 우선, 없으면 DB 조회 후 캐시)
+
+    고객이 없으면 None을 반환하고, DB 오류는 호출한 쪽에서 처리하도록 예외를 그대로 올립니다.
+    """
+    if not management_site_id:
+        return None
+
+    cached = _customer_summary_cache.get(management_site_id)
+    if cached is not None:
+        return cached
+
+    supabase = get_supabase()
+    if not supabase:
+        raise ConnectionError('데이터베이스 연결이 설정되지 않았습니다.')
+
+    response = supabase.table('employee_customers').select(','.join(CUSTOMER_SUMMARY_FIELDS)).eq('management_site_id', management_site_id).limit(1).execute()
+    if not response.data:
+        return None
+
+    customer = response.data[0]
+    summary = {field: customer[field] for field in CUSTOMER_SUMMARY_FIELDS if field in customer}
+    _customer_summary_cache.set(management_site_id, summary)
+    return summary
+
+def invalidate_customer_summary(management_site_id: str):
+    """고객 요약 캐시에서 해당 management_site_id를 제거합니다."""
+    if management_site_id:
+        _customer_summary_cache.delete(management_site_id)
+
+def invalidate_customer_summaries(rows: List[Dict[str, Any]]):
+    """수정/삭제 응답으로 받은 고객 행들의 요약 캐시를 제거합니다."""
+    for row in rows or []:
+        invalidate_customer_summary(row.get('management_site_id'))
+
+# 고객 사이트 방문 시 미확인 좋아요 확인 처리 (백그라운드 쓰기)
+MARK_CHECKED_DELAY = float(os.environ.get('MARK_CHECKED_DELAY', 0.5))
+
+def mark_likes_checked(link_type: str, management_site_id: str) -> bool:
+    """고객의 미확인 좋아요를 확인 처리합니다. (link_type: 'residence' 또는 'business')"""
     try:
         supabase = get_supabase()
         if not supabase:
-            return None
-            
-        # 전체 개수 조회
-        if all_employees:
-            count_response = supabase.table('employee_customers').select('id', count='exact').execute()
-        else:
-            count_response = supabase.table('employee_customers').select('id', count='exact').eq('employee_id', employee_id).execute()
-        
-        total_count = count_response.count if count_response.count is not None else 0
-        
-        # 페이지네이션 적용한 데이터 조회
-        offset = (page - 1) * per_page
-        if all_employees:
-            response = supabase.table('employee_customers').select('*').order('created_date', desc=True).range(offset, offset + per_page - 1).execute()
-        else:
-            response = supabase.table('employee_customers').select('*').eq('employee_id', employee_id).order('created_date', desc=True).range(offset, offset + per_page - 1).execute()
-        
-        if response.data is not None:
-            total_pages = (total_count + per_page - 1) // per_page
-            return {
-                'customers': response.data,
-                'total_count': total_count,
-                'total_pages': total_pages
-            }
-        return None
+            return False
+
+        table_name = UNCHECKED_LIKES_TABLES[link_type]
+        supabase.table(table_name).update({'is_checked': True})\
+            .eq('management_site_id', management_site_id)\
+            .eq('liked', True)\
+            .eq('is_checked', False)\
+            .execute()
+        return True
     except Exception as e:
-        logger.error(f"고객 목록 페이지네이션 조회 실패: {e}")
-        return None
+        logger.error("미확인 좋아요 확인 처리 실패 (%s, %s): %s", link_type, management_site_id, e)
+        return False
+
+_mark_checked_queue = WriteBehindQueue('mark-likes-checked', lambda key: mark_likes_checked(*key), MARK_CHECKED_DELAY)
+
+def queue_mark_likes_checked(link_type: str, management_site_id: str):
+    """미확인 좋아요 확인 처리를 백그라운드 대기열에 넣고 바로 반환합니다. (같은 고객의 반복 요청은 한 번만 처리)"""
+    if link_type not in UNCHECKED_LIKES_TABLES or not management_site_id:
+        return
+    _mark_checked_queue.enqueue((link_type, management_site_id))
+
+# 작업 관련 함수들 (maeiple_tasks 테이블 제거로 인해 삭제됨)
+
+# 대시보드 통계
+# 대시보드 통계 (sql/dashboard_stats.sql 의 dashboard_stats() 함수) - 조회 범위별로 잠시 캐시
+DASHBOARD_STATS_TTL = float(os.environ.get('DASHBOARD_STATS_TTL', 30))
+DASHBOARD_STATS_DAYS = 30
+_dashboard_stats_cache = create_cache('dashboard_stats', 256, DASHBOARD_STATS_TTL)
+
+def _is_missing_function(error: Exception) -> bool:
+    """DB 에 아직 함수가 없어 생긴 오류인지 확인합니다. (PostgREST PGRST202 / Postgres 42883)"""
+    return getattr(error, 'code', None) in ('PGRST202', '42883') or getattr(error, 'sqlstate', None) == '42883'
+
+def _count_dashboard_totals(scope: str, scope_value: Optional[str]) -> Dict[str, Any]:
+    """범위 안의 고객 수 / 매물 수만 동시에 조회합니다. (행은 받지 않고 개수만)"""
+    import supabase_async
+
+    def count_query(table: str):
+        query = supabase_async.table(table).select('id', count='exact')
+        if scope != 'all':
+            query = query.eq(LISTING_SCOPES[scope], scope_value)
+        return query.limit(1)
+
+    customers_response, properties_response = supabase_async.gather(
+        count_query('employee_customers'),
+        count_query('maeiple_properties')
+    )
+    return {
+        'customers': customers_response.count or 0,
+        'properties': properties_response.count or 0
+    }
+
+def _fetch_dashboard_stats(scope: str, scope_value: Optional[str], days: int) -> Dict[str, Any]:
+    stats = None
+    try:
+        # DATABASE_URL 직접 연결이 있으면 같은 함수를 직접 호출
+        if pg_pool.is_enabled():
+            try:
+                row = pg_pool.fetch_one("SELECT dashboard_stats(%s, %s, %s) AS stats", (scope, scope_value, days),
+                                        label='rpc/dashboard_stats')
+                stats = row['stats']
+            except ConnectionError as e:
+                logger.warning("Postgres 직접 연결 실패 - PostgREST 로 조회합니다: %s", e)
+        if stats is None:
+            supabase = get_supabase()
+            if not supabase:
+                return {}
+            stats = supabase.rpc('dashboard_stats', {'p_scope': scope, 'p_value': scope_value, 'p_days': days}).execute().data
+    except Exception as e:
+        if not _is_missing_function(e):
+            raise
+        logger.warning("dashboard_stats() 함수가 없어 전체 개수만 조회합니다. (sql/dashboard_stats.sql 적용 필요)")
+        return _count_dashboard_totals(scope, scope_value)
+
+    stats = dict(stats or {})
+    by_status = stats.get('by_status') or []
+    stats['customers'] = sum(item['count'] for item in by_status if item['entity'] == 'customers')
+    stats['properties'] = sum(item['count'] for item in by_status if item['entity'] == 'properties')
+    return stats
+
+def get_dashboard_stats(scope: str = 'all', scope_value: str = None, days: int = DASHBOARD_STATS_DAYS) -> Dict[str, Any]:
+    """대시보드 통계를 한 번의 요청으로 조회합니다.
+
+    scope 는 list_rows() 와 같은 조회 범위(all / team / own)이며, 결과는 범위별로 DASHBOARD_STATS_TTL 초 동안 캐시합니다.
+    반환값: {'customers': n, 'properties': m, 'by_status': [...], 'by_team': [...], 'by_employee': [...],
+             'likes': {...}, 'new_per_day': [...]}
+    dashboard_stats() 함수가 아직 DB 에 없으면 customers / properties 개수만 반환합니다.
+    """
+    if scope not in LISTING_SCOPES:
+        raise ValueError(f'알 수 없는 조회 범위입니다: {scope}')
+    if scope != 'all' and not scope_value:
+        raise ValueError('팀 정보를 찾을 수 없습니다.' if scope == 'team' else '직원 정보를 찾을 수 없습니다.')
+    scope_value = None if scope == 'all' else str(scope_value)
+
+    cache_key = f"{scope}:{scope_value or ''}:{days}"
+    cached = _dashboard_stats_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        stats = _fetch_dashboard_stats(scope, scope_value, days)
+    except Exception as e:
+        logger.error("대시보드 통계 조회 실패: %s", e)
+        return {}
+
+    if stats:
+        _dashboard_stats_cache.set(cache_key, stats)
+    return stats
 
 def add_customer(customer_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """새 고객을 추가합니다."""
     try:
         supabase = get_supabase()
         if not supabase:
-            logger.error("[ERROR] Supabase 연결 실패")
+            logger.error("Supabase 연결 실패")
             return None
-            
-        # 고객 추가 전 데이터 확인
-        logger.info(f"[DEBUG] 고객 추가 시도: {customer_data.get('customer_name', 'Unknown')}")
-        logger.info(f"[DEBUG] 전체 고객 데이터: {customer_data}")
-        
-        # 데이터 필드 상세 확인
-        for key, value in customer_data.items():
-            logger.info(f"[DEBUG] 필드 {key}: {value} (타입: {type(value)})")
         
         # 필수 필드 확인
         if not customer_data.get('customer_name'):
-            logger.error("[ERROR] 고객명이 없습니다")
+            logger.error("고객명이 없습니다")
             return None
         
         # boolean 필드 안전 처리 (loan_needed, parking_needed만)
@@ -502,29 +1291,22 @@ def add_customer(customer_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             else:
                 customer_data[int_field] = 0
         
-        logger.info(f"[DEBUG] Supabase insert 시작")
         response = supabase.table('employee_customers').insert(customer_data).execute()
         
-        logger.info(f"[DEBUG] Supabase 응답: {response}")
-        logger.info(f"[DEBUG] 응답 데이터: {response.data}")
-        
         if response.data and len(response.data) > 0:
             new_customer = response.data[0]
             customer_name = customer_data.get('customer_name', 'Unknown')
             
-            logger.info(f"[SUCCESS] 고객 추가 성공: {customer_name}, ID: {new_customer.get('id')}")
+            logger.info("고객 추가 성공: %s, ID: %s", customer_name, new_customer.get('id'))
             
             return new_customer
         else:
-            logger.error(f"[ERROR] 고객 추가 실패: response.data가 비어있음")
+            logger.error("고객 추가 실패: response.data가 비어있음")
             return None
     except Exception as e:
-        logger.error(f"[ERROR] 고객 추가 실패: {e}")
-        logger.error(f"[ERROR] 고객 데이터 타입별 상세:")
-        for key, value in customer_data.items():
-            logger.error(f"[ERROR]   {key}: {repr(value)} (type: {type(value)})")
-        import traceback
-        traceback.print_exc()
+        logger.exception("고객 추가 실패: %s", e)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("고객 데이터 필드 타입: %s", {key: type(value).__name__ for key, value in customer_data.items()})
         return None
 
 
@@ -547,7 +1329,7 @@ def get_guarantee_insurance_links(limit: int = 20) -> List[Dict[str, Any]]:
         try:
             # residence_links 테이블에서 guarantee_insurance 컬럼이 있는 경우
             response = supabase.table('residence_links')\
-                .select('*')\
+                .select(projection('residence_links', 'guarantee'))\
                 .eq('guarantee_insurance', True)\
                 .gte('date_added', one_month_ago)\
                 .order('id', desc=True)\
@@ -558,7 +1340,7 @@ def get_guarantee_insurance_links(limit: int = 20) -> List[Dict[str, Any]]:
             # guarantee_insurance 컬럼이 없는 경우 1달 이내 모든 주거용 링크 반환
             try:
                 response = supabase.table('residence_links')\
-                    .select('*')\
+                    .select(projection('residence_links', 'guarantee'))\
                     .gte('date_added', one_month_ago)\
                     .order('id', desc=True)\
                     .limit(limit)\
@@ -570,7 +1352,7 @@ def get_guarantee_insurance_links(limit: int = 20) -> List[Dict[str, Any]]:
                 return []
                 
     except Exception as e:
-        logger.error(f"보증보험 매물 목록 조회 실패: {e}")
+        logger.error("보증보험 매물 목록 조회 실패: %s", e)
         return []
 
 def check_employee_exists(name: str) -> bool:
@@ -583,7 +1365,7 @@ def check_employee_exists(name: str) -> bool:
         response = supabase.table('employees').select('id, name').eq('name', name).execute()
         return len(response.data) > 0
     except Exception as e:
-        logger.error(f"직원 존재 확인 실패: {e}")
+        logger.error("직원 존재 확인 실패: %s", e)
         return False
 
 def get_maeiple_properties(limit: int = 50) -> List[Dict[str, Any]]:
@@ -596,7 +1378,7 @@ def get_maeiple_properties(limit: int = 50) -> List[Dict[str, Any]]:
         response = supabase.table('maeiple_properties').select('*').order('id', desc=True).limit(limit).execute()
         return response.data
     except Exception as e:
-        logger.error(f"메이플 아파트 매물 목록 조회 실패: {e}")
+        logger.error("메이플 아파트 매물 목록 조회 실패: %s", e)
         return []
 
 def get_team_customers(team_leader_id: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -609,7 +1391,7 @@ def get_team_customers(team_leader_id: str, limit: int = 50) -> List[Dict[str, A
         response = supabase.table('employee_customers').select('*').eq('employee_id', team_leader_id).order('created_date', desc=True).limit(limit).execute()
         return response.data
     except Exception as e:
-        logger.error(f"팀 고객 목록 조회 실패: {e}")
+        logger.error("팀 고객 목록 조회 실패: %s", e)
         return []
 
 def get_team_maeiple_properties(team_leader_id: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -622,7 +1404,7 @@ def get_team_maeiple_properties(team_leader_id: str, limit: int = 50) -> List[Di
         response = supabase.table('maeiple_properties').select('*').eq('employee_id', team_leader_id).order('id', desc=True).limit(limit).execute()
         return response.data
     except Exception as e:
-        logger.error(f"팀 메이플 아파트 매물 목록 조회 실패: {e}")
+        logger.error("팀 메이플 아파트 매물 목록 조회 실패: %s", e)
         return []
 
 def update_maeiple_property(property_id: int, update_data: Dict[str, Any]) -> bool:
@@ -635,7 +1417,7 @@ def update_maeiple_property(property_id: int, update_data: Dict[str, Any]) -> bo
         supabase.table('maeiple_properties').update(update_data).eq('id', property_id).execute()
         return True
     except Exception as e:
-        logger.error(f"메이플 아파트 매물 업데이트 실패: {e}")
+        logger.error("메이플 아파트 매물 업데이트 실패: %s", e)
         return False
 
 def add_maeiple_memo(property_id: int, memo: str) -> bool:
@@ -648,7 +1430,7 @@ def add_maeiple_memo(property_id: int, memo: str) -> bool:
         supabase.table('maeiple_properties').update({'memo': memo}).eq('id', property_id).execute()
         return True
     except Exception as e:
-        logger.error(f"메이플 아파트 매물 메모 추가 실패: {e}")
+        logger.error("메이플 아파트 매물 메모 추가 실패: %s", e)
         return False
 
 def delete_maeiple_property(property_id: int) -> bool:
@@ -661,7 +1443,7 @@ def delete_maeiple_property(property_id: int) -> bool:
         supabase.table('maeiple_properties').delete().eq('id', property_id).execute()
         return True
     except Exception as e:
-        logger.error(f"메이플 아파트 매물 삭제 실패: {e}")
+        logger.error("메이플 아파트 매물 삭제 실패: %s", e)
         return False
 
 def get_guarantee_list(limit: int = 50) -> List[Dict[str, Any]]:
@@ -684,7 +1466,7 @@ def get_guarantee_list(limit: int = 50) -> List[Dict[str, Any]]:
             .execute()
         return response.data
     except Exception as e:
-        logger.error(f"보증보험 목록 조회 실패: {e}")
+        logger.error("보증보험 목록 조회 실패: %s", e)
         return []
 
 def update_guarantee_insurance_status(link_id: int, status: bool) -> bool:
@@ -698,7 +1480,7 @@ def update_guarantee_insurance_status(link_id: int, status: bool) -> bool:
         supabase.table('residence_links').update({'guarantee_insurance': status}).eq('id', link_id).execute()
         return True
     except Exception as e:
-        logger.error(f"보증보험 매물 상태 변경 실패: {e}")
+        logger.error("보증보험 매물 상태 변경 실패: %s", e)
         return False
 
 def update_link_memo(link_id: int, memo: str, table_type: str = 'residence') -> bool:
@@ -713,36 +1495,9 @@ def update_link_memo(link_id: int, memo: str, table_type: str = 'residence') ->
         supabase.table(table_name).update({'memo': memo}).eq('id', link_id).execute()
         return True
     except Exception as e:
-        logger.error(f"링크 메모 업데이트 실패: {e}")
+        logger.error("링크 메모 업데이트 실패: %s", e)
         return False
 
-def get_team_all_customers(team_name: str, limit: int = 50) -> List[Dict[str, Any]]:
-    """팀 전체 고객 목록을 조회합니다."""
-    try:
-        supabase = get_supabase()
-        if not supabase:
-            return []
-            
-        # 팀 전체 고객 조회 (팀장 + 팀원)
-        response = supabase.table('employee_customers').select('*, employees!inner(team)').eq('employees.team', team_name).order('inquiry_date', desc=True).limit(limit).execute()
-        return response.data
-    except Exception as e:
-        logger.error(f"팀 전체 고객 목록 조회 실패: {e}")
-        return []
-
-def get_team_all_maeiple_properties(team_name: str, limit: int = 50) -> List[Dict[str, Any]]:
-    """팀 전체 메이플 아파트 매물 목록을 조회합니다."""
-    try:
-        supabase = get_supabase()
-        if not supabase:
-            return []
-            
-        response = supabase.table('maeiple_properties').select('*').eq('employee_team', team_name).order('check_date', desc=True).limit(limit).execute()
-        return response.data
-    except Exception as e:
-        logger.error(f"팀 전체 메이플 아파트 매물 목록 조회 실패: {e}")
-        return []
-
 def get_personal_maeiple_properties(employee_id: str = None, limit: int = 50) -> List[Dict[str, Any]]:
     """개인용 메이플 아파트 매물 목록을 조회합니다."""
     try:
@@ -759,18 +1514,5 @@ def get_personal_maeiple_properties(employee_id: str = None, limit: int = 50) ->
         
         return response.data
     except Exception as e:
-        logger.error(f"개인용 메이플 아파트 매물 목록 조회 실패: {e}")
-        return []
-
-def get_team_leader_customers(team_leader_id: str, limit: int = 50) -> List[Dict[str, Any]]:
-    """팀장 본인의 고객 목록을 조회합니다."""
-    try:
-        supabase = get_supabase()
-        if not supabase:
-            return []
-            
-        response = supabase.table('employee_customers').select('*').eq('employee_id', team_leader_id).order('inquiry_date', desc=True).limit(limit).execute()
-        return response.data
-    except Exception as e:
-        logger.error(f"팀장 본인 고객 목록 조회 실패: {e}")
+        logger.error("개인용 메이플 아파트 매물 목록 조회 실패: %s", e)
         return []
@@ -1,3 +1,5 @@
+import argparse
+
 from supabase_utils import get_supabase
 
 def update_unchecked_likes_fixed():
@@ -81,5 +83,46 @@ def update_unchecked_likes_fixed():
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
 
+def reconcile_unchecked_likes(dry_run=False):
+    """저장된 미확인 좋아요 카운터와 실제 링크 데이터를 일괄 비교하여 오차를 보정합니다.
+
+    재집계와 보정은 sql/unchecked_likes_counters.sql 의 reconcile_unchecked_likes() 함수가
+    한 SQL 문으로 처리하므로, 그 사이에 실행된 트리거 증감을 덮어쓰지 않습니다.
+    """
+    supabase = get_supabase()
+    if not supabase:
+        print("❌ Supabase 연결 실패")
+        return
+    
+    try:
+        print(f"🔄 미확인 좋아요 카운터 정합성 검사 중... ({'검사만' if dry_run else '검사 및 보정'})")
+        
+        response = supabase.rpc('reconcile_unchecked_likes', {'p_dry_run': dry_run}).execute()
+        drifted = response.data or []
+        
+        print(f"🔍 오차 발견: {len(drifted)}명")
+        
+        for row in drifted:
+            print(f"   👤 {row.get('customer_name')} (ID: {row['customer_id']}) "
+                  f"주거 {row['old_residence']}→{row['new_residence']}, "
+                  f"업무 {row['old_business']}→{row['new_business']}")
+        
+        if dry_run:
+            print(f"\n🎉 검사 완료! {len(drifted)}명의 카운터가 실제 값과 다릅니다.")
+        else:
+            repaired_count = sum(1 for row in drifted if row.get('repaired'))
+            print(f"\n🎉 보정 완료! 총 {repaired_count}/{len(drifted)}명의 카운터가 보정되었습니다.")
+        
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+
 if __name__ == "__main__":
-    update_unchecked_likes_fixed()
+    parser = argparse.ArgumentParser(description='미확인 좋아요 카운터 업데이트')
+    parser.add_argument('--reconcile', action='store_true', help='저장된 카운터를 실제 값과 일괄 비교하여 보정')
+    parser.add_argument('--dry-run', action='store_true', help='--reconcile 과 함께 사용: 보정 없이 오차만 출력')
+    args = parser.parse_args()
+    
+    if args.reconcile:
+        reconcile_unchecked_likes(dry_run=args.dry_run)
+    else:
+        update_unchecked_likes_fixed()
@@ -0,0 +1,64 @@
+import os
+import time
+import atexit
+import logging
+import threading
+from typing import Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+class WriteBehindQueue:
+    """같은 키의 쓰기 요청을 합쳐 백그라운드 스레드에서 모아 처리하는 큐
+
+    enqueue()는 즉시 반환하고, flush_fn(key)는 delay초 동안 모인 키마다 한 번씩 호출됩니다.
+    워커 스레드는 처음 enqueue될 때 (fork 이후라면 워커 프로세스마다) 시작됩니다.
+    """
+
+    def __init__(self, name: str, flush_fn: Callable[[Hashable], None], delay: float = 0.5):
+        self.name = name
+        self.flush_fn = flush_fn
+        self.delay = delay
+        self._pending = set()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._pid = None
+        atexit.register(self.flush)
+
+    def _ensure_worker(self):
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._thread = threading.Thread(target=self._run, name=f"write-behind-{self.name}", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, key: Hashable):
+        """키를 대기열에 추가합니다. 이미 대기 중인 키는 한 번만 처리됩니다."""
+        with self._condition:
+            self._ensure_worker()
+            self._pending.add(key)
+            self._condition.notify()
+
+    def _take_pending(self) -> set:
+        with self._condition:
+            keys, self._pending = self._pending, set()
+            return keys
+
+    def _flush_keys(self, keys: set):
+        for key in keys:
+            try:
+                self.flush_fn(key)
+            except Exception as e:
+                logger.error("[%s] 백그라운드 쓰기 실패 (%s): %s", self.name, key, e)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+            # 짧은 시간 동안 같은 키의 요청을 더 모은 뒤 처리
+            time.sleep(self.delay)
+            self._flush_keys(self._take_pending())
+
+    def flush(self):
+        """대기 중인 쓰기를 호출한 스레드에서 즉시 처리합니다. (종료 시, 테스트용)"""
+        self._flush_keys(self._take_pending())
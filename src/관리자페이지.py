@@ -5,16 +5,29 @@ import os
 import sys
 import requests
 import time
+import logging
 
 # src 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import log_utils
+import password_utils
+import session_store
 import supabase_utils
+import pg_pool
+import assets
+import compression
+import conditional
+import metrics
 from dotenv import load_dotenv
 
 # 환경변수 로드
 load_dotenv()
 
+# 로깅 설정 (LOG_LEVEL, LOG_FORMAT, LOG_DEBUG_SAMPLE_RATE)
+log_utils.configure_logging()
+logger = logging.getLogger(__name__)
+
 # 환경변수 검증
 if not os.environ.get('SUPABASE_URL'):
     raise ValueError("SUPABASE_URL 환경변수가 설정되지 않았습니다. .env 파일을 확인하세요.")
@@ -33,31 +46,34 @@ else:
     RESIDENCE_SITE_URL = os.environ.get('RESIDENCE_SITE_URL', 'http://localhost:5000')
     BUSINESS_SITE_URL = os.environ.get('BUSINESS_SITE_URL', 'http://localhost:5001')
 
-print(f"주거 사이트 URL: {RESIDENCE_SITE_URL}")
-print(f"업무 사이트 URL: {BUSINESS_SITE_URL}")
+logger.info("주거 사이트 URL: %s", RESIDENCE_SITE_URL)
+logger.info("업무 사이트 URL: %s", BUSINESS_SITE_URL)
 
 # 테스트 모드 강제 활성화 (개발/테스트용)
 FORCE_TEST_MODE = False  # False로 설정하여 실제 Supabase DB 사용
-print(f"테스트 모드 강제 활성화: {FORCE_TEST_MODE}")
+logger.info("테스트 모드 강제 활성화: %s", FORCE_TEST_MODE)
 
 # 템플릿 디렉토리 경로 설정
 import os.path
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 TEMPLATE_DIR = os.path.join(BASE_DIR, 'templates')
 
-print(f"Base directory: {BASE_DIR}")
-print(f"Template directory: {TEMPLATE_DIR}")
-print(f"Template directory exists: {os.path.exists(TEMPLATE_DIR)}")
+logger.info("Base directory: %s", BASE_DIR)
+logger.info("Template directory: %s", TEMPLATE_DIR)
+logger.info("Template directory exists: %s", os.path.exists(TEMPLATE_DIR))
 
 if os.path.exists(TEMPLATE_DIR):
     template_files = os.listdir(TEMPLATE_DIR)
-    print(f"Template files: {template_files}")
+    logger.info("Template files: %s", template_files)
 
 app = Flask(__name__, 
             template_folder=TEMPLATE_DIR,
             static_folder=os.path.join(BASE_DIR, 'static'))
 app.secret_key = os.environ.get('FLASK_SECRET_KEY', 'dev-secret-key-change-in-production')  # 세션용 비밀키
 
+# 서버 측 세션 저장소 (쿠키에는 서명된 세션 ID만, 직원 비활성화 시 즉시 로그아웃)
+session_store.init_app(app)
+
 # 개발 환경에서 캐싱 방지 및 자동 리로드 설정
 if app.debug:
     app.config['TEMPLATES_AUTO_RELOAD'] = True
@@ -65,13 +81,31 @@ if app.debug:
     app.jinja_env.auto_reload = True
     app.jinja_env.cache = None
 
-# Supabase 초기화
-try:
-    supabase_utils.init_supabase()
-    print("Supabase 초기화 성공")
-except Exception as e:
-    print(f"Supabase 초기화 실패: {e}")
-    # 실패해도 앱은 계속 실행
+# 응답 압축 (gzip/brotli) - 다른 after_request 보다 나중에 실행되도록 가장 먼저 등록
+compression.init_app(app)
+
+# API 응답 ETag / If-None-Match → 304
+conditional.init_app(app)
+
+# 요청별 DB 호출 계측 (Server-Timing 헤더) + /metrics
+metrics.init_app(app)
+
+# 정적 자산 (asset_url 템플릿 함수 + 해시가 붙은 파일 장기 캐시)
+assets.init_app(app)
+
+# Supabase 초기화 (gunicorn post_fork 에서 이 워커의 클라이언트를 이미 만들었다면 그대로 사용)
+if supabase_utils.get_supabase():
+    logger.info("Supabase 초기화 성공")
+else:
+    # 실패해도 앱은 계속 실행 (요청 시 다시 시도)
+    logger.warning("Supabase 초기화 실패")
+
+def _page_args():
+    """요청의 page/per_page 파라미터를 정수로 읽습니다. 숫자가 아니면 ValueError 를 발생시킵니다."""
+    try:
+        return int(request.args.get('page', 1)), int(request.args.get('per_page', 20))
+    except ValueError:
+        raise ValueError('page/per_page 는 숫자여야 합니다.') from None
 
 @app.route('/health')
 def health_check():
@@ -87,16 +121,14 @@ def index():
         elif 'employee_id' in session:
             # 팀장인 경우 팀장 대시보드로, 일반 직원인 경우 직원 대시보드로
             if session.get('employee_role') == '팀장':
-                print(f" 팀장 '{session.get('employee_name')}' - 팀장 대시보드로 리다이렉트")
+                logger.debug("팀장 '%s' - 팀장 대시보드로 리다이렉트", session.get('employee_name'))
                 return redirect(url_for('team_leader_dashboard'))  # 함수명 변경
             else:
-                print(f" 직원 '{session.get('employee_name')}' - 직원 대시보드로 리다이렉트")
+                logger.debug("직원 '%s' - 직원 대시보드로 리다이렉트", session.get('employee_name'))
                 return redirect(url_for('employee_dashboard'))
         return render_template('admin_main.html')
     except Exception as e:
-        print(f"루트 경로 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("루트 경로 오류: %s", e)
         # 기본 응답 반환
         return jsonify({
             'status': 'ok',
@@ -111,8 +143,7 @@ def login():
     employee_id = data.get('employee_id')  # 실제로는 name으로 검색
     password = data.get('password')  # 비밀번호 확인
     
-    print(f"[LOGIN DEBUG] 로그인 요청 데이터: {data}")
-    print(f"[LOGIN DEBUG] 직원 로그인 시도: '{employee_id}', 비밀번호: '{password}'")  # 디버깅 로그
+    logger.debug("직원 로그인 시도: '%s'", employee_id)
     
     if not employee_id or employee_id.strip() == '':
         return jsonify({'success': False, 'message': '직원 이름을 입력해주세요.'})
@@ -120,39 +151,35 @@ def login():
     if not password or password.strip() == '':
         return jsonify({'success': False, 'message': '비밀번호를 입력해주세요.'})
     
-    # Supabase에서 직원 정보 조회
+    # Supabase에서 직원 정보 조회 (로그인에 필요한 컬럼만, 한 번의 조회)
     try:
-        employee = supabase_utils.get_employee_by_name(employee_id)
+        employee = supabase_utils.get_employee_for_login(employee_id)
         
         if employee:
             # 블랙리스트 체크 (비활성화/삭제된 직원)
             if employee.get('status') == 'inactive':
                 return jsonify({'success': False, 'message': '비활성화된 직원입니다. 관리자에게 문의하세요.'})
             
-            # 비밀번호 검증
-            stored_password = employee.get('password')
-            if not stored_password:
-                # 비밀번호가 설정되지 않은 경우 기본값 '1234' 사용
-                stored_password = '1234'
-            
-            if password != stored_password:
-                print(f" 비밀번호 불일치: 입력='{password}', 저장됨='{stored_password}'")
+            # 비밀번호 검증 (해시 또는 예전 평문, 비어 있으면 기본값 '1234')
+            if not password_utils.verify_password(password, employee.get('password')):
+                logger.warning("비밀번호 불일치: %s", employee_id)
                 return jsonify({'success': False, 'message': '직원 이름 또는 비밀번호가 올바르지 않습니다.'})
             
-            # 비밀번호 검증 성공 - 로그인 처리
+            # 비밀번호 검증 성공 - 로그인 처리 (세션 ID 재발급)
+            session_store.rotate_session()
             session['employee_id'] = employee['id']
             session['employee_name'] = employee['name']
             session['employee_team'] = employee.get('team', '')
             session['employee_role'] = employee.get('role', 'employee')
             
-            # 마지막 로그인 시간 업데이트
-            supabase_utils.update_employee_last_login(employee['name'])
+            # 마지막 로그인 시간 기록 / 평문 비밀번호 해시 변환은 백그라운드에서 처리
+            supabase_utils.queue_employee_login(employee)
             
-            print(f" 직원 로그인 성공: {employee['name']} ({employee.get('role', 'employee')})")
-            print(f"  - 세션 employee_id: {session['employee_id']}")
-            print(f"  - 세션 employee_name: {session['employee_name']}")
-            print(f"  - 세션 employee_team: {session['employee_team']}")
-            print(f"  - 세션 employee_role: {session['employee_role']}")
+            logger.info("직원 로그인 성공: %s (%s)", employee['name'], employee.get('role', 'employee'))
+            logger.debug("- 세션 employee_id: %s", session['employee_id'])
+            logger.debug("- 세션 employee_name: %s", session['employee_name'])
+            logger.debug("- 세션 employee_team: %s", session['employee_team'])
+            logger.debug("- 세션 employee_role: %s", session['employee_role'])
             
             return jsonify({
                 'success': True, 
@@ -161,12 +188,13 @@ def login():
                 'role': employee.get('role', 'employee')
             })
         else:
-            # 로그인 실패
-            print(f" 로그인 실패: 비밀번호 불일치 또는 직원 정보 없음")
+            # 로그인 실패 (없는 직원도 검증 시간을 맞춤)
+            password_utils.verify_dummy(password)
+            logger.warning("로그인 실패: 비밀번호 불일치 또는 직원 정보 없음")
             return jsonify({'success': False, 'message': '직원 이름 또는 비밀번호가 올바르지 않습니다.'})
             
     except Exception as e:
-        print(f" 데이터베이스 오류: {e}")
+        logger.error("데이터베이스 오류: %s", e)
         return jsonify({'success': False, 'message': '로그인 중 오류가 발생했습니다.'})
 
 @app.route('/admin-login', methods=['POST'])
@@ -180,6 +208,7 @@ def admin_login():
     ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD', 'change-this-password')
     
     if admin_id == ADMIN_ID and admin_password == ADMIN_PASSWORD:
+        session_store.rotate_session()
         session['is_admin'] = True
         session['admin_id'] = admin_id
         session['employee_name'] = '관리자'
@@ -199,13 +228,6 @@ def employee_dashboard():
     if 'employee_id' not in session and 'is_admin' not in session:
         return redirect(url_for('index'))
     
-    # 블랙리스트 체크 (비활성화/삭제된 직원)
-    if 'employee_id' in session:
-        employee_name = session.get('employee_name', '')
-        if 'blacklisted_sessions' in session and employee_name in session['blacklisted_sessions']:
-            session.clear()
-            return redirect(url_for('index'))
-    
     # 관리자가 대시보드에 접근하면 관리자 패널로 리다이렉트
     if session.get('is_admin'):
         return redirect(url_for('admin_panel'))
@@ -214,21 +236,15 @@ def employee_dashboard():
     
     # Supabase 연결 확인
     if not os.environ.get('SUPABASE_URL') or not os.environ.get('SUPABASE_KEY'):
-        print(" 테스트 모드 - 대시보드 접근 허용")
+        logger.debug("테스트 모드 - 대시보드 접근 허용")
         guarantee_list = []  # 빈 리스트로 처리
     else:
-        # 관리자가 아닌 경우 직원이 여전히 존재하는지 확인
-        if not session.get('is_admin'):
-            if not supabase_utils.check_employee_exists(employee_name):
-                # 직원이 삭제된 경우 오류 페이지 표시
-                return render_template('employee_error.html')
-        
         # 보증보험 매물 목록 조회
         guarantee_list = supabase_utils.get_guarantee_insurance_links(20)
     
     # 디버깅: URL 확인
-    print(f"[대시보드] 주거 사이트 URL: {RESIDENCE_SITE_URL}")
-    print(f"[대시보드] 업무 사이트 URL: {BUSINESS_SITE_URL}")
+    logger.debug("대시보드 주거 사이트 URL: %s", RESIDENCE_SITE_URL)
+    logger.debug("대시보드 업무 사이트 URL: %s", BUSINESS_SITE_URL)
     
     return render_template('employee_dashboard.html', 
                          employee_name=employee_name,
@@ -242,24 +258,18 @@ def team_leader_dashboard():  # 함수명 변경
     if 'employee_id' not in session:
         return redirect(url_for('index'))
     
-    # 블랙리스트 체크 (비활성화/삭제된 직원)
-    employee_name = session.get('employee_name', '')
-    if 'blacklisted_sessions' in session and employee_name in session['blacklisted_sessions']:
-        session.clear()
-        return redirect(url_for('index'))
-    
     # 팀장만 접근 가능
     if session.get('employee_role') != '팀장':
-        print(f" 팀장이 아닌 사용자 접근 거부 - employee_role: {session.get('employee_role')}")
+        logger.warning("팀장이 아닌 사용자 접근 거부 - employee_role: %s", session.get('employee_role'))
         return redirect(url_for('index'))
     
     employee_name = session.get('employee_name', '팀장')
     employee_team = session.get('employee_team', '')
-    print(f" 팀장 대시보드 접근 허용 - {employee_name} ({employee_team})")
+    logger.debug("팀장 대시보드 접근 허용 - %s (%s)", employee_name, employee_team)
     
     # Supabase 연결 확인
     if not os.environ.get('SUPABASE_URL') or not os.environ.get('SUPABASE_KEY'):
-        print(" 테스트 모드 - 팀장 대시보드")
+        logger.debug("테스트 모드 - 팀장 대시보드")
         guarantee_list = []
     else:
         # 보증보험 매물 목록 조회
@@ -275,23 +285,16 @@ def team_leader_dashboard():  # 함수명 변경
 @app.route('/admin')
 def admin_panel():
     """관리자 패널 (직원 관리)"""
-    # 블랙리스트 체크 (비활성화/삭제된 직원)
-    if 'employee_id' in session:
-        employee_name = session.get('employee_name', '')
-        if 'blacklisted_sessions' in session and employee_name in session['blacklisted_sessions']:
-            session.clear()
-            return redirect(url_for('index'))
-    
     # 관리자만 접근 가능 (팀장은 별도 페이지 사용)
     if not session.get('is_admin'):
-        print(f" 접근 거부 - is_admin: {session.get('is_admin')}, employee_role: {session.get('employee_role')}")
+        logger.warning("접근 거부 - is_admin: %s, employee_role: %s", session.get('is_admin'), session.get('employee_role'))
         return redirect(url_for('index'))
     
-    print(f" 관리자 패널 접근 허용 - is_admin: {session.get('is_admin')}, employee_role: {session.get('employee_role')}")
+    logger.debug("관리자 패널 접근 허용 - is_admin: %s, employee_role: %s", session.get('is_admin'), session.get('employee_role'))
 
     # Supabase 연결 확인
     if not os.environ.get('SUPABASE_URL') or not os.environ.get('SUPABASE_KEY'):
-        print(" 테스트 모드 - 빈 보증보험 목록 반환")
+        logger.debug("테스트 모드 - 빈 보증보험 목록 반환")
         guarantee_list = []
         return render_template('admin_panel.html', 
                              guarantee_list=guarantee_list,
@@ -355,13 +358,14 @@ def manage_employees():
     
     # 페이지네이션 파라미터 (GET 요청일 때만)
     if request.method == 'GET':
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 20))
-        offset = (page - 1) * per_page
+        try:
+            page, per_page = _page_args()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
     
     # Supabase 연결 확인
     if not os.environ.get('SUPABASE_URL') or not os.environ.get('SUPABASE_KEY'):
-        print(" Supabase 환경변수가 설정되지 않음 - 테스트 모드로 동작")
+        logger.debug("Supabase 환경변수가 설정되지 않음 - 테스트 모드로 동작")
         if request.method == 'GET':
             return jsonify({
                 'success': True,
@@ -376,24 +380,20 @@ def manage_employees():
     
     try:
         if request.method == 'GET':
-            # Supabase에서 직원 목록 조회
-            employees_data = supabase_utils.get_employees_with_pagination(page, per_page)
+            # Supabase에서 직원 목록 조회 (팀장은 자신의 팀 멤버만 DB 에서 필터링)
+            if session.get('employee_role') == '팀장' and not session.get('is_admin'):
+                current_team = session.get('employee_team')
+                logger.debug("팀장 권한 - 팀 필터링 적용: %s", current_team)
+                employees_data = supabase_utils.get_employees_with_pagination(page, per_page, team=current_team, roles=('팀장', '직원'))
+            else:
+                employees_data = supabase_utils.get_employees_with_pagination(page, per_page)
             
             if employees_data:
                 employees = employees_data.get('employees', [])
                 total_count = employees_data.get('total_count', 0)
                 total_pages = employees_data.get('total_pages', 0)
                 
-                print(f"[직원 목록] 조회된 직원 수: {len(employees)} (페이지 {page}/{total_pages})")
-                
-                # 팀장인 경우 자신의 팀 멤버들만 필터링
-                if session.get('employee_role') == '팀장' and not session.get('is_admin'):
-                    current_team = session.get('employee_team')
-                    print(f"[팀장 권한] 팀 필터링 적용: {current_team}")
-                    employees = [emp for emp in employees if emp.get('team') == current_team and emp.get('role') in ['팀장', '직원']]
-                    total_count = len(employees)
-                    total_pages = 1  # 필터링된 결과는 단일 페이지로 처리
-                    print(f"[팀장 권한] 필터링된 직원 수: {len(employees)}")
+                logger.debug("직원 목록 조회: %s명 (페이지 %s/%s)", len(employees), page, total_pages)
                 
                 # 필드명 통일을 위해 매핑
                 for emp in employees:
@@ -402,7 +402,6 @@ def manage_employees():
                     emp['created_date'] = emp.get('created_at')
                     emp['is_active'] = emp.get('status', 'active') == 'active'
                 
-                print(f"[직원 목록] 최종 응답: {employees}")
                 return jsonify({
                     'success': True,
                     'employees': employees,
@@ -412,7 +411,7 @@ def manage_employees():
                     'total_pages': total_pages
                 })
             else:
-                print(" 직원 목록 조회 실패")
+                logger.warning("직원 목록 조회 실패")
                 return jsonify({
                     'success': False,
                     'employees': [],
@@ -424,9 +423,8 @@ def manage_employees():
                 })
 
         if request.method == 'POST':
-            print(" 직원 추가 요청 받음")
+            logger.debug("직원 추가 요청 받음")
             data = request.get_json()
-            print(f" 요청 데이터: {data}")
             
             employee_id = data.get('employee_id')
             employee_name = data.get('employee_name')
@@ -441,7 +439,7 @@ def manage_employees():
             if session.get('employee_role') == '팀장' and not session.get('is_admin'):
                 current_team = session.get('employee_team')
                 if team != current_team:
-                    print(f" 팀장이 다른 팀에 직원 추가 시도: 현재 팀={current_team}, 요청 팀={team}")
+                    logger.debug("팀장이 다른 팀에 직원 추가 시도: 현재 팀=%s, 요청 팀=%s", current_team, team)
                     return jsonify({'success': False, 'message': f'팀장은 자신의 팀({current_team})에만 직원을 추가할 수 있습니다.'}), 403
                 # 팀장은 자신의 팀으로 강제 설정
                 team = current_team
@@ -449,10 +447,10 @@ def manage_employees():
             # employee_id와 employee_name 중 하나라도 있으면 name으로 사용
             name = employee_name if employee_name else employee_id
             
-            print(f" 추출된 데이터 - 이름: '{name}', 팀: '{team}', 이메일: '{email}', 직책: '{position}'")
+            logger.debug("추출된 데이터 - 이름: '%s', 팀: '%s', 이메일: '%s', 직책: '%s'", name, team, email, position)
             
             if not name or name.strip() == '':
-                print(f" 이름이 비어있음")
+                logger.debug("이름이 비어있음")
                 return jsonify({'success': False, 'message': '이름을 입력해야 합니다.'}), 400
             
             # Supabase에 직원 추가
@@ -465,16 +463,14 @@ def manage_employees():
                 new_employee['created_date'] = new_employee.get('created_at')
                 new_employee['is_active'] = new_employee.get('status') == 'active'
                 
-                print(f" 직원 추가 성공: {new_employee}")
+                logger.info("직원 추가 성공: id=%s", new_employee.get('id'))
                 return jsonify({'success': True, 'employee': new_employee})
             else:
-                print(" 직원 추가 실패")
+                logger.warning("직원 추가 실패")
                 return jsonify({'success': False, 'message': '직원 추가 중 오류가 발생했습니다.'})
             
     except Exception as e:
-        print(f" 직원 API 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("직원 API 오류: %s", e)
         return jsonify({'success': False, 'message': f'서버 오류가 발생했습니다: {str(e)}'}), 500
 
 @app.route('/api/employees/<int:emp_id>', methods=['DELETE'])
@@ -507,15 +503,10 @@ def delete_employee(emp_id):
         response = supabase.table('employees').update({'status': 'inactive'}).eq('id', emp_id).execute()
         
         if response.data:
-            print(f" 직원 비활성화 성공: ID {emp_id}, 이름: {employee_name}")
-            
-            # 강제 로그아웃을 위한 세션 무효화 (Redis나 세션 저장소 사용 시)
-            # 현재는 세션 ID를 블랙리스트에 추가하는 방식으로 구현
-            if 'blacklisted_sessions' not in session:
-                session['blacklisted_sessions'] = []
+            logger.info("직원 비활성화 성공: ID %s, 이름: %s", emp_id, employee_name)
             
-            # 해당 직원의 모든 세션을 블랙리스트에 추가
-            session['blacklisted_sessions'].append(employee_name)
+            # 강제 로그아웃: 해당 직원의 모든 세션을 서버 세션 저장소에서 삭제
+            session_store.revoke_employee(emp_id)
             
             return jsonify({
                 'success': True, 
@@ -523,13 +514,11 @@ def delete_employee(emp_id):
                 'employee_name': employee_name
             })
         else:
-            print(f" 직원 삭제 실패: ID {emp_id}, response.data가 None")
+            logger.warning("직원 삭제 실패: ID %s, response.data가 None", emp_id)
             return jsonify({'success': False, 'message': '직원 상태 업데이트에 실패했습니다.'}), 500
             
     except Exception as e:
-        print(f" 직원 삭제 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("직원 삭제 오류: %s", e)
         return jsonify({'success': False, 'message': f'직원 삭제 중 오류가 발생했습니다: {str(e)}'}), 500
 
 @app.route('/api/employees/<int:emp_id>/deactivate', methods=['PUT'])
@@ -564,13 +553,10 @@ def deactivate_employee(emp_id):
         }).eq('id', emp_id).execute()
         
         if response.data:
-            print(f" 직원 비활성화 성공: ID {emp_id}, 이름: {employee_name}")
+            logger.info("직원 비활성화 성공: ID %s, 이름: %s", emp_id, employee_name)
             
-            # 강제 로그아웃을 위한 세션 무효화
-            if 'blacklisted_sessions' not in session:
-                session['blacklisted_sessions'] = []
-            
-            session['blacklisted_sessions'].append(employee_name)
+            # 강제 로그아웃: 해당 직원의 모든 세션을 서버 세션 저장소에서 삭제
+            session_store.revoke_employee(emp_id)
             
             return jsonify({
                 'success': True, 
@@ -578,11 +564,11 @@ def deactivate_employee(emp_id):
                 'employee_name': employee_name
             })
         else:
-            print(f" 직원 비활성화 실패: ID {emp_id}")
+            logger.warning("직원 비활성화 실패: ID %s", emp_id)
             return jsonify({'success': False, 'message': '직원을 찾을 수 없습니다.'}), 404
             
     except Exception as e:
-        print(f" 직원 비활성화 오류: {e}")
+        logger.error("직원 비활성화 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/employees/<int:emp_id>/activate', methods=['PUT'])
@@ -613,14 +599,14 @@ def activate_employee(emp_id):
         response = supabase.table('employees').update({'status': 'active'}).eq('id', emp_id).execute()
         
         if response.data:
-            print(f" 직원 활성화 성공: ID {emp_id}")
+            logger.info("직원 활성화 성공: ID %s", emp_id)
             return jsonify({'success': True, 'message': '직원이 활성화되었습니다.'})
         else:
-            print(f" 직원 활성화 실패: ID {emp_id}")
+            logger.warning("직원 활성화 실패: ID %s", emp_id)
             return jsonify({'success': False, 'message': '직원을 찾을 수 없습니다.'}), 404
             
     except Exception as e:
-        print(f" 직원 활성화 오류: {e}")
+        logger.error("직원 활성화 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/employees/<int:emp_id>/reset-password', methods=['PUT'])
@@ -652,24 +638,20 @@ def reset_employee_password(emp_id):
                 return jsonify({'success': False, 'message': '다른 팀 직원은 수정할 수 없습니다.'}), 403
         
         # 비밀번호 업데이트
-        print(f" 비밀번호 업데이트 시도: ID={emp_id}, 새 비밀번호={new_password}")
+        logger.debug("비밀번호 업데이트 시도: ID=%s", emp_id)
         response = supabase.table('employees').update({
-            'password': new_password
+            'password': password_utils.hash_password(new_password)
         }).eq('id', emp_id).execute()
         
-        print(f" Supabase 응답: {response}")
-        
         if response.data:
-            print(f" 직원 ID {emp_id} 비밀번호 재설정 완료")
+            logger.info("직원 ID %s 비밀번호 재설정 완료", emp_id)
             return jsonify({'success': True, 'message': f'비밀번호가 "{new_password}"로 재설정되었습니다.'})
         else:
-            print(f" 비밀번호 업데이트 실패: response.data가 None")
+            logger.warning("비밀번호 업데이트 실패: response.data가 None")
             return jsonify({'success': False, 'message': '비밀번호 업데이트에 실패했습니다.'}), 500
             
     except Exception as e:
-        print(f" 비밀번호 재설정 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("비밀번호 재설정 오류: %s", e)
         return jsonify({'error': f'비밀번호 재설정 중 오류가 발생했습니다: {str(e)}'}), 500
 
 # 팀 관리 API
@@ -685,15 +667,16 @@ def manage_teams():
                 supabase = supabase_utils.get_supabase()
                 if supabase:
                     # 활성 상태인 팀만 조회 (is_active = true 또는 null)
-                    response = supabase.table('teams').select('*').or_('is_active.is.null,is_active.eq.true').execute()
+                    query = supabase.table('teams').select('*')
+                    response = supabase_utils.apply_or_filter(query, 'is_active.is.null,is_active.eq.true').execute()
                     teams = response.data
-                    print(f" DB에서 활성 팀 목록 조회 성공: {len(teams)}개 팀")
+                    logger.debug("DB에서 활성 팀 목록 조회 성공: %s개 팀", len(teams))
                     return jsonify({'teams': teams})
                 else:
-                    print(" Supabase 연결 실패, 기본 팀 목록 반환")
+                    logger.warning("Supabase 연결 실패, 기본 팀 목록 반환")
                     raise Exception("Supabase 연결 실패")
             except Exception as e:
-                print(f" 팀 목록 조회 실패: {e}, 기본 팀 목록 반환")
+                logger.warning("팀 목록 조회 실패: %s, 기본 팀 목록 반환", e)
                 # 오류 시 기본 팀 목록 반환
                 teams = [
                     {'name': '빈시트', 'description': '빈시트 팀'},
@@ -734,7 +717,7 @@ def manage_teams():
                 response = supabase.table('teams').insert(new_team_data).execute()
                 
                 if response.data:
-                    print(f" 새 팀 추가 성공: {team_name} - {team_description}")
+                    logger.info("새 팀 추가 성공: %s - %s", team_name, team_description)
                     return jsonify({
                         'success': True, 
                         'message': f'팀 "{team_name}"이(가) 추가되었습니다.',
@@ -744,11 +727,11 @@ def manage_teams():
                     return jsonify({'success': False, 'message': '팀 추가에 실패했습니다.'}), 500
                     
             except Exception as e:
-                print(f" 팀 추가 오류: {e}")
+                logger.error("팀 추가 오류: %s", e)
                 return jsonify({'success': False, 'message': f'팀 추가 중 오류가 발생했습니다: {str(e)}'}), 500
             
     except Exception as e:
-        print(f" 팀 관리 오류: {e}")
+        logger.error("팀 관리 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 # 팀 삭제 API
@@ -787,15 +770,15 @@ def delete_team(team_name):
                 
                 # 해당 팀에 속한 직원들의 팀을 "미지정"으로 설정
                 response = supabase.table('employees').update({'team': '미지정'}).eq('team', team_name).execute()
-                print(f" 팀 '{team_name}' 소속 직원들의 팀 정보 업데이트: {response.data}")
+                logger.info("팀 '%s' 소속 직원 %s명의 팀 정보 업데이트", team_name, len(response.data or []))
             except Exception as e:
-                print(f" 직원 팀 정보 업데이트 실패: {e}")
+                logger.warning("직원 팀 정보 업데이트 실패: %s", e)
             
             # 팀 삭제 (실제 삭제)
             delete_response = supabase.table('teams').delete().eq('name', team_name).execute()
             
             if delete_response.data:
-                print(f" 팀 삭제 성공: {team_name} - 사유: {delete_reason}")
+                logger.info("팀 삭제 성공: %s - 사유: %s", team_name, delete_reason)
                 return jsonify({
                     'success': True,
                     'message': f'팀 "{team_name}"이(가) 삭제되었습니다.',
@@ -806,11 +789,11 @@ def delete_team(team_name):
                 return jsonify({'success': False, 'message': '팀 삭제에 실패했습니다.'}), 500
                 
         except Exception as e:
-            print(f" 팀 삭제 오류: {e}")
+            logger.error("팀 삭제 오류: %s", e)
             return jsonify({'success': False, 'message': f'팀 삭제 중 오류가 발생했습니다: {str(e)}'}), 500
         
     except Exception as e:
-        print(f" 팀 삭제 오류: {e}")
+        logger.error("팀 삭제 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/employees/<int:emp_id>/update', methods=['PUT'])
@@ -860,18 +843,23 @@ def update_employee(emp_id):
         if not update_data:
             return jsonify({'success': False, 'message': '수정할 데이터가 없습니다.'}), 400
         
+        if update_data.get('password'):
+            update_data['password'] = password_utils.hash_password(update_data['password'])
+        
         # 직원 정보 업데이트
         response = supabase.table('employees').update(update_data).eq('id', emp_id).execute()
         
         if response.data:
-            print(f" 직원 정보 수정 성공: ID {emp_id}")
+            logger.info("직원 정보 수정 성공: ID %s", emp_id)
+            if update_data.get('status') == 'inactive':
+                session_store.revoke_employee(emp_id)
             return jsonify({'success': True, 'message': '직원 정보가 수정되었습니다.'})
         else:
-            print(f" 직원 정보 수정 실패: ID {emp_id}")
+            logger.warning("직원 정보 수정 실패: ID %s", emp_id)
             return jsonify({'success': False, 'message': '직원을 찾을 수 없습니다.'}), 404
             
     except Exception as e:
-        print(f" 직원 정보 수정 오류: {e}")
+        logger.error("직원 정보 수정 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/employees/<int:emp_id>/permanent-delete', methods=['DELETE'])
@@ -910,14 +898,10 @@ def permanent_delete_employee(emp_id):
         delete_response = supabase.table('employees').delete().eq('id', emp_id).execute()
         
         if delete_response.data is not None:
-            print(f" 직원 완전 삭제 성공: ID {emp_id}, 이름: {employee_name}")
-            
-            # 강제 로그아웃을 위한 세션 무효화
-            if 'blacklisted_sessions' not in session:
-                session['blacklisted_sessions'] = []
+            logger.info("직원 완전 삭제 성공: ID %s, 이름: %s", emp_id, employee_name)
             
-            # 해당 직원의 모든 세션을 블랙리스트에 추가
-            session['blacklisted_sessions'].append(employee_name)
+            # 강제 로그아웃: 해당 직원의 모든 세션을 서버 세션 저장소에서 삭제
+            session_store.revoke_employee(emp_id)
             
             return jsonify({
                 'success': True, 
@@ -925,23 +909,20 @@ def permanent_delete_employee(emp_id):
                 'employee_name': employee_name
             })
         else:
-            print(f" 직원 완전 삭제 실패: ID {emp_id}")
+            logger.warning("직원 완전 삭제 실패: ID %s", emp_id)
             return jsonify({'success': False, 'message': '삭제에 실패했습니다.'}), 500
             
     except Exception as e:
-        print(f" 직원 완전 삭제 오류: {e}")
+        logger.error("직원 완전 삭제 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/customers', methods=['GET', 'POST'])
 def manage_customers():
-    print(f"[DEBUG] /api/customers 접근 시도")
-    print(f"[DEBUG] 현재 세션: {dict(session)}")
-    print(f"[DEBUG] employee_id in session: {'employee_id' in session}")
-    print(f"[DEBUG] is_admin: {session.get('is_admin')}")
+    logger.debug("/api/customers 접근 - employee_id: %s, is_admin: %s", session.get('employee_id'), session.get('is_admin'))
     
     # 관리자 또는 직원만 접근 가능
     if 'employee_id' not in session and not session.get('is_admin'):
-        print(f"[ERROR] 권한 없음 - 세션에 employee_id나 is_admin이 없음")
+        logger.debug("로그인 필요 - 세션에 employee_id나 is_admin이 없음")
         return jsonify({'error': 'Unauthorized'}), 401
     
     employee_id = session.get('employee_id')
@@ -953,336 +934,72 @@ def manage_customers():
         # all_employees 파라미터로 모든 직원의 고객 조회 여부 결정
         all_employees = request.args.get('all_employees') == 'true'
         
-        # 페이지네이션 파라미터
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 20))
-        offset = (page - 1) * per_page
+        # 페이지네이션 파라미터 (cursor 지정 시 커서 페이지네이션)
+        cursor = request.args.get('cursor')
         
-        # Supabase 연결
-        supabase = supabase_utils.get_supabase()
-        if not supabase:
-            print(" Supabase 연결 실패 - 빈 데이터 반환")
-            return jsonify({
-                'customers': [],
-                'total_count': 0,
-                'page': page,
-                'per_page': per_page,
-                'total_pages': 0
-            })
+        # all_employees=true 요청 시 권한 검증 (팀장 또는 관리자만 모든 고객 조회 가능)
+        if all_employees and session.get('employee_role') != '팀장' and not session.get('is_admin'):
+            logger.warning("권한 없음 - 역할: %s, 직원ID: %s", session.get('employee_role'), employee_id)
+            return jsonify({'error': '팀장 또는 관리자 권한이 필요합니다.'}), 403
+        
+        # 관리자는 전체, 팀장(all_employees)은 팀, 직원은 본인 고객
+        if session.get('is_admin'):
+            scope, scope_value = 'all', None
+        elif all_employees:
+            scope, scope_value = 'team', session.get('employee_team')
+        else:
+            scope, scope_value = 'own', employee_id
         
         try:
-            # all_employees=true 요청 시 권한 검증
-            if all_employees:
-                # 팀장 또는 관리자만 모든 고객 조회 가능
-                is_team_leader = session.get('employee_role') == '팀장'
-                is_admin = session.get('is_admin')
-                
-                if not is_team_leader and not is_admin:
-                    print(f" 권한 없음 - 역할: {session.get('employee_role')}, 직원ID: {employee_id}")
-                    return jsonify({'error': '팀장 또는 관리자 권한이 필요합니다.'}), 403
-            
-            # **관리자는 모든 고객 데이터 조회**
-            if session.get('is_admin'):
-                print(f" 관리자 권한 - 모든 고객 데이터 조회")
-                
-                # 전체 카운트 조회
-                count_response = supabase.table('employee_customers').select('id', count='exact').execute()
-                total_count = count_response.count if count_response.count else 0
-                
-                # 모든 고객 데이터 조회 (페이지네이션 적용)
-                query = supabase.table('employee_customers').select('*')
-                query = query.order('created_date', desc=True)
-                query = query.range(offset, offset + per_page - 1)
-                
-                response = query.execute()
-                
-                if hasattr(response, 'data') and response.data:
-                    customers = response.data
-                    total_pages = (total_count + per_page - 1) // per_page
-                    
-                    print(f" 관리자 고객 조회 성공: {len(customers)}개 (전체: {total_count}개)")
-                    
-                    return jsonify({
-                        'customers': customers,
-                        'total_count': total_count,
-                        'page': page,
-                        'per_page': per_page,
-                        'total_pages': total_pages
-                    })
-                else:
-                    print(" 관리자 권한 - 고객 데이터 없음")
-                    return jsonify({
-                        'customers': [],
-                        'total_count': 0,
-                        'page': page,
-                        'per_page': per_page,
-                        'total_pages': 0
-                    })
-            
-            # **팀장은 자신의 팀 직원들의 고객만 조회**
-            elif all_employees and session.get('employee_role') == '팀장':
-                current_team = session.get('employee_team')
-                print(f" 팀장 권한 - {current_team} 팀 고객 조회")
-                
-                if not current_team:
-                    print(" 팀 정보 없음")
-                    return jsonify({'error': '팀 정보를 찾을 수 없습니다.'}), 400
-                
-                # 팀 기반 고객 카운트 조회
-                count_response = supabase.table('employee_customers').select('id', count='exact').eq('employee_team', current_team).execute()
-                total_count = count_response.count if count_response.count else 0
-                
-                # 팀 기반 고객 데이터 조회
-                query = supabase.table('employee_customers').select('*')
-                query = query.eq('employee_team', current_team)
-                query = query.order('created_date', desc=True)
-                query = query.range(offset, offset + per_page - 1)
-                
-                response = query.execute()
-                
-                if hasattr(response, 'data') and response.data:
-                    customers = response.data
-                    total_pages = (total_count + per_page - 1) // per_page
-                    
-                    print(f" 팀장 고객 조회 성공: {len(customers)}개 (팀: {current_team}, 전체: {total_count}개)")
-                    
-                    return jsonify({
-                        'customers': customers,
-                        'total_count': total_count,
-                        'page': page,
-                        'per_page': per_page,
-                        'total_pages': total_pages
-                    })
-                else:
-                    print(f" {current_team} 팀 고객 데이터 없음")
-                    return jsonify({
-                        'customers': [],
-                        'total_count': 0,
-                        'page': page,
-                        'per_page': per_page,
-                        'total_pages': 0
-                    })
-            
-            else:
-                # 일반 직원은 본인 고객만 조회
-                print(f" 직원용 고객관리 - {employee_id} 고객 조회")
-                
-                count_response = supabase.table('employee_customers').select('id', count='exact').eq('employee_id', employee_id).execute()
-                total_count = count_response.count if count_response.count else 0
-                
-                query = supabase.table('employee_customers').select('*').eq('employee_id', employee_id)
-                query = query.order('created_date', desc=True)
-                query = query.range(offset, offset + per_page - 1)
-                
-                response = query.execute()
-                
-                if hasattr(response, 'data') and response.data:
-                    customers = response.data
-                    total_pages = (total_count + per_page - 1) // per_page
-                    
-                    print(f" 직원용 고객관리 조회 성공: {len(customers)}개 고객 (전체: {total_count}개)")
-                    
-                    return jsonify({
-                        'customers': customers,
-                        'total_count': total_count,
-                        'page': page,
-                        'per_page': per_page,
-                        'total_pages': total_pages
-                    })
-                else:
-                    return jsonify({
-                        'customers': [],
-                        'total_count': 0,
-                        'page': page,
-                        'per_page': per_page,
-                        'total_pages': 0
-                    })
-                
+            page, per_page = _page_args()
+            result = supabase_utils.list_rows('employee_customers', scope, scope_value,
+                                              page=page, per_page=per_page, cursor=cursor)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         except Exception as e:
-            print(f" 고객관리 조회 오류: {e}")
+            logger.error("고객관리 조회 오류: %s", e)
             return jsonify({
                 'error': f'고객 조회 중 오류가 발생했습니다: {str(e)}'
             }), 500
         
-        # 아래는 기존 테스트 데이터 (삭제 예정)
-        if False:  # 테스트 모드 비활성화
-            sample_customers = [
-                {
-                    'id': 1,
-                    'inquiry_date': '2024-08-15',
-                    'customer_name': '김철수',
-                    'customer_phone': '010-1234-5678',
-                    'budget': 5000,
-                    'rooms': '2룸',
-                    'location': '강남구',
-                    'loan_needed': True,
-                    'parking_needed': True,
-                    'memo': '급하게 구하고 있음',
-                    'status': '상담중',
-                    'employee_id': '원형',
-                    'employee_name': '원형'
-                },
-                {
-                    'id': 2,
-                    'inquiry_date': '2024-08-14',
-                    'customer_name': '이영희',
-                    'customer_phone': '010-9876-5432',
-                    'budget': 3000,
-                    'rooms': '1룸',
-                    'location': '서초구',
-                    'loan_needed': False,
-                    'parking_needed': False,
-                    'memo': '펫 가능한 곳 선호',
-                    'status': '계약완료',
-                    'employee_id': '테스트',
-                    'employee_name': '테스트'
-                },
-                {
-                    'id': 3,
-                    'inquiry_date': '2024-08-13',
-                    'customer_name': '박민수',
-                    'customer_phone': '010-5555-1234',
-                    'budget': 7000,
-                    'rooms': '3룸',
-                    'location': '송파구',
-                    'loan_needed': True,
-                    'parking_needed': True,
-                    'memo': '학군 좋은 지역 희망',
-                    'status': '대기중',
-                    'employee_id': 'admin',
-                    'employee_name': '관리자'
-                }
-            ]
-            
-            # 관리자이고 all_employees=true인 경우 모든 샘플 데이터 반환
-            if session.get('is_admin') and all_employees:
-                total_count = len(sample_customers)
-                paginated_customers = sample_customers[offset:offset + per_page]
-                return jsonify({
-                    'customers': paginated_customers,
-                    'total_count': total_count,
-                    'page': page,
-                    'per_page': per_page,
-                    'total_pages': (total_count + per_page - 1) // per_page
-                })
-            # 관리자가 아니거나 all_employees=false인 경우 해당 직원 데이터만 반환
-            else:
-                filtered_customers = [c for c in sample_customers if c['employee_id'] == employee_id]
-                total_count = len(filtered_customers)
-                paginated_customers = filtered_customers[offset:offset + per_page]
-                return jsonify({
-                    'customers': paginated_customers,
-                    'total_count': total_count,
-                    'page': page,
-                    'per_page': per_page,
-                    'total_pages': (total_count + per_page - 1) // per_page
-                })
-        
-        try:
-            # Supabase에서 고객 목록 조회
-            customers_data = supabase_utils.get_customers_with_pagination(page, per_page, employee_id, all_employees)
-            
-            if customers_data:
-                customers_list = customers_data.get('customers', [])
-                total_count = customers_data.get('total_count', 0)
-                total_pages = customers_data.get('total_pages', 0)
-                
-                # employee_name 필드 추가 및 미확인 좋아요 수 계산
-                for customer in customers_list:
-                    customer['employee_name'] = customer.get('employee_id', '')
-                    
-                    # 미확인 좋아요 수 계산 (주거용)
-                    management_site_id = customer.get('management_site_id')
-                    if management_site_id:
-                        try:
-                            # Supabase 클라이언트 가져오기
-                            supabase_client = supabase_utils.get_supabase()
-                            if supabase_client:
-                                # 주거용 미확인 좋아요 수
-                                residence_likes = supabase_client.table('residence_links').select('id').eq('management_site_id', management_site_id).eq('liked', True).eq('is_checked', False).execute()
-                                print(f"  [DEBUG] residence_links 쿼리 결과: {residence_likes.data}")
-                                customer['unchecked_likes_residence'] = len(residence_likes.data) if residence_likes.data else 0
-                                
-                                # 업무용 미확인 좋아요 수
-                                office_likes = supabase_client.table('office_links').select('id').eq('management_site_id', management_site_id).eq('liked', True).eq('is_checked', False).execute()
-                                print(f"  [DEBUG] office_links 쿼리 결과: {office_likes.data}")
-                                customer['unchecked_likes_business'] = len(office_likes.data) if office_likes.data else 0
-                                
-                                # 디버깅 로그 추가
-                                print(f"[고객 {customer.get('customer_name')}] management_site_id: {management_site_id}")
-                                print(f"  주거용 미확인 좋아요: {customer['unchecked_likes_residence']}건")
-                                print(f"  업무용 미확인 좋아요: {customer['unchecked_likes_business']}건")
-                            else:
-                                print(f" Supabase 클라이언트를 가져올 수 없음")
-                                customer['unchecked_likes_residence'] = 0
-                                customer['unchecked_likes_business'] = 0
-                            
-                        except Exception as e:
-                            print(f"미확인 좋아요 수 계산 오류: {e}")
-                            customer['unchecked_likes_residence'] = 0
-                            customer['unchecked_likes_business'] = 0
-                    else:
-                        customer['unchecked_likes_residence'] = 0
-                        customer['unchecked_likes_business'] = 0
-                
-                print(f"[고객 목록] 조회된 고객 수: {len(customers_list)} (페이지 {page}/{total_pages})")
-                
-                return jsonify({
-                    'customers': customers_list,
-                    'total_count': total_count,
-                    'page': page,
-                    'per_page': per_page,
-                    'total_pages': total_pages
-                })
-            else:
-                print(" 고객 목록 조회 실패")
-                return jsonify({
-                    'customers': [],
-                    'total_count': 0,
-                    'page': page,
-                    'per_page': per_page,
-                    'total_pages': 0
-                })
+        if result is None:
+            logger.warning("Supabase 연결 실패 - 빈 데이터 반환")
+        else:
+            logger.debug("고객 조회 성공 (%s): %s개", scope, len(result['data']))
+        return jsonify(supabase_utils.listing_payload(result, 'customers', page, per_page))
 
-        except Exception as e:
-            print(f"고객 목록 조회 오류: {e}")
-            return jsonify({'error': f'고객 목록 조회 실패: {e}'}), 500
-        
     # --- POST 요청: 새 고객 추가 ---
     if request.method == 'POST':
         try:
             data = request.get_json()
-            print(f"[DEBUG] 고객 추가 요청 받음")
-            print(f"[DEBUG] 요청 데이터: {data}")
-            print(f"[DEBUG] 현재 세션: {dict(session)}")
             
             # 관리자인 경우 특별한 employee_id 사용
             if session.get('is_admin'):
                 current_employee_id = 999999  # 관리자용 특별 ID
                 current_employee_name = '관리자'
                 current_employee_team = '관리자'
-                print(f"[DEBUG] 관리자 접근")
+                logger.debug("관리자 고객 추가")
             else:
                 current_employee_id = session.get('employee_id')
                 current_employee_name = session.get('employee_name')
                 current_employee_team = session.get('employee_team')
-                print(f"[DEBUG] 직원 정보: id={current_employee_id}, name={current_employee_name}, team={current_employee_team}")
+                logger.debug("직원 정보: id=%s, name=%s, team=%s", current_employee_id, current_employee_name, current_employee_team)
                 
                 # 직원 정보가 없으면 오류 반환
                 if not current_employee_id:
-                    print(f"[ERROR] 직원 ID가 세션에 없음")
+                    logger.warning("직원 ID가 세션에 없음")
                     return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
                 
                 # employee_id를 정수로 변환
                 try:
                     current_employee_id = int(current_employee_id)
                 except (ValueError, TypeError):
-                    print(f"[ERROR] employee_id를 정수로 변환할 수 없음: {current_employee_id}")
+                    logger.warning("employee_id를 정수로 변환할 수 없음: %s", current_employee_id)
                     return jsonify({'success': False, 'message': '직원 ID가 유효하지 않습니다.'}), 400
             
             is_team_leader = session.get('employee_role') == '팀장'
             
-            print(f" 요청자: employee_id={current_employee_id}, name={current_employee_name}, team={current_employee_team}")
+            logger.debug("요청자: employee_id=%s, name=%s, team=%s", current_employee_id, current_employee_name, current_employee_team)
 
             # 데이터 타입 변환 및 검증
             def clean_value(value, field_type='text'):
@@ -1330,12 +1047,12 @@ def manage_customers():
             
             # 팀장의 경우 팀 정보가 제대로 설정되었는지 확인
             if is_team_leader and not customer_data['employee_team']:
-                print(f" 팀장 '{current_employee_name}'의 팀 정보가 설정되지 않음")
+                logger.debug("팀장 '%s'의 팀 정보가 설정되지 않음", current_employee_name)
                 return jsonify({'success': False, 'message': '팀 정보가 설정되지 않았습니다. 관리자에게 문의하세요.'}), 400
             
             # 필수 필드 검증
             if not customer_data.get('customer_name'):
-                print(f" 필수 필드 누락: customer_name")
+                logger.debug("필수 필드 누락: customer_name")
                 return jsonify({'success': False, 'message': '고객명은 필수 입력 항목입니다.'}), 400
             
             # move_in_date가 제공된 경우에만 추가 (선택적 필드)
@@ -1346,14 +1063,12 @@ def manage_customers():
             management_site_id = str(uuid.uuid4().hex)[:8]
             customer_data['management_site_id'] = management_site_id
 
-            print(f" 고객 추가 시도: {customer_data.get('customer_name', 'Unknown')}")
-            print(f" 전송할 고객 데이터: {customer_data}")
+            logger.debug("고객 추가 시도: %s", customer_data.get('customer_name', 'Unknown'))
             
             new_customer = supabase_utils.add_customer(customer_data)
-            print(f" add_customer 결과: {new_customer}")
             
             if not new_customer:
-                print(f" 고객 추가 실패: add_customer가 None 반환")
+                logger.warning("고객 추가 실패: add_customer가 None 반환")
                 error_msg = '고객 추가 중 오류가 발생했습니다.'
                 if not customer_data.get('customer_name'):
                     error_msg = '고객명은 필수 입력 항목입니다.'
@@ -1408,14 +1123,14 @@ def manage_customers():
                 if supabase:
                     # 주거사이트 저장
                     residence_response = supabase.table('residence_links').insert(residence_site_data).execute()
-                    print(f" 주거사이트 생성 성공: {management_site_id}")
+                    logger.info("주거사이트 생성 성공: %s", management_site_id)
                     
                     # 업무사이트 저장
                     business_response = supabase.table('office_links').insert(business_site_data).execute()
-                    print(f" 업무사이트 생성 성공: {management_site_id}")
+                    logger.info("업무사이트 생성 성공: %s", management_site_id)
                 
             except Exception as e:
-                print(f" 사이트 생성 중 오류 발생: {e}")
+                logger.error("사이트 생성 중 오류 발생: %s", e)
                 # 사이트 생성 실패해도 고객 추가는 성공으로 처리
 
             return jsonify({
@@ -1426,16 +1141,14 @@ def manage_customers():
             })
 
         except Exception as e:
-            print(f" 고객 추가 중 예외 발생: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("고객 추가 중 예외 발생: %s", e)
             return jsonify({
                 'success': False, 
                 'message': f'고객 추가 중 오류 발생: {str(e)}',
                 'error_type': type(e).__name__
             }), 500
 
-@app.route('/api/customers/<int:customer_id>', methods=['PUT', 'DELETE'])
+@app.route('/api/customers/<int:customer_id>', methods=['GET', 'PUT', 'DELETE'])
 def update_delete_customer(customer_id):
     if 'employee_id' not in session and not session.get('is_admin'):
         return jsonify({'error': 'Unauthorized'}), 401
@@ -1461,6 +1174,14 @@ def update_delete_customer(customer_id):
             if not customer.data or customer.data[0]['employees']['team'] != employee_team:
                 return jsonify({'success': False, 'message': '같은 팀 고객만 수정할 수 있습니다.'}), 403
 
+        if request.method == 'GET':
+            # 고객 상세 조회 (목록에는 없는 컬럼까지 전체)
+            response = supabase.table('employee_customers').select(supabase_utils.projection('employee_customers', 'detail'))\
+                .eq('id', customer_id).limit(1).execute()
+            if not response.data:
+                return jsonify({'success': False, 'message': '고객을 찾을 수 없습니다.'}), 404
+            return jsonify({'success': True, 'customer': response.data[0]})
+
         if request.method == 'PUT':
             data = request.get_json() or {}
             
@@ -1482,6 +1203,7 @@ def update_delete_customer(customer_id):
             
             if update_data:
                 response = supabase.table('employee_customers').update(update_data).eq('id', customer_id).execute()
+                supabase_utils.invalidate_customer_summaries(response.data)
                 if response.data:
                     return jsonify({'success': True, 'message': '고객 정보가 수정되었습니다.'})
                 else:
@@ -1493,6 +1215,7 @@ def update_delete_customer(customer_id):
             response = supabase.table('employee_customers').delete().eq('id', customer_id).execute()
             if response.data is None:
                 return jsonify({'success': False, 'message': '삭제 실패'}), 500
+            supabase_utils.invalidate_customer_summaries(response.data)
             return jsonify({'success': True, 'message': '고객이 삭제되었습니다.'})
 
     except Exception as e:
@@ -1536,7 +1259,7 @@ def update_customer_memo(customer_id):
             }
             res = supabase.table('employee_customers').update(update_data).eq('id', customer_id).execute()
         except Exception as e:
-            print(f" 메모 업데이트 실패, 오류: {e}")
+            logger.error("메모 업데이트 실패, 오류: %s", e)
             raise e
         
         if res.data is None:
@@ -1547,26 +1270,25 @@ def update_customer_memo(customer_id):
 
 @app.route('/api/customers/<int:customer_id>/field', methods=['PUT'])
 def update_customer_field(customer_id):
-    print(f" 고객 필드 업데이트 요청: customer_id={customer_id}")
+    logger.debug("고객 필드 업데이트 요청: customer_id=%s", customer_id)
     
     if 'employee_id' not in session and not session.get('is_admin'):
-        print(f" 인증 실패: 세션에 employee_id 없음")
+        logger.debug("인증 실패: 세션에 employee_id 없음")
         return jsonify({'error': 'Unauthorized'}), 401
     
     employee_id = session.get('employee_id')
     is_admin = bool(session.get('is_admin'))
     is_team_leader = session.get('employee_role') == '팀장'
     
-    print(f" 요청자: employee_id={employee_id}, is_admin={is_admin}, is_team_leader={is_team_leader}")
+    logger.debug("요청자: employee_id=%s, is_admin=%s, is_team_leader=%s", employee_id, is_admin, is_team_leader)
     
     data = request.get_json()
-    print(f" 받은 데이터: {data}")
     
     if not data:
         return jsonify({'success': False, 'error': '데이터가 없습니다'}), 400
     
     field, value = list(data.items())[0]
-    print(f" 업데이트할 필드: {field} = {value}")
+    logger.debug("업데이트할 필드: %s = %s", field, value)
 
     # 허용된 필드 목록 (프론트엔드 필드명과 일치)
     allowed_fields = [
@@ -1598,7 +1320,7 @@ def update_customer_field(customer_id):
                 if customer.data[0].get('employee_team') != employee_team:
                     return jsonify({'success': False, 'message': '같은 팀 고객만 수정할 수 있습니다.'}), 403
             except Exception as e:
-                print(f"팀장 권한 확인 중 오류: {e}")
+                logger.error("팀장 권한 확인 중 오류: %s", e)
                 return jsonify({'success': False, 'message': '권한 확인 중 오류가 발생했습니다.'}), 500
         
         # 데이터 타입 변환 및 검증 (실제 테이블 구조 기반)
@@ -1629,7 +1351,7 @@ def update_customer_field(customer_id):
         cleaned_value = clean_update_value(value, field)
         update_data = {field: cleaned_value}
         
-        print(f"필드 업데이트 시도: {field} = {cleaned_value} (원본: {value})")
+        logger.debug("필드 업데이트 시도: %s = %s (원본: %s)", field, cleaned_value, value)
         
         # updated_date 필드 업데이트 (실제 테이블에 존재하는 필드명)
         from datetime import datetime
@@ -1640,26 +1362,23 @@ def update_customer_field(customer_id):
         
         try:
             res = supabase.table('employee_customers').update(update_data).eq('id', customer_id).execute()
-            print(f" 업데이트 성공: {res.data}")
+            supabase_utils.invalidate_customer_summaries(res.data)
+            logger.debug("업데이트 성공: 고객 ID %s", customer_id)
         except Exception as e:
-            print(f" Supabase 업데이트 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Supabase 업데이트 오류: %s", e)
             return jsonify({
                 'success': False, 
                 'error': f'데이터베이스 업데이트 실패: {str(e)}'
             }), 500
         
         if res.data is None or len(res.data) == 0:
-            print(f" 업데이트 결과가 없음")
+            logger.warning("업데이트 결과가 없음")
             return jsonify({'success': False, 'error': '업데이트 실패 - 데이터가 없습니다'}), 500
         
-        print(f" 필드 업데이트 성공: {field} = {cleaned_value}")
+        logger.info("필드 업데이트 성공: %s = %s", field, cleaned_value)
         return jsonify({'success': True, 'message': f'{field} 필드가 업데이트되었습니다.'})
     except Exception as e:
-        print(f" 고객 필드 업데이트 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("고객 필드 업데이트 오류: %s", e)
         return jsonify({
             'success': False, 
             'error': f'서버 오류가 발생했습니다: {str(e)}'
@@ -1673,13 +1392,14 @@ def team_leader_customers():
         return jsonify({'error': '팀장만 접근 가능합니다.'}), 403
     
     team_leader_id = session.get('employee_id')
-    page = int(request.args.get('page', 1))
-    per_page = int(request.args.get('per_page', 20))
-    offset = (page - 1) * per_page
+    try:
+        page, per_page = _page_args()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     # Supabase 연결 확인
     if not os.environ.get('SUPABASE_URL') or not os.environ.get('SUPABASE_KEY'):
-        print(" 테스트 모드 - 팀장 본인 고객 샘플 데이터 반환")
+        logger.debug("테스트 모드 - 팀장 본인 고객 샘플 데이터 반환")
         sample_customers = [
             {
                 'id': 1,
@@ -1700,7 +1420,7 @@ def team_leader_customers():
         ]
         
         total_count = len(sample_customers)
-        paginated_customers = sample_customers[offset:offset + per_page]
+        paginated_customers = sample_customers[(page - 1) * per_page:page * per_page]
         return jsonify({
             'customers': paginated_customers,
             'total_count': total_count,
@@ -1709,28 +1429,23 @@ def team_leader_customers():
             'total_pages': (total_count + per_page - 1) // per_page
         })
     
-    # Supabase에서 팀장 본인의 고객 조회
+    # Supabase에서 팀장 본인의 고객 조회 (DB 에서 페이지 단위로 조회)
     try:
-        customers = supabase_utils.get_team_leader_customers(team_leader_id, per_page)
-        
-        # 페이지네이션 처리
-        total_count = len(customers)
-        paginated_customers = customers[offset:offset + per_page]
+        result = supabase_utils.list_rows('employee_customers', 'own', team_leader_id,
+                                          default_sort=('inquiry_date', 'desc'), page=page, per_page=per_page,
+                                          cursor=request.args.get('cursor'))
+        payload = supabase_utils.listing_payload(result, 'customers', page, per_page)
         
         # employee_name 필드 추가
-        for customer in paginated_customers:
+        for customer in payload['customers']:
             customer['employee_name'] = customer.get('employee_id', '')
         
-        return jsonify({
-            'customers': paginated_customers,
-            'total_count': total_count,
-            'page': page,
-            'per_page': per_page,
-            'total_pages': (total_count + per_page - 1) // per_page
-        })
+        return jsonify(payload)
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
-        print(f"팀장 본인 고객 조회 오류: {e}")
+        logger.error("팀장 본인 고객 조회 오류: %s", e)
         return jsonify({'error': f'팀장 본인 고객 조회 실패: {e}'}), 500
 
 @app.route('/api/team-leader/maeiple', methods=['GET'])
@@ -1740,88 +1455,39 @@ def team_leader_maeiple():
         return jsonify({'error': '팀장만 접근 가능합니다.'}), 403
     
     team_name = session.get('employee_team')
-    page = int(request.args.get('page', 1))
-    per_page = int(request.args.get('per_page', 20))
-    offset = (page - 1) * per_page
+    cursor = request.args.get('cursor')
     
     # 정렬 파라미터 가져오기
     sort_by = request.args.get('sort_by', 'check_date')
     sort_order = request.args.get('sort_order', 'desc')
     
-    print(f" 팀장 팀 전체 매물 조회 - 팀: {team_name}, 페이지: {page}, 정렬: {sort_by} {sort_order}")
+    logger.debug("팀장 팀 전체 매물 조회 - 팀: %s, 정렬: %s %s", team_name, sort_by, sort_order)
     
-    # Supabase 연결
-    supabase = supabase_utils.get_supabase()
-    if not supabase:
-        print(" Supabase 연결 실패 - 빈 데이터 반환")
-        return jsonify({
-            'success': True,
-            'properties': [],
-            'total_count': 0,
-            'page': page,
-            'per_page': per_page,
-            'total_pages': 0
-        })
+    # 팀장은 자신의 팀 전체 매물, 팀 정보가 없는 관리자는 전체 매물 조회
+    if session.get('is_admin') and not team_name:
+        scope = 'all'
+    else:
+        scope = 'team'
     
     try:
-        # **팀장은 자신의 팀 전체 매물 조회**
-        print(f" 팀장용 메이플관리 - 팀 '{team_name}' 전체 매물 조회 시작")
-        
-        # 전체 카운트 조회 (팀 필터링)
-        count_response = supabase.table('maeiple_properties').select('id', count='exact').eq('employee_team', team_name).execute()
-        total_count = count_response.count if count_response.count else 0
-        
-        # 정렬 컬럼 유효성 검사
-        valid_sort_columns = ['id', 'check_date', 'building_number', 'room_number', 'status', 'jeonse_price', 'monthly_rent', 'sale_price', 'created_at', 'updated_at']
-        if sort_by not in valid_sort_columns:
-            sort_by = 'check_date'
-        
-        # 정렬 방향 유효성 검사
-        if sort_order not in ['asc', 'desc']:
-            sort_order = 'desc'
-        
-        # 팀 전체 매물 데이터 조회 (페이지네이션 적용)
-        query = supabase.table('maeiple_properties').select('*').eq('employee_team', team_name)
-        
-        # 정렬 적용
-        query = query.order(sort_by, desc=(sort_order == 'desc'))
-        
-        # 페이지네이션 적용
-        query = query.range(offset, offset + per_page - 1)
-        
-        response = query.execute()
-        
-        if hasattr(response, 'data') and response.data:
-            properties = response.data
-            total_pages = (total_count + per_page - 1) // per_page
-            
-            print(f" 팀장용 메이플관리 조회 성공: 팀 '{team_name}' - {len(properties)}개 매물 (전체: {total_count}개, 페이지: {page}/{total_pages})")
-            
-            return jsonify({
-                'success': True,
-                'properties': properties,
-                'total_count': total_count,
-                'page': page,
-                'per_page': per_page,
-                'total_pages': total_pages
-            })
-        else:
-            print(f" 팀 '{team_name}' 매물 데이터 없음")
-            return jsonify({
-                'success': True,
-                'properties': [],
-                'total_count': 0,
-                'page': page,
-                'per_page': per_page,
-                'total_pages': 0
-            })
-            
+        page, per_page = _page_args()
+        result = supabase_utils.list_rows('maeiple_properties', scope, team_name,
+                                          sort_by=sort_by, sort_order=sort_order,
+                                          page=page, per_page=per_page, cursor=cursor)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
-        print(f" 팀장용 메이플관리 조회 오류: {e}")
+        logger.error("팀장용 메이플관리 조회 오류: %s", e)
         return jsonify({
             'success': False,
             'error': f'팀 매물 조회 중 오류가 발생했습니다: {str(e)}'
         }), 500
+    
+    if result is None:
+        logger.warning("Supabase 연결 실패 - 빈 데이터 반환")
+    else:
+        logger.debug("팀장용 메이플관리 조회 성공: 팀 '%s' - %s개 매물", team_name, len(result['data']))
+    return jsonify(supabase_utils.listing_payload(result, 'properties', page, per_page, success=True))
 
 @app.route('/api/team/customers', methods=['GET'])
 def team_customers():
@@ -1830,13 +1496,14 @@ def team_customers():
         return jsonify({'error': '팀장만 접근 가능합니다.'}), 403
     
     team_name = session.get('employee_team')
-    page = int(request.args.get('page', 1))
-    per_page = int(request.args.get('per_page', 20))
-    offset = (page - 1) * per_page
+    try:
+        page, per_page = _page_args()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     # Supabase 연결 확인
     if not os.environ.get('SUPABASE_URL') or not os.environ.get('SUPABASE_KEY'):
-        print(" 테스트 모드 - 팀 전체 고객 샘플 데이터 반환")
+        logger.debug("테스트 모드 - 팀 전체 고객 샘플 데이터 반환")
         sample_customers = [
             {
                 'id': 1,
@@ -1873,7 +1540,7 @@ def team_customers():
         ]
         
         total_count = len(sample_customers)
-        paginated_customers = sample_customers[offset:offset + per_page]
+        paginated_customers = sample_customers[(page - 1) * per_page:page * per_page]
         return jsonify({
             'customers': paginated_customers,
             'total_count': total_count,
@@ -1882,28 +1549,23 @@ def team_customers():
             'total_pages': (total_count + per_page - 1) // per_page
         })
     
-    # Supabase에서 팀 전체 고객 조회
+    # Supabase에서 팀 전체 고객 조회 (팀장 + 팀원, DB 에서 페이지 단위로 조회)
     try:
-        customers = supabase_utils.get_team_all_customers(team_name, per_page)
-        
-        # 페이지네이션 처리
-        total_count = len(customers)
-        paginated_customers = customers[offset:offset + per_page]
+        result = supabase_utils.list_rows('employee_customers', 'team', team_name,
+                                          default_sort=('inquiry_date', 'desc'), page=page, per_page=per_page,
+                                          cursor=request.args.get('cursor'))
+        payload = supabase_utils.listing_payload(result, 'customers', page, per_page)
         
         # employee_name 필드 추가
-        for customer in paginated_customers:
+        for customer in payload['customers']:
             customer['employee_name'] = customer.get('employee_id', '')
         
-        return jsonify({
-            'customers': paginated_customers,
-            'total_count': total_count,
-            'page': page,
-            'per_page': per_page,
-            'total_pages': (total_count + per_page - 1) // per_page
-        })
+        return jsonify(payload)
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
-        print(f"팀 전체 고객 조회 오류: {e}")
+        logger.error("팀 전체 고객 조회 오류: %s", e)
         return jsonify({'error': f'팀 전체 고객 조회 실패: {e}'}), 500
 
 @app.route('/api/team/maeiple', methods=['GET'])
@@ -1913,13 +1575,14 @@ def team_maeiple():
         return jsonify({'error': '팀장만 접근 가능합니다.'}), 403
     
     team_name = session.get('employee_team')
-    page = int(request.args.get('page', 1))
-    per_page = int(request.args.get('per_page', 20))
-    offset = (page - 1) * per_page
+    try:
+        page, per_page = _page_args()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     # Supabase 연결 확인
     if not os.environ.get('SUPABASE_URL') or not os.environ.get('SUPABASE_KEY'):
-        print(" 테스트 모드 - 팀 전체 매물 샘플 데이터 반환")
+        logger.debug("테스트 모드 - 팀 전체 매물 샘플 데이터 반환")
         sample_properties = [
             {
                 'id': 1,
@@ -1960,7 +1623,7 @@ def team_maeiple():
         ]
         
         total_count = len(sample_properties)
-        paginated_properties = sample_properties[offset:offset + per_page]
+        paginated_properties = sample_properties[(page - 1) * per_page:page * per_page]
         return jsonify({
             'success': True,
             'properties': paginated_properties,
@@ -1970,23 +1633,14 @@ def team_maeiple():
             'total_pages': (total_count + per_page - 1) // per_page
         })
     
-    # Supabase에서 팀 전체 매물 조회
+    # Supabase에서 팀 전체 매물 조회 (DB 에서 페이지 단위로 조회)
     try:
-        properties = supabase_utils.get_team_all_maeiple_properties(team_name, per_page)
-        
-        # 페이지네이션 처리
-        total_count = len(properties)
-        paginated_properties = properties[offset:offset + per_page]
-        
-        return jsonify({
-            'success': True,
-            'properties': paginated_properties,
-            'total_count': total_count,
-            'page': page,
-            'per_page': per_page,
-            'total_pages': (total_count + per_page - 1) // per_page
-        })
+        result = supabase_utils.list_rows('maeiple_properties', 'team', team_name,
+                                          page=page, per_page=per_page, cursor=request.args.get('cursor'))
+        return jsonify(supabase_utils.listing_payload(result, 'properties', page, per_page, success=True))
         
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -2003,22 +1657,23 @@ def residence_index():
         return render_template('index.html', customer_name=customer_name, move_in_date=move_in_date, employee_id=employee_id)
         
     except Exception as e:
-        print(f"[주거용] 메인 페이지 오류: {e}")
+        logger.error("주거용 메인 페이지 오류: %s", e)
         return f"주거용 사이트 오류: {e}", 500
 
 @app.route('/residence/customer/<management_site_id>')
 def residence_customer_site(management_site_id):
     """주거용 고객별 사이트"""
-    print(f"[주거ROUTE] 고객 사이트 접근 - management_site_id: {management_site_id}")
+    logger.debug("주거 고객 사이트 접근 - management_site_id: %s", management_site_id)
     try:
         # 고객 정보 Supabase에서 조회
         supabase = supabase_utils.get_supabase()
         if not supabase:
             return "데이터베이스 연결이 설정되지 않았습니다.", 500
 
-        res = supabase.table('employee_customers').select('*').eq('management_site_id', management_site_id).limit(1).execute()
-        if not res.data:
-            print(f"[주거ROUTE] 고객 정보를 찾을 수 없음: {management_site_id}")
+        # 고객 요약 정보 (캐시 우선 조회)
+        customer_info = supabase_utils.get_customer_summary(management_site_id)
+        if not customer_info:
+            logger.info("주거 고객 사이트 - 고객 정보를 찾을 수 없음: %s", management_site_id)
             return f"""
             <h1>고객 정보를 찾을 수 없습니다</h1>
             <p>요청한 management_site_id: <strong>{management_site_id}</strong></p>
@@ -2026,17 +1681,13 @@ def residence_customer_site(management_site_id):
             <p><a href="/dashboard">대시보드로 돌아가기</a></p>
             """, 404
 
-        customer_info = res.data[0]
         customer_name = customer_info.get('customer_name', '고객')
-        print(f"[주거ROUTE] 고객 정보 조회 성공 - 이름: {customer_name}")
+        logger.debug("주거 고객 사이트 - 고객 정보 조회 성공 - 이름: %s", customer_name)
 
-        # 미확인 좋아요 처리 (주거용)
-        try:
-            supabase.table('residence_links').update({'is_checked': True}).eq('management_site_id', management_site_id).eq('liked', True).eq('is_checked', False).execute()
-        except Exception as e:
-            print(f"미확인 좋아요 처리 오류: {e}")
+        # 미확인 좋아요 처리 (주거용) - 백그라운드에서 처리하고 페이지는 바로 렌더링
+        supabase_utils.queue_mark_likes_checked('residence', management_site_id)
     except Exception as e:
-        print(f"[주거ROUTE] 처리 중 오류: {e}")
+        logger.error("주거 고객 사이트 처리 중 오류: %s", e)
         return f"주거용 사이트 오류: {e}", 500
     
     return render_template('index.html', 
@@ -2057,21 +1708,22 @@ def business_index():
         return render_template('업무용_index.html', customer_name=customer_name, move_in_date=move_in_date, employee_id=employee_id)
         
     except Exception as e:
-        print(f"[업무용] 메인 페이지 오류: {e}")
+        logger.error("업무용 메인 페이지 오류: %s", e)
         return f"업무용 사이트 오류: {e}", 500
 
 @app.route('/business/customer/<management_site_id>')
 def business_customer_site(management_site_id):
     """업무용 고객별 사이트"""
-    print(f"[업무ROUTE] 고객 사이트 접근 - management_site_id: {management_site_id}")
+    logger.debug("업무 고객 사이트 접근 - management_site_id: %s", management_site_id)
     try:
         supabase = supabase_utils.get_supabase()
         if not supabase:
             return "데이터베이스 연결이 설정되지 않았습니다.", 500
 
-        res = supabase.table('employee_customers').select('*').eq('management_site_id', management_site_id).limit(1).execute()
-        if not res.data:
-            print(f"[업무ROUTE] 고객 정보를 찾을 수 없음: {management_site_id}")
+        # 고객 요약 정보 (캐시 우선 조회)
+        customer_info = supabase_utils.get_customer_summary(management_site_id)
+        if not customer_info:
+            logger.info("업무 고객 사이트 - 고객 정보를 찾을 수 없음: %s", management_site_id)
             return f"""
             <h1>고객 정보를 찾을 수 없습니다</h1>
             <p>요청한 management_site_id: <strong>{management_site_id}</strong></p>
@@ -2079,17 +1731,13 @@ def business_customer_site(management_site_id):
             <p><a href="/dashboard">대시보드로 돌아가기</a></p>
             """, 404
 
-        customer_info = res.data[0]
         customer_name = customer_info.get('customer_name', '고객')
-        print(f"[업무ROUTE] 고객 정보 조회 성공 - 이름: {customer_name}")
+        logger.debug("업무 고객 사이트 - 고객 정보 조회 성공 - 이름: %s", customer_name)
 
-        # 미확인 좋아요 처리 (업무용)
-        try:
-            supabase.table('office_links').update({'is_checked': True}).eq('management_site_id', management_site_id).eq('liked', True).eq('is_checked', False).execute()
-        except Exception as e:
-            print(f"미확인 좋아요 처리 오류: {e}")
+        # 미확인 좋아요 처리 (업무용) - 백그라운드에서 처리하고 페이지는 바로 렌더링
+        supabase_utils.queue_mark_likes_checked('business', management_site_id)
     except Exception as e:
-        print(f"[업무ROUTE] 처리 중 오류: {e}")
+        logger.error("업무 고객 사이트 처리 중 오류: %s", e)
         return f"업무용 사이트 오류: {e}", 500
     
     return render_template('업무용_index.html', 
@@ -2161,8 +1809,8 @@ def residence_links():
                 return jsonify([])
 
             # 주거용 링크는 residence_links 테이블 사용
-            def build_query(table_name: str):
-                q = supabase.table(table_name).select('*')
+            def build_query(table_name: str, columns: str):
+                q = supabase.table(table_name).select(columns)
                 if management_site_id:
                     q = q.eq('management_site_id', management_site_id)
                 else:
@@ -2183,7 +1831,7 @@ def residence_links():
                     q = q.eq('guarantee_insurance', False)
                 return q.order('id', desc=True)
 
-            res = build_query('residence_links').execute()
+            res = build_query('residence_links', supabase_utils.projection('residence_links')).execute()
 
             data = res.data or []
             return jsonify(data)
@@ -2290,27 +1938,30 @@ def business_links():
         supabase = supabase_utils.get_supabase()
         if not supabase:
             return jsonify([])
-        q = supabase.table('office_links').select('*')
-        if management_site_id:
-            q = q.eq('management_site_id', management_site_id)
-        # management_site_id가 없는 경우는 전체 조회로 처리
-        if platform_filter != 'all':
-            q = q.eq('platform', platform_filter)
-        if user_filter != 'all':
-            q = q.eq('added_by', user_filter)
-        if like_filter == 'liked':
-            q = q.eq('liked', True)
-        elif like_filter == 'disliked':
-            q = q.eq('disliked', True)
-        elif like_filter == 'none':
-            q = q.eq('liked', False).eq('disliked', False)
-        if date_filter:
-            q = q.eq('date_added', date_filter)
-        if guarantee_filter == 'available':
-            q = q.eq('guarantee_insurance', True)
-        elif guarantee_filter == 'unavailable':
-            q = q.eq('guarantee_insurance', False)
-        res = q.order('id', desc=True).execute()
+        def build_query(columns: str):
+            q = supabase.table('office_links').select(columns)
+            if management_site_id:
+                q = q.eq('management_site_id', management_site_id)
+            # management_site_id가 없는 경우는 전체 조회로 처리
+            if platform_filter != 'all':
+                q = q.eq('platform', platform_filter)
+            if user_filter != 'all':
+                q = q.eq('added_by', user_filter)
+            if like_filter == 'liked':
+                q = q.eq('liked', True)
+            elif like_filter == 'disliked':
+                q = q.eq('disliked', True)
+            elif like_filter == 'none':
+                q = q.eq('liked', False).eq('disliked', False)
+            if date_filter:
+                q = q.eq('date_added', date_filter)
+            if guarantee_filter == 'available':
+                q = q.eq('guarantee_insurance', True)
+            elif guarantee_filter == 'unavailable':
+                q = q.eq('guarantee_insurance', False)
+            return q.order('id', desc=True)
+        
+        res = build_query(supabase_utils.projection('office_links')).execute()
         return jsonify(res.data or [])
 
 @app.route('/api/office-links/<int:link_id>', methods=['PUT', 'DELETE'])
@@ -2370,27 +2021,26 @@ def debug_check_customers():
         supabase = supabase_utils.get_supabase()
         if not supabase:
             return jsonify({'error': 'Database connection failed'}), 500
-        cursor = conn.cursor()
-        
-        # 테이블 구조 확인
-        cursor.execute("""
-            SELECT column_name, data_type 
-            FROM information_schema.columns 
-            WHERE table_name = 'employee_customers'
-            ORDER BY ordinal_position
-        """)
-        columns = cursor.fetchall()
         
         # 최근 고객 데이터 확인
-        cursor.execute("""
-            SELECT id, employee_id, customer_name, management_site_id, created_date 
-            FROM employee_customers 
-            ORDER BY id DESC 
-            LIMIT 20
-        """)
-        customers = cursor.fetchall()
-        
-        conn.close()
+        customers = supabase.table('employee_customers')\
+            .select('id, employee_id, customer_name, management_site_id, created_date')\
+            .order('id', desc=True)\
+            .limit(20)\
+            .execute().data or []
+        
+        # 테이블 구조 확인 (직접 연결이 있으면 information_schema, 없으면 행 하나의 값 타입으로 추정)
+        if pg_pool.is_enabled():
+            columns = pg_pool.fetch_all("""
+                SELECT column_name, data_type 
+                FROM information_schema.columns 
+                WHERE table_name = 'employee_customers'
+                ORDER BY ordinal_position
+            """, label='information_schema')
+        else:
+            sample = supabase.table('employee_customers').select('*').limit(1).execute().data or [{}]
+            columns = [{'column_name': name, 'data_type': type(value).__name__ if value is not None else '-'}
+                       for name, value in sample[0].items()]
         
         html = """
         <h1>Employee Customers 테이블 디버깅</h1>
@@ -2443,10 +2093,9 @@ def customer_info_api():
             supabase = supabase_utils.get_supabase()
             if not supabase:
                 return jsonify({'error': '데이터베이스 연결 실패'}), 500
-            res = supabase.table('employee_customers').select('*').eq('management_site_id', management_site_id).limit(1).execute()
-            if not res.data:
+            customer_info = supabase_utils.get_customer_summary(management_site_id)
+            if not customer_info:
                 return jsonify({'error': '고객 정보를 찾을 수 없습니다.'}), 404
-            customer_info = res.data[0]
             return jsonify({
                 'customer_name': customer_info.get('customer_name', '고객'),
                 'move_in_date': customer_info.get('move_in_date', ''),
@@ -2471,6 +2120,7 @@ def customer_info_api():
             if not update_data:
                 return jsonify({'success': True})
             res = supabase.table('employee_customers').update(update_data).eq('management_site_id', management_site_id).execute()
+            supabase_utils.invalidate_customer_summary(management_site_id)
             if res.data is None:
                 return jsonify({'error': '업데이트 실패'}), 500
             return jsonify({'success': True})
@@ -2495,11 +2145,11 @@ def mark_residence_likes_checked():
         # 해당 고객의 주거용 좋아요를 모두 확인 처리
         res = supabase.table('residence_links').update({'is_checked': True}).eq('management_site_id', management_site_id).eq('liked', True).eq('is_checked', False).execute()
         
-        print(f"주거사이트 좋아요 알림 확인 처리: {management_site_id}")
+        logger.debug("주거사이트 좋아요 알림 확인 처리: %s", management_site_id)
         return jsonify({'success': True})
         
     except Exception as e:
-        print(f"주거사이트 알림 확인 처리 오류: {e}")
+        logger.error("주거사이트 알림 확인 처리 오류: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/mark-business-likes-checked', methods=['POST'])
@@ -2519,11 +2169,11 @@ def mark_business_likes_checked():
         # 해당 고객의 업무용 좋아요를 모두 확인 처리
         res = supabase.table('office_links').update({'is_checked': True}).eq('management_site_id', management_site_id).eq('liked', True).eq('is_checked', False).execute()
         
-        print(f"업무사이트 좋아요 알림 확인 처리: {management_site_id}")
+        logger.debug("업무사이트 좋아요 알림 확인 처리: %s", management_site_id)
         return jsonify({'success': True})
         
     except Exception as e:
-        print(f"업무사이트 알림 확인 처리 오류: {e}")
+        logger.error("업무사이트 알림 확인 처리 오류: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 # ==================== 매이플관리 API 라우트 ====================
@@ -2548,20 +2198,22 @@ def employee_maeiple_api():
         sort_by = request.args.get('sort_by', 'check_date')
         sort_order = request.args.get('sort_order', 'desc')
         
-        # 페이지네이션 파라미터
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 20))
-        offset = (page - 1) * per_page
+        # 페이지네이션 파라미터 (cursor 지정 시 커서 페이지네이션)
+        try:
+            page, per_page = _page_args()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        cursor = request.args.get('cursor')
         
         # Supabase 연결 확인
         if not os.environ.get('SUPABASE_URL') or not os.environ.get('SUPABASE_KEY'):
-            print(" 테스트 모드 - 직원 개인용 샘플 매물 데이터 반환")
+            logger.debug("테스트 모드 - 직원 개인용 샘플 매물 데이터 반환")
             
             # 현재 사용자 정보 가져오기
             current_user = session.get('employee_id', '')
             current_name = session.get('employee_name', '직원')
             current_team = session.get('employee_team', '')
-            print(f" 직원 개인 메이플관리 - 사용자: {current_user}, 팀: {current_team}")
+            logger.debug("직원 개인 메이플관리 - 사용자: %s, 팀: %s", current_user, current_team)
             
             # 모든 샘플 매물 데이터
             all_sample_properties = [
@@ -2605,19 +2257,19 @@ def employee_maeiple_api():
             
             # 현재 직원의 개인 매물만 필터링
             personal_properties = [p for p in all_sample_properties if p['employee_id'] == current_user]
-            print(f" 직원 개인 매물 필터링: {current_user}의 매물 {len(personal_properties)}개")
+            logger.debug("직원 개인 매물 필터링: %s의 매물 %s개", current_user, len(personal_properties))
             
             # 테스트 모드에서 생성된 매물도 포함
             if 'test_maeiple_properties' in session:
                 test_properties = session['test_maeiple_properties']
                 # 현재 직원의 테스트 매물만 필터링
                 user_test_properties = [p for p in test_properties if p['employee_id'] == current_user]
-                print(f" 테스트 모드 매물 포함: {len(user_test_properties)}개")
+                logger.debug("테스트 모드 매물 포함: %s개", len(user_test_properties))
                 personal_properties.extend(user_test_properties)
             else:
-                print(" 테스트 모드 매물 없음")
+                logger.debug("테스트 모드 매물 없음")
             
-            print(f" 총 매물 수: {len(personal_properties)}개")
+            logger.debug("총 매물 수: %s개", len(personal_properties))
             
             # 테스트 모드에서도 정렬 적용
             if sort_by == 'check_date':
@@ -2625,7 +2277,7 @@ def employee_maeiple_api():
             
             # 페이지네이션 적용
             total_count = len(personal_properties)
-            paginated_properties = personal_properties[offset:offset + per_page]
+            paginated_properties = personal_properties[(page - 1) * per_page:page * per_page]
             
             return jsonify({
                 'success': True, 
@@ -2636,52 +2288,31 @@ def employee_maeiple_api():
                 'total_pages': (total_count + per_page - 1) // per_page
             })
         
+        # Supabase에서 개인 매물 목록 조회
         try:
-            # Supabase에서 개인 매물 목록 조회
-            current_user = session.get('employee_id', '')
-            
-            properties_data = supabase_utils.get_maeiple_properties_with_pagination(
-                page, per_page, current_user, sort_by, sort_order
-            )
-            
-            if properties_data:
-                properties = properties_data.get('properties', [])
-                total_count = properties_data.get('total_count', 0)
-                total_pages = properties_data.get('total_pages', 0)
-                
-                print(f"[직원 매물 목록] 조회된 매물 수: {len(properties)} (페이지 {page}/{total_pages})")
-                
-                return jsonify({
-                    'success': True, 
-                    'properties': properties,
-                    'total_count': total_count,
-                    'page': page,
-                    'per_page': per_page,
-                    'total_pages': total_pages
-                })
-            else:
-                print(" 직원 매물 목록 조회 실패")
-                return jsonify({
-                    'success': False,
-                    'properties': [],
-                    'total_count': 0,
-                    'page': page,
-                    'per_page': per_page,
-                    'total_pages': 0
-                })
-                
+            result = supabase_utils.list_rows('maeiple_properties', 'own', session.get('employee_id', ''),
+                                              sort_by=sort_by, sort_order=sort_order,
+                                              page=page, per_page=per_page, cursor=cursor)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         except Exception as e:
-            print(f" 직원 매물 목록 조회 중 오류: {e}")
+            logger.error("직원 매물 목록 조회 중 오류: %s", e)
             return jsonify({'error': str(e)}), 500
+        
+        if result is None:
+            logger.warning("직원 매물 목록 조회 실패")
+            return jsonify(supabase_utils.listing_payload(None, 'properties', page, per_page, success=False))
+        
+        logger.debug("직원 매물 목록 조회: %s개", len(result['data']))
+        return jsonify(supabase_utils.listing_payload(result, 'properties', page, per_page, success=True))
     
     elif request.method == 'POST':
         try:
-            print("=== 직원 매물 생성 API 호출 ===")
+            logger.debug("=== 직원 매물 생성 API 호출 ===")
             data = request.json
-            print(f" 직원 매물 생성 요청: {data}")
             
             if not data:
-                print(" 요청 데이터가 없습니다.")
+                logger.info("요청 데이터가 없습니다.")
                 return jsonify({'success': False, 'error': '요청 데이터가 없습니다.'}), 400
             
             # 현재 로그인한 사용자 정보 가져오기
@@ -2689,18 +2320,17 @@ def employee_maeiple_api():
             employee_name = session.get('employee_name', '시스템')
             employee_team = session.get('employee_team', '관리자')
             
-            print(f" 현재 사용자: {employee_id} ({employee_name}) - 팀: {employee_team}")
-            print(f" 세션 정보: {dict(session)}")
+            logger.debug("현재 사용자: %s (%s) - 팀: %s", employee_id, employee_name, employee_team)
 
             # 필수 필드 검증 - 임시로 비활성화하여 테스트
             building_number = data.get('building_number', '')
             room_number = data.get('room_number', '')
             
-            print(f" 받은 동 번호: '{building_number}' (타입: {type(building_number)})")
-            print(f" 받은 호수: '{room_number}' (타입: {type(room_number)})")
+            logger.debug("받은 동 번호: '%s' (타입: %s)", building_number, type(building_number))
+            logger.debug("받은 호수: '%s' (타입: %s)", room_number, type(room_number))
             
             # 임시로 필수 검증 제거 - 테스트 목적
-            print(" 필수 필드 검증 임시 비활성화 - 테스트 모드")
+            logger.debug("필수 필드 검증 임시 비활성화 - 테스트 모드")
 
             property_data = {
                 'check_date': data.get('check_date'),
@@ -2721,11 +2351,9 @@ def employee_maeiple_api():
                 'employee_team': employee_team
             }
             
-            print(f" 생성할 매물 데이터: {property_data}")
-
             # Supabase 연결 확인
             if not os.environ.get('SUPABASE_URL') or not os.environ.get('SUPABASE_KEY'):
-                print(" 테스트 모드 - 매물 생성 시뮬레이션")
+                logger.info("테스트 모드 - 매물 생성 시뮬레이션")
                 
                 # 테스트 모드에서는 가상 ID 생성
                 import random
@@ -2743,9 +2371,8 @@ def employee_maeiple_api():
                 }
                 
                 session['test_maeiple_properties'].append(new_property)
-                print(f" 테스트 모드 매물 생성 완료: ID {new_id}")
-                print(f" 현재 테스트 매물 수: {len(session['test_maeiple_properties'])}")
-                print(f" 생성된 매물 상세: {new_property}")
+                logger.info("테스트 모드 매물 생성 완료: ID %s", new_id)
+                logger.debug("현재 테스트 매물 수: %s", len(session['test_maeiple_properties']))
                 
                 response_data = {
                     'success': True, 
@@ -2754,29 +2381,24 @@ def employee_maeiple_api():
                     'created_property': new_property
                 }
                 
-                print(f" 응답 데이터: {response_data}")
                 return jsonify(response_data)
 
             # 실제 Supabase 연결이 있는 경우
-            print(" Supabase 연결 시도...")
+            logger.debug("Supabase 연결 시도...")
             try:
                 new_prop = supabase_utils.create_maeiple_property(property_data)
                 if not new_prop:
-                    print(" Supabase 매물 생성 실패 - create_maeiple_property returned None")
+                    logger.warning("Supabase 매물 생성 실패 - create_maeiple_property returned None")
                     return jsonify({'success': False, 'error': '매물 생성 실패: 데이터베이스 저장 오류'}), 500
 
-                print(f" Supabase 매물 생성 완료: {new_prop}")
+                logger.info("Supabase 매물 생성 완료: id=%s", new_prop.get('id'))
                 return jsonify({'success': True, 'id': new_prop.get('id')})
             except Exception as supabase_error:
-                print(f" Supabase 매물 생성 중 예외 발생: {supabase_error}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("Supabase 매물 생성 중 예외 발생: %s", supabase_error)
                 return jsonify({'success': False, 'error': f'데이터베이스 오류: {str(supabase_error)}'}), 500
 
         except Exception as e:
-            print(f" 매물 생성 중 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("매물 생성 중 오류: %s", e)
             return jsonify({'success': False, 'error': f'매물 생성 중 오류가 발생했습니다: {str(e)}'}), 500
 
 @app.route('/api/employee/maeiple/update', methods=['POST'])
@@ -2799,7 +2421,7 @@ def employee_maeiple_update():
         if not supabase:
             return jsonify({'error': 'Supabase 연결 실패'}), 500
         
-        print(f" 매물 업데이트 요청: ID={property_id}, field={field}, value={value}")
+        logger.debug("매물 업데이트 요청: ID=%s, field=%s, value=%s", property_id, field, value)
         
         # 업데이트할 데이터 준비
         update_data = {field: value}
@@ -2808,14 +2430,14 @@ def employee_maeiple_update():
         response = supabase.table('maeiple_properties').update(update_data).eq('id', property_id).execute()
         
         if hasattr(response, 'data') and response.data:
-            print(f" 업데이트 성공: {field} = {value}")
+            logger.info("업데이트 성공: %s = %s", field, value)
             return jsonify({
                 'success': True, 
                 'message': f'{field} 필드가 성공적으로 업데이트되었습니다.',
                 'updated_data': response.data[0] if response.data else None
             })
         else:
-            print(f" 업데이트 실패: {response}")
+            logger.warning("업데이트 실패: 매물 ID %s", property_id)
             return jsonify({'error': '데이터 업데이트에 실패했습니다.'}), 500
         
     except Exception as e:
@@ -2845,10 +2467,10 @@ def employee_maeiple_memo():
         response = supabase.table('maeiple_properties').update({'memo': memo}).eq('id', property_id).execute()
         
         if response.data:
-            print(f" 메모 저장 성공: ID {property_id}")
+            logger.info("메모 저장 성공: ID %s", property_id)
             return jsonify({'success': True, 'message': '메모가 저장되었습니다.'})
         else:
-            print(f" 메모 저장 실패: ID {property_id}")
+            logger.warning("메모 저장 실패: ID %s", property_id)
             return jsonify({'success': False, 'message': '매물을 찾을 수 없습니다.'}), 404
         
     except Exception as e:
@@ -2870,10 +2492,10 @@ def employee_maeiple_delete(property_id):
         response = supabase.table('maeiple_properties').delete().eq('id', property_id).execute()
         
         if response.data is not None:
-            print(f" 매물 삭제 성공: ID {property_id}")
+            logger.info("매물 삭제 성공: ID %s", property_id)
             return jsonify({'success': True, 'message': '매물이 삭제되었습니다.'})
         else:
-            print(f" 매물 삭제 실패: ID {property_id}")
+            logger.warning("매물 삭제 실패: ID %s", property_id)
             return jsonify({'success': False, 'message': '매물을 찾을 수 없습니다.'}), 404
         
     except Exception as e:
@@ -2881,7 +2503,10 @@ def employee_maeiple_delete(property_id):
 
 @app.route('/api/employee/unchecked-likes', methods=['GET'])
 def employee_unchecked_likes():
-    """직원용 미확인 좋아요 수 조회 API"""
+    """직원용 미확인 좋아요 수 조회 API
+
+    일괄 조회 API 와 같이 employee_customers 에 저장된 카운터(sql/unchecked_likes_counters.sql 트리거가 유지)를 읽습니다.
+    """
     if 'employee_id' not in session:
         return jsonify({'error': '로그인이 필요합니다.'}), 401
     
@@ -2892,34 +2517,46 @@ def employee_unchecked_likes():
         if not management_site_id:
             return jsonify({'error': 'management_site_id가 필요합니다.'}), 400
         
-        # Supabase 연결 확인
-        supabase = supabase_utils.get_supabase()
-        if not supabase:
-            print(f" Supabase 연결 실패 - 0 반환")
-            return jsonify({'success': True, 'count': 0})
-        
-        # 실제 데이터베이스에서 미확인 좋아요 수 조회
-        supabase = supabase_utils.get_supabase()
-        if not supabase:
-            return jsonify({'error': '데이터베이스 연결 실패'}), 500
-        
-        if link_type == 'residence':
-            # 주거사이트 링크에서 미확인 좋아요 수 조회
-            response = supabase.table('residence_links').select('id').eq('management_site_id', management_site_id).eq('liked', True).eq('is_checked', False).execute()
-        elif link_type == 'business':
-            # 업무사이트 링크에서 미확인 좋아요 수 조회
-            response = supabase.table('office_links').select('id').eq('management_site_id', management_site_id).eq('liked', True).eq('is_checked', False).execute()
-        else:
+        if link_type not in supabase_utils.UNCHECKED_LIKES_COLUMNS:
             # 알 수 없는 타입은 0 반환
             return jsonify({'success': True, 'count': 0})
         
-        unchecked_count = len(response.data) if response.data else 0
+        counts = supabase_utils.get_unchecked_likes_counts([management_site_id])
+        unchecked_count = counts[management_site_id][link_type]
         
-        print(f" 미확인 좋아요 수 조회 성공: {management_site_id} - {unchecked_count}개")
+        logger.debug("미확인 좋아요 수 조회 성공: %s - %s개", management_site_id, unchecked_count)
         return jsonify({'success': True, 'count': unchecked_count})
         
     except Exception as e:
-        print(f" 미확인 좋아요 수 조회 오류: {e}")
+        logger.error("미확인 좋아요 수 조회 오류: %s", e)
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/employee/unchecked-likes/batch', methods=['POST'])
+def employee_unchecked_likes_batch():
+    """직원용 미확인 좋아요 수 일괄 조회 API (여러 고객의 주거/업무 개수를 한 번에 반환)
+
+    개수는 employee_customers 에 저장된 카운터에서 읽습니다.
+    """
+    if 'employee_id' not in session:
+        return jsonify({'error': '로그인이 필요합니다.'}), 401
+    
+    try:
+        data = request.get_json() or {}
+        management_site_ids = data.get('management_site_ids', [])
+        
+        if not isinstance(management_site_ids, list):
+            return jsonify({'error': 'management_site_ids는 목록이어야 합니다.'}), 400
+        
+        if len(management_site_ids) > supabase_utils.UNCHECKED_LIKES_BATCH_LIMIT:
+            return jsonify({'error': f'management_site_ids는 최대 {supabase_utils.UNCHECKED_LIKES_BATCH_LIMIT}개까지 조회할 수 있습니다.'}), 400
+
+        management_site_ids = [str(site_id) for site_id in management_site_ids if site_id]
+        counts = supabase_utils.get_unchecked_likes_counts(management_site_ids)
+        
+        return jsonify({'success': True, 'counts': counts})
+        
+    except Exception as e:
+        logger.error("미확인 좋아요 수 일괄 조회 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/maeiple', methods=['GET', 'POST'])
@@ -2938,20 +2575,22 @@ def maeiple_api():
         sort_by = request.args.get('sort_by', 'id')  # 기본: ID (순위 고정)
         sort_order = request.args.get('sort_order', 'asc')  # 기본: 오름차순
         
-        # 페이지네이션 파라미터
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 20))
-        offset = (page - 1) * per_page
+        # 페이지네이션 파라미터 (cursor 지정 시 커서 페이지네이션)
+        try:
+            page, per_page = _page_args()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        cursor = request.args.get('cursor')
         
         # Supabase 연결
         supabase = supabase_utils.get_supabase()
         if not supabase:
-            print(" Supabase 연결 실패 - 테스트 모드로 동작")
+            logger.warning("Supabase 연결 실패 - 테스트 모드로 동작")
             
             # 테스트 모드에서는 세션에 저장된 매물 데이터 반환
             if 'test_maeiple_properties' in session:
                 test_properties = session['test_maeiple_properties']
-                print(f" 테스트 모드 - 세션에 저장된 매물 {len(test_properties)}개 반환")
+                logger.debug("테스트 모드 - 세션에 저장된 매물 %s개 반환", len(test_properties))
                 
                 # 정렬 적용
                 if sort_by == 'id':
@@ -2961,7 +2600,7 @@ def maeiple_api():
                 
                 # 페이지네이션 적용
                 total_count = len(test_properties)
-                paginated_properties = test_properties[offset:offset + per_page]
+                paginated_properties = test_properties[(page - 1) * per_page:page * per_page]
                 total_pages = (total_count + per_page - 1) // per_page
                 
                 return jsonify({
@@ -2973,7 +2612,7 @@ def maeiple_api():
                     'total_pages': total_pages
                 })
             else:
-                print(" 테스트 모드 - 세션에 저장된 매물 없음")
+                logger.debug("테스트 모드 - 세션에 저장된 매물 없음")
                 return jsonify({
                     'success': True,
                     'properties': [],
@@ -2983,212 +2622,28 @@ def maeiple_api():
                     'total_pages': 0
                 })
         
+        # 삭제되지 않은 모든 매물 조회 (employee_name 지정 시 해당 직원 매물만)
         try:
-            # **관리자는 모든 매물 데이터 조회** (삭제되지 않은 모든 데이터)
-            print(f" 관리자용 메이플관리 - 모든 DB 데이터 조회 시작")
-            
-            # 전체 카운트 조회
-            count_response = supabase.table('maeiple_properties').select('id', count='exact').execute()
-            total_count = count_response.count if count_response.count else 0
-            
-            # 정렬 컬럼 유효성 검사
-            valid_sort_columns = ['id', 'check_date', 'building_number', 'room_number', 'status', 'jeonse_price', 'monthly_rent', 'sale_price', 'created_at', 'updated_at']
-            if sort_by not in valid_sort_columns:
-                sort_by = 'id'  # 기본값을 ID로 변경
-            
-            # 정렬 방향 유효성 검사
-            if sort_order not in ['asc', 'desc']:
-                sort_order = 'asc'  # 기본값을 오름차순으로 변경
-            
-            # 모든 매물 데이터 조회 (페이지네이션 적용)
-            query = supabase.table('maeiple_properties').select('*')
-            
-            # 정렬 적용
-            query = query.order(sort_by, desc=(sort_order == 'desc'))
-            
-            # 페이지네이션 적용
-            query = query.range(offset, offset + per_page - 1)
-            
-            response = query.execute()
-            
-            if hasattr(response, 'data') and response.data:
-                properties = response.data
-                total_pages = (total_count + per_page - 1) // per_page
-                
-                print(f" 관리자용 메이플관리 조회 성공: {len(properties)}개 매물 (전체: {total_count}개, 페이지: {page}/{total_pages})")
-                
-                return jsonify({
-                    'success': True,
-                    'properties': properties,
-                    'total_count': total_count,
-                    'page': page,
-                    'per_page': per_page,
-                    'total_pages': total_pages
-                })
-            else:
-                print(" 매물 데이터 없음")
-                return jsonify({
-                    'success': True,
-                    'properties': [],
-                    'total_count': 0,
-                    'page': page,
-                    'per_page': per_page,
-                    'total_pages': 0
-                })
-                
+            result = supabase_utils.list_rows('maeiple_properties', 'all',
+                                              filters={'employee_name': request.args.get('employee_name')},
+                                              sort_by=sort_by, sort_order=sort_order, default_sort=('id', 'asc'),
+                                              page=page, per_page=per_page, cursor=cursor)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         except Exception as e:
-            print(f" 관리자용 메이플관리 조회 오류: {e}")
+            logger.error("관리자용 메이플관리 조회 오류: %s", e)
             return jsonify({
                 'success': False,
                 'error': f'매물 조회 중 오류가 발생했습니다: {str(e)}'
             }), 500
         
-        # 아래는 기존 테스트 데이터 (삭제 예정)
-        if False:  # 테스트 모드 비활성화
-            all_sample_properties = [
-                {
-                    'id': 1,
-                    'check_date': '2024-08-12',
-                    'building_number': 101,
-                    'room_number': 1001,
-                    'status': '거래중',
-                    'jeonse_price': 5000,
-                    'monthly_rent': 50,
-                    'sale_price': 80000,
-                    'is_occupied': False,
-                    'phone': '010-1234-5678',
-                    'memo': '역세권, 교통편리',
-                    'likes': 3,
-                    'dislikes': 1,
-                    'employee_id': current_user,  # 실제 세션 값 사용
-                    'employee_name': current_name,  # 실제 세션 값 사용
-                    'employee_team': current_team   # 실제 세션 값 사용
-                },
-                {
-                    'id': 2,
-                    'check_date': '2024-08-11',
-                    'building_number': 102,
-                    'room_number': 2001,
-                    'status': '거래완료',
-                    'jeonse_price': 6000,
-                    'monthly_rent': 60,
-                    'sale_price': 90000,
-                    'is_occupied': True,
-                    'phone': '010-2345-6789',
-                    'memo': '신축, 주차가능',
-                    'likes': 5,
-                    'dislikes': 0,
-                    'employee_id': '테스트',
-                    'employee_name': '테스트',
-                    'employee_team': '위플러스'
-                },
-                {
-                    'id': 3,
-                    'check_date': '2024-08-10',
-                    'building_number': 103,
-                    'room_number': 3001,
-                    'status': '거래중',
-                    'jeonse_price': 4500,
-                    'monthly_rent': 45,
-                    'sale_price': 75000,
-                    'is_occupied': False,
-                    'phone': '010-3456-7890',
-                    'memo': '조용한 단지',
-                    'likes': 2,
-                    'dislikes': 2,
-                    'employee_id': 'admin',
-                    'employee_name': 'admin',
-                    'employee_team': '관리자'
-                },
-                {
-                    'id': 4,
-                    'check_date': '2024-08-09',
-                    'building_number': 104,
-                    'room_number': 4001,
-                    'status': '거래가능',
-                    'jeonse_price': 5500,
-                    'monthly_rent': 55,
-                    'sale_price': 85000,
-                    'is_occupied': False,
-                    'phone': '010-4567-8901',
-                    'memo': '원형의 개인 매물',
-                    'likes': 4,
-                    'dislikes': 0,
-                    'employee_id': current_user,  # 실제 세션 값 사용
-                    'employee_name': current_name,  # 실제 세션 값 사용
-                    'employee_team': current_team   # 실제 세션 값 사용
-                },
-                {
-                    'id': 5,
-                    'check_date': '2024-08-08',
-                    'building_number': 105,
-                    'room_number': 5001,
-                    'status': '거래가능',
-                    'jeonse_price': 4800,
-                    'monthly_rent': 48,
-                    'sale_price': 78000,
-                    'is_occupied': False,
-                    'phone': '010-5678-9012',
-                    'memo': '수정의 개인 매물',
-                    'likes': 3,
-                    'dislikes': 1,
-                    'employee_id': '수정',
-                    'employee_name': '수정',
-                    'employee_team': '위플러스'
-                }
-            ]
-            
-            # 테스트 모드 완전 제거 - 실제 DB 데이터만 사용
-        
-        try:
-            # Supabase에서 매물 목록 조회
-            current_user = session.get('employee_id', '')
-            
-            # 관리자인 경우 모든 매물, 일반 직원인 경우 개인 매물만
-            if session.get('is_admin'):
-                properties_data = supabase_utils.get_maeiple_properties_with_pagination(
-                    page, per_page, None, sort_by, sort_order
-                )
-            else:
-                properties_data = supabase_utils.get_maeiple_properties_with_pagination(
-                    page, per_page, current_user, sort_by, sort_order
-                )
-            
-            if properties_data:
-                properties = properties_data.get('properties', [])
-                total_count = properties_data.get('total_count', 0)
-                total_pages = properties_data.get('total_pages', 0)
-                
-                print(f"[매물 목록] 조회된 매물 수: {len(properties)} (페이지 {page}/{total_pages})")
-                
-                return jsonify({
-                    'success': True, 
-                    'properties': properties,
-                    'total_count': total_count,
-                    'page': page,
-                    'per_page': per_page,
-                    'total_pages': total_pages
-                })
-            else:
-                print(" 매물 목록 조회 실패")
-                return jsonify({
-                    'success': False,
-                    'properties': [],
-                    'total_count': 0,
-                    'page': page,
-                    'per_page': per_page,
-                    'total_pages': 0
-                })
-            
-        except Exception as e:
-            print(f" 매물 목록 조회 중 오류: {e}")
-            return jsonify({'error': str(e)}), 500
-    
+        logger.debug("관리자용 메이플관리 조회 성공: %s개 매물", len(result['data']) if result else 0)
+        return jsonify(supabase_utils.listing_payload(result, 'properties', page, per_page, success=True))
+
     elif request.method == 'POST':
         try:
-            print("=== 관리자 메이플관리 매물 생성 API 호출 ===")
+            logger.debug("=== 관리자 메이플관리 매물 생성 API 호출 ===")
             data = request.json
-            print(f" 받은 데이터: {data}")
             
             # 현재 로그인한 사용자 정보 가져오기
             if session.get('is_admin'):
@@ -3200,13 +2655,13 @@ def maeiple_api():
                 employee_name = session.get('employee_name', '시스템')
                 employee_team = session.get('employee_team', '관리자')
 
-            print(f" 사용자 정보: {employee_id} ({employee_name}) - 팀: {employee_team}")
+            logger.debug("사용자 정보: %s (%s) - 팀: %s", employee_id, employee_name, employee_team)
 
             # 모든 필드는 선택사항 (필수 검증 제거)
             building_number = data.get('building_number')
             room_number = data.get('room_number')
             
-            print(f" 받은 동/호수: 동={building_number}, 호={room_number}")
+            logger.debug("받은 동/호수: 동=%s, 호=%s", building_number, room_number)
 
             # 데이터 정리 및 변환
             def clean_value(value, field_type='text'):
@@ -3240,11 +2695,9 @@ def maeiple_api():
                 'updated_at': datetime.now().isoformat()
             }
 
-            print(f" 생성할 매물 데이터: {property_data}")
-
             # Supabase 연결 확인
             if not os.environ.get('SUPABASE_URL') or not os.environ.get('SUPABASE_KEY'):
-                print(" 테스트 모드 - 매물 생성 시뮬레이션")
+                logger.info("테스트 모드 - 매물 생성 시뮬레이션")
                 
                 # 테스트 모드에서는 가상 ID 생성
                 import random
@@ -3260,8 +2713,8 @@ def maeiple_api():
                 }
                 
                 session['test_maeiple_properties'].append(new_property)
-                print(f" 테스트 모드 매물 생성 완료: ID {new_id}")
-                print(f" 현재 테스트 매물 수: {len(session['test_maeiple_properties'])}")
+                logger.info("테스트 모드 매물 생성 완료: ID %s", new_id)
+                logger.debug("현재 테스트 매물 수: %s", len(session['test_maeiple_properties']))
                 
                 return jsonify({
                     'success': True, 
@@ -3271,14 +2724,14 @@ def maeiple_api():
                 })
 
             # 실제 Supabase 연결이 있는 경우
-            print(" Supabase 연결 시도...")
+            logger.debug("Supabase 연결 시도...")
             try:
                 new_prop = supabase_utils.create_maeiple_property(property_data)
                 if not new_prop:
-                    print(" Supabase 매물 생성 실패 - create_maeiple_property returned None")
+                    logger.warning("Supabase 매물 생성 실패 - create_maeiple_property returned None")
                     return jsonify({'success': False, 'error': '매물 생성 실패: 데이터베이스 저장 오류'}), 500
 
-                print(f" Supabase 매물 생성 완료: {new_prop}")
+                logger.info("Supabase 매물 생성 완료: id=%s", new_prop.get('id'))
                 return jsonify({
                     'success': True, 
                     'id': new_prop.get('id'),
@@ -3286,33 +2739,29 @@ def maeiple_api():
                     'created_property': new_prop
                 })
             except Exception as supabase_error:
-                print(f" Supabase 매물 생성 중 예외 발생: {supabase_error}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("Supabase 매물 생성 중 예외 발생: %s", supabase_error)
                 return jsonify({'success': False, 'error': f'데이터베이스 오류: {str(supabase_error)}'}), 500
 
         except Exception as e:
-            print(f" 매물 생성 중 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("매물 생성 중 오류: %s", e)
             return jsonify({'success': False, 'error': f'매물 생성 중 오류가 발생했습니다: {str(e)}'}), 500
 
 @app.route('/api/team-leader/team-maeiple', methods=['GET'])
 def team_leader_team_maeiple():
     """팀장 전용 팀 통합 메이플관리 API - 팀 전체의 매물 조회 (팀 통합용)"""
-    print(f" 팀장 팀 통합용 API 호출 - 세션 정보:")
-    print(f"  - employee_id: {session.get('employee_id')}")
-    print(f"  - employee_role: {session.get('employee_role')}")
-    print(f"  - employee_team: {session.get('employee_team')}")
-    print(f"  - is_admin: {session.get('is_admin')}")
+    logger.debug("팀장 팀 통합용 API 호출 - 세션 정보:")
+    logger.debug("- employee_id: %s", session.get('employee_id'))
+    logger.debug("- employee_role: %s", session.get('employee_role'))
+    logger.debug("- employee_team: %s", session.get('employee_team'))
+    logger.debug("- is_admin: %s", session.get('is_admin'))
     
     if 'employee_id' not in session and not session.get('is_admin'):
-        print(" 로그인이 필요합니다.")
+        logger.debug("로그인이 필요합니다.")
         return jsonify({'error': '로그인이 필요합니다.'}), 401
     
     # 팀장이 아니면 접근 거부
     if session.get('employee_role') != '팀장' and not session.get('is_admin'):
-        print(f" 팀장만 접근 가능합니다. 현재 역할: {session.get('employee_role')}")
+        logger.warning("팀장만 접근 가능합니다. 현재 역할: %s", session.get('employee_role'))
         return jsonify({'error': '팀장만 접근 가능합니다.'}), 403
     
     # 정렬 파라미터 가져오기
@@ -3320,17 +2769,18 @@ def team_leader_team_maeiple():
     sort_order = request.args.get('sort_order', 'desc')
     
     # 페이지네이션 파라미터
-    page = int(request.args.get('page', 1))
-    per_page = int(request.args.get('per_page', 20))
-    offset = (page - 1) * per_page
+    try:
+        page, per_page = _page_args()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     # Supabase 연결 확인
     if not os.environ.get('SUPABASE_URL') or not os.environ.get('SUPABASE_KEY'):
-        print(" 테스트 모드 - 팀장 팀 통합용 샘플 매물 데이터 반환")
+        logger.debug("테스트 모드 - 팀장 팀 통합용 샘플 매물 데이터 반환")
         
         # 현재 사용자의 팀 정보 가져오기
         current_team = session.get('employee_team', '')
-        print(f" 팀장 팀 통합용 메이플관리 - 팀: {current_team}")
+        logger.debug("팀장 팀 통합용 메이플관리 - 팀: %s", current_team)
         
         # 모든 팀의 샘플 데이터
         all_sample_properties = [
@@ -3466,11 +2916,11 @@ def team_leader_team_maeiple():
         
         # 현재 팀의 매물만 필터링
         team_properties = [p for p in all_sample_properties if p['employee_team'] == current_team]
-        print(f" 팀별 필터링: {current_team}팀 매물 {len(team_properties)}개")
+        logger.debug("팀별 필터링: %s팀 매물 %s개", current_team, len(team_properties))
         
         # 페이지네이션 적용
         total_count = len(team_properties)
-        paginated_properties = team_properties[offset:offset + per_page]
+        paginated_properties = team_properties[(page - 1) * per_page:page * per_page]
         
         return jsonify({
             'success': True, 
@@ -3482,40 +2932,33 @@ def team_leader_team_maeiple():
             'type': 'team'  # 팀 통합용임을 명시
         })
     
-    # Supabase에서 팀 전체 매물 조회
+    # Supabase에서 팀 전체 매물 조회 (팀 정보가 없는 관리자는 전체 매물)
+    current_team = session.get('employee_team', '')
+    scope = 'all' if session.get('is_admin') and not current_team else 'team'
     try:
-        current_team = session.get('employee_team', '')
-        properties = supabase_utils.get_team_all_maeiple_properties(current_team, per_page)
-        
-        # 페이지네이션 처리
-        total_count = len(properties)
-        paginated_properties = properties[offset:offset + per_page]
-        
-        return jsonify({
-            'success': True, 
-            'properties': paginated_properties,
-            'total_count': total_count,
-            'page': page,
-            'per_page': per_page,
-            'total_pages': (total_count + per_page - 1) // per_page,
-            'type': 'team'  # 팀 통합용임을 명시
-        })
+        result = supabase_utils.list_rows('maeiple_properties', scope, current_team,
+                                          sort_by=sort_by, sort_order=sort_order,
+                                          page=page, per_page=per_page, cursor=request.args.get('cursor'))
+        return jsonify(supabase_utils.listing_payload(result, 'properties', page, per_page, success=True, type='team'))
         
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
+        logger.error("팀장 팀 통합용 매물 조회 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/user-info', methods=['GET'])
 def user_info():
     """현재 로그인한 사용자 정보 반환"""
-    print(f" /api/user-info 호출 - 세션 정보:")
-    print(f"  - is_admin: {session.get('is_admin')}")
-    print(f"  - employee_id: {session.get('employee_id')}")
-    print(f"  - employee_name: {session.get('employee_name')}")
-    print(f"  - employee_team: {session.get('employee_team')}")
-    print(f"  - employee_role: {session.get('employee_role')}")
+    logger.debug("/api/user-info 호출 - 세션 정보:")
+    logger.debug("- is_admin: %s", session.get('is_admin'))
+    logger.debug("- employee_id: %s", session.get('employee_id'))
+    logger.debug("- employee_name: %s", session.get('employee_name'))
+    logger.debug("- employee_team: %s", session.get('employee_team'))
+    logger.debug("- employee_role: %s", session.get('employee_role'))
     
     if not session.get('is_admin') and 'employee_id' not in session:
-        print(" 로그인이 필요합니다.")
+        logger.debug("로그인이 필요합니다.")
         return jsonify({'error': '로그인이 필요합니다.'}), 401
     
     user_info = {
@@ -3528,9 +2971,36 @@ def user_info():
         'employee_role': session.get('employee_role', '직원')  # 중복 필드로 호환성 확보
     }
     
-    print(f" 반환할 user_info: {user_info}")
+    logger.debug("반환할 user_info: %s", user_info)
     return jsonify(user_info)
 
+@app.route('/api/dashboard-stats', methods=['GET'])
+def dashboard_stats():
+    """대시보드 통계 (상태별/팀별/직원별 개수, 좋아요 합계, 일별 신규 등록 수)
+
+    관리자는 전체(team 파라미터 지정 시 해당 팀), 팀장은 자신의 팀, 직원은 본인 데이터만 집계합니다.
+    """
+    if not session.get('is_admin') and 'employee_id' not in session:
+        return jsonify({'error': '로그인이 필요합니다.'}), 401
+
+    if session.get('is_admin'):
+        team = request.args.get('team')
+        scope, scope_value = ('team', team) if team else ('all', None)
+    elif session.get('employee_role') == '팀장':
+        scope, scope_value = 'team', session.get('employee_team')
+    else:
+        scope, scope_value = 'own', session.get('employee_id')
+
+    try:
+        days = min(max(int(request.args.get('days', supabase_utils.DASHBOARD_STATS_DAYS)), 1), 365)
+        stats = supabase_utils.get_dashboard_stats(scope, scope_value, days)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    if not stats:
+        return jsonify({'success': False, 'error': '대시보드 통계 조회 실패'}), 500
+    return jsonify({'success': True, 'scope': scope, 'stats': stats})
+
 @app.route('/api/maeiple/update', methods=['POST'])
 def maeiple_update():
     """매이플관리 매물 업데이트 API (개별 필드)"""
@@ -3570,16 +3040,13 @@ def maeiple_update():
         response = supabase.table('maeiple_properties').update(update_data).eq('id', property_id).execute()
         
         if hasattr(response, 'data') and response.data:
-            print(f" 메이플 매물 업데이트 성공: ID={property_id}, {field}={value}")
+            logger.info("메이플 매물 업데이트 성공: ID=%s, %s=%s", property_id, field, value)
             return jsonify({'success': True, 'message': f'{field} 업데이트 완료'})
         else:
             return jsonify({'error': '매물을 찾을 수 없거나 업데이트에 실패했습니다.'}), 404
         
-        return jsonify({'success': True, 'message': '업데이트 완료'})
-        
     except Exception as e:
-        if 'conn' in locals():
-            conn.close()
+        logger.error("메이플 매물 업데이트 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/maeiple/<int:property_id>', methods=['GET'])
@@ -3593,17 +3060,16 @@ def get_maeiple_property(property_id):
         if not supabase:
             return jsonify({'error': 'Database connection failed'}), 500
         
-        # 매물 조회
-        response = supabase.table('maeiple_properties').select('*').eq('id', property_id).execute()
+        # 매물 상세 조회 (목록에는 없는 컬럼까지 전체)
+        property_data = supabase_utils.get_maeiple_property(property_id)
         
-        if response.data and len(response.data) > 0:
-            property_data = response.data[0]
+        if property_data:
             return jsonify(property_data)
         else:
             return jsonify({'error': '매물을 찾을 수 없습니다.'}), 404
             
     except Exception as e:
-        print(f" 매물 조회 오류: {e}")
+        logger.error("매물 조회 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/maeiple/<int:property_id>/update', methods=['PUT'])
@@ -3636,19 +3102,19 @@ def maeiple_bulk_update(property_id):
         if not update_data:
             return jsonify({'error': '업데이트할 수 있는 필드가 없습니다.'}), 400
         
-        print(f" 매물 {property_id} 업데이트 데이터: {update_data}")
+        logger.debug("매물 %s 업데이트 필드: %s", property_id, sorted(update_data))
         
         # 업데이트 실행
         response = supabase.table('maeiple_properties').update(update_data).eq('id', property_id).execute()
         
         if hasattr(response, 'data') and response.data:
-            print(f" 메이플 매물 전체 업데이트 성공: ID={property_id}")
+            logger.info("메이플 매물 전체 업데이트 성공: ID=%s", property_id)
             return jsonify({'success': True, 'message': '매물 정보가 업데이트되었습니다.'})
         else:
             return jsonify({'error': '매물을 찾을 수 없거나 업데이트에 실패했습니다.'}), 404
         
     except Exception as e:
-        print(f" 매물 업데이트 오류: {e}")
+        logger.error("매물 업데이트 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/maeiple/memo', methods=['POST'])
@@ -3669,34 +3135,22 @@ def maeiple_memo():
         if not property_id:
             return jsonify({'error': '매물 ID가 필요합니다.'}), 400
         
-        # DATABASE_URL이 없으면 테스트 모드로 처리
-        if not os.environ.get('DATABASE_URL'):
-            print(f" 테스트 모드 - 메모 저장 시뮬레이션: ID {property_id}, 메모: {memo}")
-            return jsonify({'success': True, 'message': '테스트 모드 - 메모 저장 시뮬레이션 완료'})
-        
         supabase = supabase_utils.get_supabase()
         if not supabase:
             return jsonify({'error': 'Database connection failed'}), 500
-        cursor = conn.cursor()
         
-        cursor.execute('''
-            UPDATE maeiple_properties 
-            SET memo = %s, updated_at = NOW()
-            WHERE id = %s
-        ''', (memo, property_id))
+        response = supabase.table('maeiple_properties')\
+            .update({'memo': memo, 'updated_at': datetime.now().isoformat()})\
+            .eq('id', property_id)\
+            .execute()
         
-        if cursor.rowcount == 0:
-            conn.close()
+        if not response.data:
             return jsonify({'error': '매물을 찾을 수 없습니다.'}), 404
         
-        conn.commit()
-        conn.close()
-        
         return jsonify({'success': True, 'message': '메모 저장 완료'})
         
     except Exception as e:
-        if 'conn' in locals():
-            conn.close()
+        logger.error("매물 메모 저장 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/maeiple/<int:property_id>', methods=['DELETE'])
@@ -3706,30 +3160,20 @@ def maeiple_delete(property_id):
         return jsonify({'error': '로그인이 필요합니다.'}), 401
     
     try:
-        # DATABASE_URL이 없으면 테스트 모드로 처리
-        if not os.environ.get('DATABASE_URL'):
-            print(f" 테스트 모드 - 매물 삭제 시뮬레이션: ID {property_id}")
-            return jsonify({'success': True, 'message': '테스트 모드 - 매물 삭제 시뮬레이션 완료'})
-        
         supabase = supabase_utils.get_supabase()
         if not supabase:
             return jsonify({'error': 'Database connection failed'}), 500
-        cursor = conn.cursor()
         
-        cursor.execute('DELETE FROM maeiple_properties WHERE id = %s', (property_id,))
+        response = supabase.table('maeiple_properties').delete().eq('id', property_id).execute()
         
-        if cursor.rowcount == 0:
-            conn.close()
+        if not response.data:
             return jsonify({'error': '매물을 찾을 수 없습니다.'}), 404
         
-        conn.commit()
-        conn.close()
-        
+        logger.info("매물 삭제 성공: ID %s", property_id)
         return jsonify({'success': True, 'message': '매물 삭제 완료'})
         
     except Exception as e:
-        if 'conn' in locals():
-            conn.close()
+        logger.error("매물 삭제 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 # ==================== 메이플관리 일괄 처리 API ====================
@@ -3756,7 +3200,7 @@ def maeiple_bulk_assign():
         # 팀장의 경우 권한 확인
         if session.get('employee_role') == '팀장':
             team_name = session.get('employee_team')
-            print(f" 팀장 권한 확인 - 팀: {team_name}")
+            logger.debug("팀장 권한 확인 - 팀: %s", team_name)
             
             # 팀장은 자신의 팀 매물만 변경 가능
             if not team_name:
@@ -3765,51 +3209,32 @@ def maeiple_bulk_assign():
         # Supabase 연결 시도
         supabase = supabase_utils.get_supabase()
         if supabase:
-            # Supabase를 사용하여 실제 DB 업데이트
-            print(f" Supabase를 사용하여 일괄 담당자 변경: {len(property_ids)}개 매물  {employee_name}")
-            success_count = 0
-            
-            for property_id in property_ids:
-                try:
-                    # 팀장의 경우 매물 소유권 확인
-                    if session.get('employee_role') == '팀장':
-                        # 해당 매물이 자신의 팀 매물인지 확인
-                        property_check = supabase.table('maeiple_properties').select('employee_team').eq('id', property_id).execute()
-                        if property_check.data:
-                            property_team = property_check.data[0].get('employee_team')
-                            if property_team != team_name:
-                                print(f" 권한 없음: 매물 {property_id}는 {property_team} 소속 (현재 팀장: {team_name})")
-                                continue
-                        else:
-                            print(f" 매물 {property_id} 정보를 찾을 수 없음")
-                            continue
-                    
-                    response = supabase.table('maeiple_properties').update({
-                        'employee_id': employee_id,
-                        'employee_name': employee_name
-                    }).eq('id', property_id).execute()
-                    
-                    if response.data:
-                        success_count += 1
-                        print(f" 매물 {property_id} 담당자 변경 성공")
-                    else:
-                        print(f" 매물 {property_id} 담당자 변경 실패: 응답 데이터 없음")
-                except Exception as e:
-                    print(f" 매물 {property_id} 담당자 변경 오류: {e}")
+            # Supabase를 사용하여 실제 DB 업데이트 (팀장은 자기 팀 매물만 - 팀 조건을 필터로 적용)
+            logger.info("Supabase를 사용하여 일괄 담당자 변경: %s개 매물  %s", len(property_ids), employee_name)
+            result = supabase_utils.bulk_update_maeiple_properties(
+                property_ids,
+                {'employee_id': employee_id, 'employee_name': employee_name},
+                team_name=session.get('employee_team') if session.get('employee_role') == '팀장' else None
+            )
+            success_count = len(result['succeeded'])
             
-            print(f" 일괄 담당자 변경 결과: {success_count}/{len(property_ids)}개 성공")
+            for property_id, error in result['failed'].items():
+                logger.warning("매물 %s 담당자 변경 실패: %s", property_id, error)
+            logger.debug("일괄 담당자 변경 결과: %s/%s개 성공", success_count, len(property_ids))
         else:
             # Supabase 연결 실패 시 테스트 모드
-            print(f" Supabase 연결 실패 - 테스트 모드로 일괄 담당자 변경 시뮬레이션: {len(property_ids)}개 매물  {employee_name}")
+            logger.warning("Supabase 연결 실패 - 테스트 모드로 일괄 담당자 변경 시뮬레이션: %s개 매물  %s", len(property_ids), employee_name)
             return jsonify({'success': True, 'message': f'테스트 모드 - {len(property_ids)}개 매물 담당자 변경 시뮬레이션 완료'})
         
         return jsonify({
-            'success': True, 
-            'message': f'{len(property_ids)}개 매물의 담당자가 {employee_name}으로 변경되었습니다.'
+            'success': success_count > 0,
+            'message': f'{success_count}개 매물의 담당자가 {employee_name}으로 변경되었습니다.' if success_count else '변경된 매물이 없습니다. (매물을 찾을 수 없거나 권한이 없습니다.)',
+            'succeeded_ids': result['succeeded'],
+            'failed': [{'id': property_id, 'error': error} for property_id, error in result['failed'].items()]
         })
         
     except Exception as e:
-        print(f" 일괄 담당자 변경 오류: {e}")
+        logger.error("일괄 담당자 변경 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/maeiple/bulk-assign-team', methods=['POST'])
@@ -3833,36 +3258,27 @@ def maeiple_bulk_assign_team():
         supabase = supabase_utils.get_supabase()
         if supabase:
             # Supabase를 사용하여 실제 DB 업데이트
-            print(f" Supabase를 사용하여 일괄 팀 변경: {len(property_ids)}개 매물  {team_name}")
-            success_count = 0
+            logger.info("Supabase를 사용하여 일괄 팀 변경: %s개 매물  %s", len(property_ids), team_name)
+            result = supabase_utils.bulk_update_maeiple_properties(property_ids, {'employee_team': team_name})
+            success_count = len(result['succeeded'])
             
-            for property_id in property_ids:
-                try:
-                    response = supabase.table('maeiple_properties').update({
-                        'employee_team': team_name
-                    }).eq('id', property_id).execute()
-                    
-                    if response.data:
-                        success_count += 1
-                        print(f" 매물 {property_id} 팀 변경 성공")
-                    else:
-                        print(f" 매물 {property_id} 팀 변경 실패: 응답 데이터 없음")
-                except Exception as e:
-                    print(f" 매물 {property_id} 팀 변경 오류: {e}")
-            
-            print(f" 일괄 팀 변경 결과: {success_count}/{len(property_ids)}개 성공")
+            for property_id, error in result['failed'].items():
+                logger.warning("매물 %s 팀 변경 실패: %s", property_id, error)
+            logger.debug("일괄 팀 변경 결과: %s/%s개 성공", success_count, len(property_ids))
         else:
             # Supabase 연결 실패 시 테스트 모드
-            print(f" Supabase 연결 실패 - 테스트 모드로 일괄 팀 변경 시뮬레이션: {len(property_ids)}개 매물  {team_name}")
+            logger.warning("Supabase 연결 실패 - 테스트 모드로 일괄 팀 변경 시뮬레이션: %s개 매물  %s", len(property_ids), team_name)
             return jsonify({'success': True, 'message': f'테스트 모드 - {len(property_ids)}개 매물 팀 변경 시뮬레이션 완료'})
         
         return jsonify({
-            'success': True, 
-            'message': f'{len(property_ids)}개 매물의 팀이 {team_name}으로 변경되었습니다.'
+            'success': success_count > 0,
+            'message': f'{success_count}개 매물의 팀이 {team_name}으로 변경되었습니다.' if success_count else '변경된 매물이 없습니다. (매물을 찾을 수 없습니다.)',
+            'succeeded_ids': result['succeeded'],
+            'failed': [{'id': property_id, 'error': error} for property_id, error in result['failed'].items()]
         })
         
     except Exception as e:
-        print(f" 일괄 팀 변경 오류: {e}")
+        logger.error("일괄 팀 변경 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/maeiple/bulk-delete', methods=['POST'])
@@ -3882,34 +3298,27 @@ def maeiple_bulk_delete():
         supabase = supabase_utils.get_supabase()
         if supabase:
             # Supabase를 사용하여 실제 DB 삭제
-            print(f" Supabase를 사용하여 일괄 삭제: {len(property_ids)}개 매물")
-            success_count = 0
-            
-            for property_id in property_ids:
-                try:
-                    response = supabase.table('maeiple_properties').delete().eq('id', property_id).execute()
-                    
-                    if response.data:
-                        success_count += 1
-                        print(f" 매물 {property_id} 삭제 성공")
-                    else:
-                        print(f" 매물 {property_id} 삭제 실패: 응답 데이터 없음")
-                except Exception as e:
-                    print(f" 매물 {property_id} 삭제 오류: {e}")
+            logger.info("Supabase를 사용하여 일괄 삭제: %s개 매물", len(property_ids))
+            result = supabase_utils.bulk_delete_maeiple_properties(property_ids)
+            success_count = len(result['succeeded'])
             
-            print(f" 일괄 삭제 결과: {success_count}/{len(property_ids)}개 성공")
+            for property_id, error in result['failed'].items():
+                logger.warning("매물 %s 삭제 실패: %s", property_id, error)
+            logger.debug("일괄 삭제 결과: %s/%s개 성공", success_count, len(property_ids))
         else:
             # Supabase 연결 실패 시 테스트 모드
-            print(f" Supabase 연결 실패 - 테스트 모드로 일괄 삭제 시뮬레이션: {len(property_ids)}개 매물")
+            logger.warning("Supabase 연결 실패 - 테스트 모드로 일괄 삭제 시뮬레이션: %s개 매물", len(property_ids))
             return jsonify({'success': True, 'message': f'테스트 모드 - {len(property_ids)}개 매물 삭제 시뮬레이션 완료'})
         
         return jsonify({
-            'success': True, 
-            'message': f'{len(property_ids)}개 매물이 삭제되었습니다.'
+            'success': success_count > 0,
+            'message': f'{success_count}개 매물이 삭제되었습니다.' if success_count else '삭제된 매물이 없습니다. (매물을 찾을 수 없습니다.)',
+            'succeeded_ids': result['succeeded'],
+            'failed': [{'id': property_id, 'error': error} for property_id, error in result['failed'].items()]
         })
         
     except Exception as e:
-        print(f" 일괄 삭제 오류: {e}")
+        logger.error("일괄 삭제 오류: %s", e)
         return jsonify({'error': str(e)}), 500
 
 # ==================== 팀장 전용 API 라우트 ====================
@@ -3925,17 +3334,18 @@ def team_leader_team_customers():
         return jsonify({'error': '팀장만 접근 가능합니다.'}), 403
     
     # 페이지네이션 파라미터
-    page = int(request.args.get('page', 1))
-    per_page = int(request.args.get('per_page', 20))
-    offset = (page - 1) * per_page
+    try:
+        page, per_page = _page_args()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
-    # DATABASE_URL이 없으면 테스트용 샘플 데이터 반환
-    if not os.environ.get('DATABASE_URL'):
-        print(" 테스트 모드 - 팀장 팀 통합용 샘플 고객 데이터 반환")
+    # Supabase 설정이 없으면 테스트용 샘플 데이터 반환
+    if not os.environ.get('SUPABASE_URL') or not os.environ.get('SUPABASE_KEY'):
+        logger.debug("테스트 모드 - 팀장 팀 통합용 샘플 고객 데이터 반환")
         
         # 현재 팀 정보
         current_team = session.get('employee_team', '')
-        print(f" 팀장 팀 통합용 고객관리 - 팀: {current_team}")
+        logger.debug("팀장 팀 통합용 고객관리 - 팀: %s", current_team)
         
         # 팀 전체 고객 샘플 데이터 (팀장 + 팀원)
         team_customers = [
@@ -3990,7 +3400,7 @@ def team_leader_team_customers():
         
         # 페이지네이션 적용
         total_count = len(team_customers)
-        paginated_customers = team_customers[offset:offset + per_page]
+        paginated_customers = team_customers[(page - 1) * per_page:page * per_page]
         
         return jsonify({
             'customers': paginated_customers,
@@ -4001,45 +3411,27 @@ def team_leader_team_customers():
             'type': 'team'  # 팀 통합용임을 명시
         })
     
+    # 팀 전체의 고객 조회 (팀장 + 팀원)
     try:
-        supabase = supabase_utils.get_supabase()
-        if not supabase:
-            return jsonify({'error': 'Database connection failed'}), 500
-        cursor = conn.cursor()
-        
-        # 팀 전체의 고객 조회
         current_team = session.get('employee_team', '')
-        
-        # 전체 개수 조회
-        count_query = "SELECT COUNT(*) FROM employee_customers WHERE employee_team = %s"
-        cursor.execute(count_query, (current_team,))
-        total_count = cursor.fetchone()[0]
-        
-        # 팀 전체 고객 목록 조회
-        query = "SELECT * FROM employee_customers WHERE employee_team = %s ORDER BY inquiry_date DESC, id DESC LIMIT %s OFFSET %s"
-        cursor.execute(query, (current_team, per_page, offset))
-        
-        customers_raw = cursor.fetchall()
-        customers_list = [db_utils.dict_from_row(row) for row in customers_raw]
+        scope = 'all' if session.get('is_admin') and not current_team else 'team'
+        result = supabase_utils.list_rows('employee_customers', scope, current_team,
+                                          default_sort=('inquiry_date', 'desc'), page=page, per_page=per_page,
+                                          cursor=request.args.get('cursor'))
+        if result is None:
+            return jsonify({'error': 'Database connection failed'}), 500
+        payload = supabase_utils.listing_payload(result, 'customers', page, per_page, type='team')  # 팀 통합용임을 명시
         
         # employee_name 필드 추가
-        for customer in customers_list:
+        for customer in payload['customers']:
             customer['employee_name'] = customer.get('employee_id', '')
         
-        conn.close()
-        
-        return jsonify({
-            'customers': customers_list,
-            'total_count': total_count,
-            'page': page,
-            'per_page': per_page,
-            'total_pages': (total_count + per_page - 1) // per_page,
-            'type': 'team'  # 팀 통합용임을 명시
-        })
+        return jsonify(payload)
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
-        if 'conn' in locals():
-            conn.close()
+        logger.error("팀 전체 고객 조회 오류: %s", e)
         return jsonify({'error': f'팀 전체 고객 조회 실패: {e}'}), 500
 
 @app.route('/api/guarantee-list')
@@ -4061,7 +3453,7 @@ def get_guarantee_list():
         # 보증보험은 주거용 링크에서 관리되므로 residence_links 테이블 사용
         # 1달 이내 등록된 항목만 조회
         res = supabase.table('residence_links')\
-            .select('*')\
+            .select(supabase_utils.projection('residence_links', 'guarantee'))\
             .eq('guarantee_insurance', True)\
             .gte('date_added', one_month_ago)\
             .order('id', desc=True)\
@@ -4069,13 +3461,13 @@ def get_guarantee_list():
             .execute()
         return jsonify(res.data or [])
     except Exception as e:
-        print(f"보증보험 목록 조회 오류: {e}")
+        logger.error("보증보험 목록 조회 오류: %s", e)
         return jsonify({'error': f'보증보험 목록 조회 실패: {e}'}), 500
 
 @app.route('/api/db-status', methods=['GET'])
 def check_db_status():
     """데이터베이스 연결 상태 확인 API"""
-    print("=== DB 연결 상태 확인 ===")
+    logger.debug("=== DB 연결 상태 확인 ===")
     
     status_info = {
         'timestamp': datetime.now().isoformat(),
@@ -4087,7 +3479,7 @@ def check_db_status():
     env_vars = {
         'SUPABASE_URL': os.environ.get('SUPABASE_URL'),
         'SUPABASE_KEY': os.environ.get('SUPABASE_KEY'),
-        'DATABASE_URL': os.environ.get('DATABASE_URL'),
+        'DATABASE_URL': 'configured' if os.environ.get('DATABASE_URL') else None,  # 접속 비밀번호 노출 방지
         'RAILWAY_ENVIRONMENT': os.environ.get('RAILWAY_ENVIRONMENT')
     }
     
@@ -4099,35 +3491,49 @@ def check_db_status():
         if supabase_client:
             status_info['supabase_status'] = 'connected'
             status_info['supabase_url'] = str(supabase_client.supabase_url)
-            print(" Supabase 연결됨")
+            logger.debug("Supabase 연결됨")
         else:
             status_info['supabase_status'] = 'not_initialized'
-            print(" Supabase 초기화되지 않음")
+            logger.warning("Supabase 초기화되지 않음")
     except Exception as e:
         status_info['supabase_status'] = 'error'
         status_info['supabase_error'] = str(e)
-        print(f" Supabase 상태 확인 오류: {e}")
+        logger.error("Supabase 상태 확인 오류: %s", e)
+    
+    # Postgres 직접 연결(DATABASE_URL) 상태 확인
+    try:
+        if not os.environ.get('DATABASE_URL'):
+            status_info['postgres_direct_status'] = 'not_configured'
+        elif pg_pool.is_enabled():
+            pg_pool.fetch_one('SELECT 1 AS ok', label='status')
+            status_info['postgres_direct_status'] = 'connected'
+        else:
+            status_info['postgres_direct_status'] = 'unavailable'
+    except Exception as e:
+        status_info['postgres_direct_status'] = 'error'
+        status_info['postgres_direct_error'] = str(e)
+        logger.error("Postgres 직접 연결 상태 확인 오류: %s", e)
     
     # 테스트 모드 여부 확인
     if FORCE_TEST_MODE:
         status_info['current_mode'] = 'test_mode_forced'
-        print(" 테스트 모드 강제 활성화")
+        logger.debug("테스트 모드 강제 활성화")
     elif not os.environ.get('SUPABASE_URL') or not os.environ.get('SUPABASE_KEY'):
         status_info['current_mode'] = 'test_mode_no_credentials'
-        print(" 테스트 모드 - Supabase 인증 정보 없음")
+        logger.info("테스트 모드 - Supabase 인증 정보 없음")
     else:
         status_info['current_mode'] = 'production_mode'
-        print(" 프로덕션 모드 - Supabase 연결됨")
+        logger.debug("프로덕션 모드 - Supabase 연결됨")
     
     # 세션 정보 확인
     if 'test_maeiple_properties' in session:
         status_info['test_data_count'] = len(session['test_maeiple_properties'])
-        print(f" 테스트 데이터 수: {status_info['test_data_count']}개")
+        logger.debug("테스트 데이터 수: %s개", status_info['test_data_count'])
     else:
         status_info['test_data_count'] = 0
-        print(" 테스트 데이터 없음")
+        logger.debug("테스트 데이터 없음")
     
-    print(f" DB 상태 정보: {status_info}")
+    logger.debug("DB 상태 정보: %s", status_info)
     return jsonify(status_info)
 
 @app.route('/api/employee/session-info', methods=['GET'])
@@ -4144,25 +3550,25 @@ def get_employee_session_info():
             'logged_in': 'employee_id' in session or 'is_admin' in session
         }
         
-        print(f" 세션 정보 조회: {session_info}")
+        logger.debug("세션 정보 조회: %s", session_info)
         return jsonify(session_info)
         
     except Exception as e:
-        print(f" 세션 정보 조회 오류: {e}")
+        logger.error("세션 정보 조회 오류: %s", e)
         return jsonify({'error': f'세션 정보 조회 실패: {e}'}), 500
 
 if __name__ == '__main__':
     # PORT 환경변수 처리 개선
     port = int(os.environ.get('PORT', 8080))
-    print(f" 서버 시작 - 포트: {port}")
-    print(f" 환경변수 PORT: {os.environ.get('PORT', '설정되지 않음')}")
+    logger.info("서버 시작 - 포트: %s", port)
+    logger.info("환경변수 PORT: %s", os.environ.get('PORT', '설정되지 않음'))
     
     try:
         app.run(host='0.0.0.0', port=port, debug=True)
     except Exception as e:
-        print(f" 서버 시작 실패: {e}")
+        logger.warning("서버 시작 실패: %s", e)
         # 포트가 사용 중인 경우 다른 포트 시도
         if "Address already in use" in str(e):
             fallback_port = 8081
-            print(f" 포트 {port}가 사용 중입니다. 포트 {fallback_port}로 시도합니다.")
+            logger.warning("포트 %s가 사용 중입니다. 포트 %s로 시도합니다.", port, fallback_port)
             app.run(host='0.0.0.0', port=fallback_port, debug=True)
\ No newline at end of file
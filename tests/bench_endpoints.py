@@ -0,0 +1,290 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+오프라인 엔드포인트 벤치마크
+
+실제 Supabase 대신 tests/fake_postgrest.py 의 메모리 PostgREST 대역에 현실적인 양의 데이터를 넣고,
+Flask test client 로 주요 화면/API 를 반복 호출해 엔드포인트별 p50/p95 지연과 요청당 DB 호출 수를 출력합니다.
+DB 호출 한 번마다 --latency-ms (+ 0~--jitter-ms) 만큼 지연시켜 실제 네트워크 왕복을 흉내냅니다.
+
+    python tests/bench_endpoints.py
+    python tests/bench_endpoints.py --latency-ms 30 --iterations 50 --scale 2 --only maeiple
+    python tests/bench_endpoints.py --concurrency 8 --json bench_output.json
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(TESTS_DIR), 'src')
+sys.path.insert(0, SRC_DIR)
+sys.path.insert(0, TESTS_DIR)
+
+# 앱 import 전에 가짜 접속 정보 설정 (supabase-py 는 JWT 형태의 키만 허용)
+os.environ['SUPABASE_URL'] = 'http://fake-postgrest.local'
+os.environ['SUPABASE_KEY'] = 'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJyb2xlIjoiYW5vbiJ9.benchmark'
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+os.environ['ADMIN_ID'] = 'admin'
+os.environ['ADMIN_PASSWORD'] = 'bench-admin-password'
+os.environ.setdefault('SESSION_BACKEND', 'memory')
+
+from fake_postgrest import FakePostgrest
+
+TEAMS = ['빈시트', '위플러스', '반클리셰', '대표', '미지정']
+STATUSES = ['거래가능', '거래완료', '보류']
+PASSWORD = 'bench-password'
+
+def seed_tables(scale: float = 1.0, seed: int = 42) -> dict:
+    """운영 DB 규모를 흉내 낸 데이터 (scale=1: 직원 50명, 고객 3천, 매물 2만, 링크 1.5만)"""
+    rng = random.Random(seed)
+    today = datetime(2025, 6, 1)
+
+    def day(max_days):
+        return (today - timedelta(days=rng.randint(0, max_days))).strftime('%Y-%m-%d')
+
+    teams = [{'id': i + 1, 'name': name, 'description': f'{name} 팀', 'is_active': True, 'created_at': day(900)}
+             for i, name in enumerate(TEAMS)]
+
+    employees = []
+    for i in range(int(50 * scale) or 1):
+        team = TEAMS[i % (len(TEAMS) - 1)]
+        employees.append({
+            'id': i + 1,
+            'name': f'직원{i + 1:03d}',
+            'email': f'employee{i + 1}@example.com',
+            'team': team,
+            'position': '팀장' if i < len(TEAMS) - 1 else '사원',
+            'role': '팀장' if i < len(TEAMS) - 1 else '직원',
+            'status': 'active',
+            'password': PASSWORD,
+            'created_at': day(900),
+            'created_date': day(900),
+            'last_login': None,
+        })
+
+    customers = []
+    for i in range(int(3000 * scale)):
+        owner = rng.choice(employees)
+        customers.append({
+            'id': i + 1,
+            'management_site_id': f'msid{i + 1:06d}',
+            'inquiry_date': day(365),
+            'customer_name': f'고객{i + 1}',
+            'customer_phone': f'010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}',
+            'budget': rng.choice([None, 5000, 10000, 20000, 30000]),
+            'rooms': rng.choice(['원룸', '투룸', '쓰리룸']),
+            'location': rng.choice(['강남', '서초', '송파', '마포']),
+            'loan_needed': rng.choice(['', '필요', '불필요']),
+            'parking_needed': rng.choice(['', '필요']),
+            'pets': rng.choice(['', '있음']),
+            'move_in_date': day(60),
+            'memo': '메모 ' * rng.randint(0, 30),
+            'status': rng.choice(['진행중', '완료', '보류']),
+            'employee_id': owner['id'],
+            'employee_name': owner['name'],
+            'employee_team': owner['team'],
+            'created_date': (today - timedelta(minutes=rng.randint(0, 500000))).isoformat(),
+            'updated_date': (today - timedelta(minutes=rng.randint(0, 50000))).isoformat(),
+            'unchecked_likes_residence': 0,
+            'unchecked_likes_business': 0,
+        })
+
+    properties = []
+    for i in range(int(20000 * scale)):
+        owner = rng.choice(employees)
+        properties.append({
+            'id': i + 1,
+            'check_date': day(400) if rng.random() > 0.02 else None,
+            'building_number': str(rng.randint(101, 120)),
+            'room_number': str(rng.randint(101, 2505)),
+            'status': rng.choice(STATUSES),
+            'jeonse_price': rng.choice([None, 20000, 35000, 50000]),
+            'monthly_deposit': rng.choice([None, 1000, 3000]),
+            'monthly_rent': rng.choice([None, 50, 80, 120]),
+            'sale_price': rng.choice([None, 80000, 120000]),
+            'is_occupied': rng.random() < 0.3,
+            'phone': f'010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}',
+            'memo': '메모 ' * rng.randint(0, 20),
+            'likes': rng.randint(0, 5),
+            'dislikes': rng.randint(0, 2),
+            'employee_id': owner['id'],
+            'employee_name': owner['name'],
+            'employee_team': owner['team'],
+            'created_at': (today - timedelta(minutes=rng.randint(0, 500000))).isoformat(),
+            'updated_at': (today - timedelta(minutes=rng.randint(0, 50000))).isoformat(),
+        })
+
+    def links(count, with_rating):
+        rows = []
+        for i in range(int(count * scale)):
+            row = {
+                'id': i + 1,
+                'title': f'매물 링크 {i + 1}',
+                'url': f'https://example.com/{i + 1}',
+                'platform': rng.choice(['직방', '다방', '네이버']),
+                'added_by': rng.choice(employees)['name'],
+                'date_added': day(60),
+                'memo': '',
+                'guarantee_insurance': rng.random() < 0.2,
+                'liked': rng.random() < 0.3,
+                'disliked': False,
+                'is_checked': rng.random() < 0.7,
+                'management_site_id': rng.choice(customers)['management_site_id'] if customers else None,
+                'description': '',
+                'created_at': (today - timedelta(minutes=rng.randint(0, 500000))).isoformat(),
+                'updated_at': (today - timedelta(minutes=rng.randint(0, 50000))).isoformat(),
+            }
+            if with_rating:
+                row['rating'] = rng.randint(1, 5)
+            rows.append(row)
+        return rows
+
+    return {
+        'teams': teams,
+        'employees': employees,
+        'employee_customers': customers,
+        'maeiple_properties': properties,
+        'residence_links': links(10000, True),
+        'office_links': links(5000, False),
+        'guarantee_insurance_links': links(200, False),
+    }
+
+def scenarios(tables: dict) -> dict:
+    """역할별 (로그인 정보, [(이름, 경로)])"""
+    leader = next(e for e in tables['employees'] if e['role'] == '팀장')
+    member = next(e for e in tables['employees'] if e['role'] != '팀장')
+    member_customer = next((c for c in tables['employee_customers'] if c['employee_id'] == member['id']),
+                           tables['employee_customers'][0])
+    msid = member_customer['management_site_id']
+    return {
+        'admin': (('/admin-login', {'admin_id': 'admin', 'admin_password': 'bench-admin-password'}), [
+            ('admin page', '/admin'),
+            ('employees all', '/api/employees?per_page=1000'),
+            ('teams', '/api/teams'),
+            ('customers p1', '/api/customers?page=1&per_page=50'),
+            ('customers deep', '/api/customers?page=40&per_page=50'),
+            ('customers cursor', '/api/customers?cursor=&per_page=50'),
+            ('maeiple p1', '/api/maeiple?page=1&per_page=50'),
+            ('maeiple deep', '/api/maeiple?page=300&per_page=50'),
+            ('maeiple sorted', '/api/maeiple?page=1&per_page=50&sort_by=jeonse_price&sort_order=asc'),
+            ('maeiple cursor', '/api/maeiple?cursor=&per_page=50'),
+            ('guarantee list', '/api/guarantee-list'),
+            ('dashboard stats', '/api/dashboard-stats'),
+        ]),
+        'team_leader': (('/login', {'employee_id': leader['name'], 'password': PASSWORD}), [
+            ('team-leader page', '/team-leader'),
+            ('tl maeiple', '/api/team-leader/maeiple?page=1&per_page=50'),
+            ('tl customers', '/api/team-leader/customers'),
+            ('tl team-customers', '/api/team-leader/team-customers'),
+            ('tl team-maeiple', '/api/team-leader/team-maeiple'),
+            ('tl dashboard stats', '/api/dashboard-stats'),
+        ]),
+        'employee': (('/login', {'employee_id': member['name'], 'password': PASSWORD}), [
+            ('dashboard', '/dashboard'),
+            ('employee maeiple', '/api/employee/maeiple?page=1&per_page=50'),
+            ('employee customers', '/api/customers?page=1&per_page=50'),
+            ('unchecked likes', f'/api/employee/unchecked-likes?management_site_id={msid}'),
+            ('residence site', f'/residence/customer/{msid}'),
+            ('customer info', f'/api/customer_info?management_site_id={msid}'),
+            ('user info', '/api/user-info'),
+        ]),
+    }
+
+def percentile(values: list, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+_DB_CALLS = re.compile(r'db;dur=[\d.]+;desc="(\d+) calls"')
+
+def run_endpoint(app, login, path: str, iterations: int, concurrency: int) -> dict:
+    def one_client():
+        client = app.test_client()
+        login_path, payload = login
+        client.post(login_path, json=payload)
+        return client
+
+    clients = [one_client() for _ in range(max(concurrency, 1))]
+    clients[0].get(path)  # 워밍업 (템플릿 컴파일, 캐시 채우기 등)
+
+    def call(i):
+        client = clients[i % len(clients)]
+        started_at = time.perf_counter()
+        response = client.get(path)
+        elapsed = time.perf_counter() - started_at
+        match = _DB_CALLS.search(response.headers.get('Server-Timing', ''))
+        return elapsed, int(match.group(1)) if match else None, response.status_code, len(response.get_data())
+
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(call, range(iterations)))
+    else:
+        results = [call(i) for i in range(iterations)]
+
+    latencies = [r[0] * 1000 for r in results]
+    db_calls = [r[1] for r in results if r[1] is not None]
+    return {
+        'path': path,
+        'status': sorted({r[2] for r in results}),
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'mean_ms': round(statistics.mean(latencies), 2),
+        'db_calls': round(statistics.mean(db_calls), 1) if db_calls else None,
+        'bytes': results[-1][3],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='오프라인 엔드포인트 벤치마크 (메모리 PostgREST 대역 사용)')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='DB 호출당 고정 지연 (기본 20ms)')
+    parser.add_argument('--jitter-ms', type=float, default=5.0, help='DB 호출당 추가 무작위 지연 최대값 (기본 5ms)')
+    parser.add_argument('--iterations', type=int, default=30, help='엔드포인트별 요청 수 (기본 30)')
+    parser.add_argument('--concurrency', type=int, default=1, help='동시 요청 수 (기본 1)')
+    parser.add_argument('--scale', type=float, default=1.0, help='데이터 양 배수 (기본 1.0)')
+    parser.add_argument('--seed', type=int, default=42, help='데이터 생성 시드')
+    parser.add_argument('--only', default='', help='이름/경로에 이 문자열이 포함된 엔드포인트만 실행')
+    parser.add_argument('--json', dest='json_path', help='결과를 JSON 파일로 저장')
+    args = parser.parse_args()
+
+    tables = seed_tables(args.scale, args.seed)
+    fake = FakePostgrest(tables)
+    fake.install()
+
+    import 관리자페이지
+    app = 관리자페이지.app
+    fake.latency = args.latency_ms / 1000
+    fake.jitter = args.jitter_ms / 1000
+
+    print(f"데이터: " + ', '.join(f"{name} {len(rows)}" for name, rows in tables.items()))
+    print(f"DB 지연: {args.latency_ms}ms + 0~{args.jitter_ms}ms, 반복: {args.iterations}, 동시성: {args.concurrency}")
+    print()
+    print(f"{'역할':<12} {'엔드포인트':<20} {'p50(ms)':>9} {'p95(ms)':>9} {'평균(ms)':>9} {'DB호출':>7} {'응답KB':>7}  상태")
+
+    results = []
+    for role, (login, endpoints) in scenarios(tables).items():
+        for name, path in endpoints:
+            if args.only and args.only not in name and args.only not in path:
+                continue
+            result = run_endpoint(app, login, path, args.iterations, args.concurrency)
+            result.update({'role': role, 'name': name})
+            results.append(result)
+            db_calls = '-' if result['db_calls'] is None else result['db_calls']
+            print(f"{role:<12} {name:<20} {result['p50_ms']:>9} {result['p95_ms']:>9} {result['mean_ms']:>9} "
+                  f"{db_calls:>7} {result['bytes'] / 1024:>7.1f}  {result['status']}")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({'args': vars(args), 'results': results}, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json_path}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,344 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+로컬 PostgREST 대역 (벤치마크/오프라인 점검용)
+
+실제 supabase-py / postgrest-py 클라이언트가 보내는 HTTP 요청을 메모리 테이블로 처리합니다.
+supabase_utils 의 전송 계층만 바꿔 끼우므로 쿼리 빌더, 페이지네이션, 계측(Server-Timing) 코드는 그대로 실행됩니다.
+
+    fake = FakePostgrest(tables, latency=0.02)
+    fake.install()   # supabase_utils 클라이언트를 이 대역으로 다시 초기화
+
+지원 범위: select(컬럼 목록, 단순 임베드), eq/neq/gt/gte/lt/lte/like/ilike/in/is 필터와 not./or/and,
+order(nullsfirst/nullslast), limit/offset/Range, Prefer count=, insert/update/delete(return=representation),
+rpc(functions 로 등록한 함수만)
+"""
+
+import re
+import json
+import time
+import asyncio
+import random
+import threading
+from collections import Counter
+
+import httpx
+
+RESERVED_PARAMS = {'select', 'order', 'limit', 'offset', 'on_conflict', 'columns'}
+
+def _split_top_level(text: str) -> list:
+    """괄호/따옴표 밖의 쉼표로 나눕니다."""
+    parts, depth, quoted, current = [], 0, False, ''
+    for i, ch in enumerate(text):
+        if ch == '"' and (i == 0 or text[i - 1] != '\\'):
+            quoted = not quoted
+        elif not quoted and ch == '(':
+            depth += 1
+        elif not quoted and ch == ')':
+            depth -= 1
+        if ch == ',' and depth == 0 and not quoted:
+            parts.append(current)
+            current = ''
+        else:
+            current += ch
+    if current:
+        parts.append(current)
+    return parts
+
+def _unquote_value(text: str) -> str:
+    if len(text) >= 2 and text[0] == '"' and text[-1] == '"':
+        return text[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+    return text
+
+def _coerce(row_value, text: str):
+    """필터 문자열을 행 값과 비교할 수 있는 타입으로 바꿉니다."""
+    if text == 'null':
+        return None
+    if isinstance(row_value, bool):
+        return text.lower() == 'true'  # PostgreSQL 은 True/true 를 모두 받음
+    if isinstance(row_value, int):
+        try:
+            return int(text)
+        except ValueError:
+            return text
+    if isinstance(row_value, float):
+        try:
+            return float(text)
+        except ValueError:
+            return text
+    return text
+
+def _like(value, pattern: str, ignore_case: bool) -> bool:
+    if value is None:
+        return False
+    regex = '^' + re.escape(pattern).replace('\\*', '.*').replace('%', '.*') + '$'
+    return re.match(regex, str(value), re.I if ignore_case else 0) is not None
+
+def _compare(row: dict, column: str, op: str, raw: str) -> bool:
+    value = row.get(column)
+    if op == 'is':
+        return value is None if raw == 'null' else value is (raw.lower() == 'true')
+    if op == 'in':
+        items = [_unquote_value(item) for item in _split_top_level(raw.strip('()'))]
+        return value in [_coerce(value, item) for item in items]
+    if op in ('like', 'ilike'):
+        return _like(value, _unquote_value(raw), op == 'ilike')
+    target = _coerce(value, _unquote_value(raw))
+    if op == 'eq':
+        return value == target
+    if op == 'neq':
+        return value != target
+    if value is None or target is None:
+        return False
+    try:
+        if op == 'gt':
+            return value > target
+        if op == 'gte':
+            return value >= target
+        if op == 'lt':
+            return value < target
+        if op == 'lte':
+            return value <= target
+    except TypeError:
+        return str(value) > str(target) if op in ('gt', 'gte') else str(value) < str(target)
+    raise ValueError(f'지원하지 않는 연산자: {op}')
+
+def _parse_condition(expression: str):
+    """'col.op.value', 'col.not.op.value', 'and(...)', 'or(...)' 을 판별 함수로 변환합니다."""
+    negate = False
+    if expression.startswith('not.'):
+        negate, expression = True, expression[4:]
+    for group in ('and', 'or'):
+        if expression.startswith(group + '('):
+            predicate = _parse_group(group, expression[len(group) + 1:-1])
+            return (lambda row: not predicate(row)) if negate else predicate
+    column, rest = expression.split('.', 1)
+    return _parse_filter(column, rest, negate)
+
+def _parse_group(group: str, body: str):
+    predicates = [_parse_condition(part) for part in _split_top_level(body)]
+    if group == 'and':
+        return lambda row: all(p(row) for p in predicates)
+    return lambda row: any(p(row) for p in predicates)
+
+def _parse_filter(column: str, expression: str, negate: bool = False):
+    if expression.startswith('not.'):
+        negate, expression = not negate, expression[4:]
+    op, raw = expression.split('.', 1)
+    if op == 'in':
+        items = [_unquote_value(item) for item in _split_top_level(raw.strip('()'))]
+        texts = set(items)
+
+        def matches(row):
+            value = row.get(column)
+            if isinstance(value, str):
+                return value in texts
+            return value in [_coerce(value, item) for item in items]
+
+        return (lambda row: not matches(row)) if negate else matches
+    if negate:
+        return lambda row: not _compare(row, column, op, raw)
+    return lambda row: _compare(row, column, op, raw)
+
+def _sort_rows(rows: list, order: str) -> list:
+    for term in reversed(_split_top_level(order)):
+        parts = term.split('.')
+        column = parts[0]
+        descending = 'desc' in parts[1:]
+        if 'nullsfirst' in parts[1:]:
+            nulls_first = True
+        elif 'nullslast' in parts[1:]:
+            nulls_first = False
+        else:
+            nulls_first = descending  # PostgreSQL 기본값
+        present = [r for r in rows if r.get(column) is not None]
+        missing = [r for r in rows if r.get(column) is None]
+        present.sort(key=lambda r: r[column], reverse=descending)
+        rows = missing + present if nulls_first else present + missing
+    return rows
+
+class FakePostgrest:
+    """메모리 테이블 기반 PostgREST 대역. latency/jitter(초)만큼 호출마다 지연합니다."""
+
+    def __init__(self, tables: dict = None, latency: float = 0.0, jitter: float = 0.0, functions: dict = None):
+        self.tables = {name: list(rows) for name, rows in (tables or {}).items()}
+        # RPC 대역: {함수 이름: fn(tables, 인자 dict) -> JSON 값} (없는 함수는 PGRST202)
+        self.functions = dict(functions or {})
+        self.latency = latency
+        self.jitter = jitter
+        self.calls = Counter()
+        self._next_ids = {name: max([r.get('id') or 0 for r in rows] or [0]) + 1 for name, rows in self.tables.items()}
+        # 테이블별 컬럼 (시드 행의 키 합집합) - 없는 컬럼을 select 하면 PostgREST 처럼 42703 오류
+        self.columns = {name: {key for row in rows for key in row} for name, rows in self.tables.items()}
+        self._lock = threading.Lock()
+
+    # ---------- 연결 ----------
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """비동기 클라이언트용 (지연 동안 이벤트 루프를 막지 않아 동시 실행이 그대로 드러남)"""
+        return httpx.MockTransport(self.handle_async)
+
+    def install(self):
+        """supabase_utils / supabase_async 의 전송 계층을 이 대역으로 바꾸고 클라이언트를 다시 초기화합니다."""
+        import supabase_utils
+        import supabase_async
+        supabase_utils._build_transport = self.transport
+        supabase_async._build_async_transport = self.async_transport
+        supabase_async._client = None
+        supabase_utils.init_supabase()
+        return self
+
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    # ---------- 요청 처리 ----------
+
+    def _delay(self) -> float:
+        return self.latency + random.uniform(0, self.jitter) if (self.latency or self.jitter) else 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        delay = self._delay()
+        if delay:
+            time.sleep(delay)
+        return self._process(request)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        delay = self._delay()
+        if delay:
+            await asyncio.sleep(delay)
+        await request.aread()
+        return self._process(request)
+
+    def _process(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.rstrip('/')
+        table = path.rsplit('/', 1)[-1]
+        with self._lock:
+            self.calls[(request.method, table)] += 1
+        if '/rpc/' in path:
+            if table not in self.functions:
+                return self._error(404, 'PGRST202', f'함수를 찾을 수 없습니다: {table}')
+            args = json.loads(request.content or b'{}')
+            with self._lock:
+                return httpx.Response(200, json=self.functions[table](self.tables, args))
+        if table not in self.tables:
+            return self._error(404, '42P01', f'relation "{table}" does not exist')
+
+        params = list(request.url.params.multi_items())
+        prefer = request.headers.get('prefer', '')
+        with self._lock:
+            if request.method in ('GET', 'HEAD'):
+                return self._select(request, table, params, prefer)
+            if request.method == 'POST':
+                return self._insert(request, table, prefer)
+            if request.method == 'PATCH':
+                return self._update(request, table, params, prefer)
+            if request.method == 'DELETE':
+                return self._delete(table, params, prefer)
+        return self._error(405, 'PGRST000', f'지원하지 않는 메서드: {request.method}')
+
+    def _error(self, status: int, code: str, message: str) -> httpx.Response:
+        return httpx.Response(status, json={'code': code, 'message': message, 'details': None, 'hint': None})
+
+    def _matching(self, table: str, params: list) -> list:
+        predicates = []
+        for key, value in params:
+            if key in RESERVED_PARAMS:
+                continue
+            if key in ('or', 'and', 'not.or', 'not.and'):
+                predicates.append(_parse_condition(f'{key}{value}'))
+            else:
+                predicates.append(_parse_filter(key, value))
+        return [row for row in self.tables[table] if all(p(row) for p in predicates)]
+
+    def _project(self, rows: list, select: str) -> list:
+        columns = _split_top_level(select.replace(' ', '')) if select else ['*']
+        projected = []
+        for row in rows:
+            item = {}
+            for column in columns:
+                if column == '*':
+                    item.update(row)
+                elif '(' in column:
+                    # 임베드: employees!inner(team) → employee_id 로 연결된 행
+                    name, inner = column[:-1].split('(', 1)
+                    relation = name.split('!')[0].split(':')[-1]
+                    foreign_key = relation[:-1] + '_id' if relation.endswith('s') else relation + '_id'
+                    related = next((r for r in self.tables.get(relation, []) if r.get('id') == row.get(foreign_key)), None)
+                    item[relation] = self._project([related], inner)[0] if related else None
+                else:
+                    alias, _, source = column.partition(':')
+                    item[alias] = row.get(source or alias)
+            projected.append(item)
+        return projected
+
+    def _unknown_column(self, table: str, select: str):
+        known = self.columns.get(table)
+        if not known:
+            return None
+        for column in _split_top_level(select.replace(' ', '')):
+            if column == '*' or '(' in column:
+                continue
+            alias, _, source = column.partition(':')
+            if (source or alias) not in known:
+                return source or alias
+        return None
+
+    def _select(self, request, table: str, params: list, prefer: str) -> httpx.Response:
+        query = dict(params)
+        unknown = self._unknown_column(table, query.get('select', '*'))
+        if unknown:
+            return self._error(400, '42703', f'column {table}.{unknown} does not exist')
+        rows = self._matching(table, params)
+        if 'order' in query:
+            rows = _sort_rows(rows, query['order'])
+        total = len(rows)
+
+        offset = int(query.get('offset', 0))
+        limit = int(query['limit']) if 'limit' in query else None
+        range_header = request.headers.get('range')
+        if range_header and re.fullmatch(r'\d+-\d*', range_header):
+            start, end = range_header.split('-')
+            offset = int(start)
+            limit = int(end) - offset + 1 if end else None
+        page = rows[offset:offset + limit] if limit is not None else rows[offset:]
+
+        count = total if 'count=' in prefer else '*'
+        content_range = f'{offset}-{offset + len(page) - 1}/{count}' if page else f'*/{count}'
+        body = self._project(page, query.get('select', '*'))
+
+        if 'vnd.pgrst.object' in request.headers.get('accept', ''):
+            if len(body) != 1:
+                return self._error(406, 'PGRST116', f'결과가 1개가 아닙니다: {len(body)}개')
+            body = body[0]
+        return httpx.Response(200, json=body, headers={'Content-Range': content_range})
+
+    def _insert(self, request, table: str, prefer: str) -> httpx.Response:
+        payload = json.loads(request.content or b'[]')
+        records = payload if isinstance(payload, list) else [payload]
+        created = []
+        for record in records:
+            row = dict(record)
+            if row.get('id') is None:
+                row['id'] = self._next_ids.get(table, 1)
+            self._next_ids[table] = max(self._next_ids.get(table, 1), row['id'] + 1)
+            self.tables[table].append(row)
+            self.columns.setdefault(table, set()).update(row)
+            created.append(dict(row))
+        return httpx.Response(201, json=created if 'return=representation' in prefer else [])
+
+    def _update(self, request, table: str, params: list, prefer: str) -> httpx.Response:
+        changes = json.loads(request.content or b'{}')
+        updated = []
+        for row in self._matching(table, params):
+            row.update(changes)
+            updated.append(dict(row))
+        return httpx.Response(200, json=updated if 'return=representation' in prefer else [])
+
+    def _delete(self, table: str, params: list, prefer: str) -> httpx.Response:
+        removed = self._matching(table, params)
+        removed_ids = {id(row) for row in removed}
+        self.tables[table] = [row for row in self.tables[table] if id(row) not in removed_ids]
+        return httpx.Response(200, json=[dict(r) for r in removed] if 'return=representation' in prefer else [])
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import requests
+
+BASE_URL = "http://127.0.0.1:8080"
+
+def collect_by_cursor(session, url, key, params):
+    """cursor= 로 마지막 페이지까지 따라가며 id 목록을 모읍니다."""
+    ids = []
+    cursor = ''
+    while True:
+        response = session.get(url, params={**params, 'cursor': cursor})
+        data = response.json()
+        ids.extend(item['id'] for item in data.get(key, []))
+        if not data.get('has_more'):
+            return ids
+        cursor = data['next_cursor']
+
+def collect_by_page(session, url, key, params):
+    """page= 로 모든 페이지를 조회해 id 목록을 모읍니다."""
+    ids = []
+    page = 1
+    while True:
+        data = session.get(url, params={**params, 'page': page}).json()
+        ids.extend(item['id'] for item in data.get(key, []))
+        if page >= data.get('total_pages', 0):
+            return ids
+        page += 1
+
+def test_cursor_pagination():
+    """커서 페이지네이션 결과가 기존 page 방식과 같은 순서/개수인지 확인"""
+    session = requests.Session()
+    headers = {'Content-Type': 'application/json'}
+
+    print('1. 관리자 로그인 시도...')
+    login_response = session.post(f'{BASE_URL}/admin-login', headers=headers, json={'admin_id': 'admin', 'admin_password': 'change-this-password'})  # 테스트용 데이터
+    print(f'   상태 코드: {login_response.status_code}')
+
+    cases = [
+        ('/api/maeiple', 'properties', {'per_page': 20, 'sort_by': 'id', 'sort_order': 'asc'}),
+        ('/api/maeiple', 'properties', {'per_page': 20, 'sort_by': 'check_date', 'sort_order': 'desc'}),
+        ('/api/customers', 'customers', {'per_page': 20}),
+    ]
+
+    for i, (path, key, params) in enumerate(cases, start=2):
+        print(f'{i}. {path} {params}')
+        by_cursor = collect_by_cursor(session, f'{BASE_URL}{path}', key, params)
+        by_page = collect_by_page(session, f'{BASE_URL}{path}', key, params)
+        print(f'   커서: {len(by_cursor)}개, 페이지: {len(by_page)}개')
+        if sorted(by_cursor) == sorted(by_page) and len(set(by_cursor)) == len(by_cursor):
+            print('   ✅ 중복/누락 없이 일치합니다.')
+        else:
+            print('   ❌ 결과가 다릅니다.')
+
+    print('잘못된 커서 확인...')
+    bad_response = session.get(f'{BASE_URL}/api/maeiple', params={'cursor': 'invalid'})
+    print(f'   상태 코드: {bad_response.status_code} (400 기대)')
+
+if __name__ == '__main__':
+    test_cursor_pagination()
@@ -67,5 +67,36 @@ def test_employee_operations():
         import traceback
         traceback.print_exc()
 
+def test_add_employee_response_hides_password():
+    """직원 추가(POST /api/employees) 응답에 비밀번호 해시가 없는지 확인"""
+    supabase = supabase_utils.get_supabase()
+    if not supabase:
+        print("❌ Supabase 연결 실패")
+        return
+    
+    import 관리자페이지
+    client = 관리자페이지.app.test_client()
+    with client.session_transaction() as sess:
+        sess['is_admin'] = True
+    
+    print("\n📝 직원 추가 응답 테스트...")
+    test_name = '비밀번호노출테스트직원'
+    try:
+        response = client.post('/api/employees', json={'employee_name': test_name, 'password': 'test1234'})
+        result = response.get_json()
+        employee = result.get('employee') or {}
+        
+        if not result.get('success'):
+            print(f"❌ 직원 추가 실패: {result.get('message')}")
+        elif 'password' in employee:
+            print("❌ 응답에 password 필드가 포함되어 있습니다.")
+        else:
+            print(f"✅ 응답에 password 필드 없음 (ID: {employee.get('id')})")
+    finally:
+        # 테스트 직원 정리
+        supabase.table('employees').delete().eq('name', test_name).execute()
+        print(f"↩️ 테스트 직원 삭제: {test_name}")
+
 if __name__ == "__main__":
-    test_employee_operations()
\ No newline at end of file
+    test_employee_operations()
+    test_add_employee_response_hides_password()
\ No newline at end of file
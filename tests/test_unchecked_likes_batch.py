@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import requests
+
+BASE_URL = "http://127.0.0.1:8080"
+
+def test_unchecked_likes_batch():
+    """미확인 좋아요 일괄 조회 API가 개별 조회 API와 같은 값을 돌려주는지 확인"""
+    session = requests.Session()
+    headers = {'Content-Type': 'application/json'}
+
+    print('1. 직원 로그인 시도...')
+    login_data = {'employee_id': 'test_employee', 'password': 'test_password'}  # 테스트용 데이터
+    login_response = session.post(f'{BASE_URL}/login', headers=headers, json=login_data)
+    if login_response.status_code != 200 or not login_response.json().get('success'):
+        print(f'❌ 로그인 실패: {login_response.text}')
+        return
+
+    print('2. 고객 목록 조회...')
+    customers_response = session.get(f'{BASE_URL}/api/customers')
+    customers = customers_response.json().get('customers', [])
+    site_ids = [c['management_site_id'] for c in customers if c.get('management_site_id')]
+    print(f'   management_site_id {len(site_ids)}개')
+
+    print('3. 일괄 조회 API 호출...')
+    batch_response = session.post(f'{BASE_URL}/api/employee/unchecked-likes/batch', headers=headers, json={'management_site_ids': site_ids})
+    print(f'   상태 코드: {batch_response.status_code}')
+    if batch_response.status_code != 200:
+        print(f'   ❌ 오류 응답: {batch_response.text}')
+        return
+    counts = batch_response.json().get('counts', {})
+
+    print('4. 개별 조회 API와 비교...')
+    mismatches = 0
+    for site_id in site_ids:
+        for link_type in ['residence', 'business']:
+            single = session.get(f'{BASE_URL}/api/employee/unchecked-likes', params={'management_site_id': site_id, 'type': link_type}).json()
+            batch_count = counts.get(site_id, {}).get(link_type, 0)
+            if single.get('count', 0) != batch_count:
+                mismatches += 1
+                print(f'   ❌ {site_id} ({link_type}): 개별={single.get("count")}, 일괄={batch_count}')
+
+    if mismatches == 0:
+        print('✅ 일괄 조회 결과가 개별 조회와 모두 일치합니다.')
+    else:
+        print(f'❌ 불일치 {mismatches}건')
+
+    print('5. 잘못된 요청 확인...')
+    bad_response = session.post(f'{BASE_URL}/api/employee/unchecked-likes/batch', headers=headers, json={'management_site_ids': 'abc'})
+    print(f'   상태 코드: {bad_response.status_code} (400 기대)')
+
+if __name__ == '__main__':
+    test_unchecked_likes_batch()